@@ -0,0 +1,62 @@
+"""Benchmark bulk attribute queries against querying per node
+
+Runs against the call-counting stand-in for `maya.cmds`, so it
+measures the amount of round-trips through the command layer of the
+`maya.cmds` code path. Inside of Maya the values are read through the
+API instead, which doesn't go through the command layer at all.
+
+Usage:
+    $ python benchmarks/bench_attributes.py
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.lib import get_attributes
+from pyblish_magenta.tests.mock_cmds import MockCmds, mocked
+
+ATTRIBUTES = ["castsShadows", "receiveShadows", "motionBlur",
+              "primaryVisibility", "smoothShading", "visibleInReflections",
+              "visibleInRefractions", "doubleSided", "opposite"]
+
+
+def per_node(cmds, nodes, attributes):
+    for node in nodes:
+        for attr in attributes:
+            if cmds.attributeQuery(attr, node=node, exists=True):
+                cmds.getAttr("{0}.{1}".format(node, attr))
+
+
+def bulk(cmds, nodes, attributes):
+    with mocked(cmds):
+        get_attributes(nodes, attributes)
+
+
+def main():
+    print("%8s %12s %12s %10s %10s" % ("nodes", "calls/node", "calls/bulk",
+                                       "s/node", "s/bulk"))
+    for count in (100, 1000, 10000):
+        cmds = MockCmds()
+        for i in range(count // 2):
+            cmds.create("|mesh%i_GEO" % i, "transform")
+            cmds.create_mesh("|mesh%i_GEO|mesh%i_GEOShape" % (i, i))
+        nodes = list(cmds.nodes)
+
+        results = list()
+        for func in (per_node, bulk):
+            cmds.reset()
+            start = time.time()
+            func(cmds, nodes, ATTRIBUTES)
+            results.append((cmds.total(), time.time() - start))
+
+        print("%8i %12i %12i %10.3f %10.3f" % (
+            count, results[0][0], results[1][0],
+            results[0][1], results[1][1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark counting compacted component lists
+
+Compares the former `len_flattened` of the mesh validators, which ran
+an uncompiled regular expression per component, against
+`pyblish_magenta.lib.components` on synthetic lists of components.
+
+Usage:
+    $ python benchmarks/bench_components.py
+
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.lib import components
+
+
+def len_flattened(components):
+    """The former implementation in the mesh validators"""
+    assert isinstance(components, (list, tuple))
+    n = 0
+    for c in components:
+        match = re.search(r"\[([0-9]+):([0-9]+)\]", c)
+        if match:
+            start, end = match.groups()
+            n += int(end) - int(start) + 1
+        else:
+            n += 1
+    return n
+
+
+def generate_components(count):
+    """Return `count` alternating ranges and single vertices"""
+    result = list()
+    index = 0
+    for i in range(count):
+        if i % 2:
+            result.append("|ben_GRP|ben_GEO.vtx[%i]" % index)
+            index += 2
+        else:
+            result.append("|ben_GRP|ben_GEO.vtx[%i:%i]" % (index, index + 5))
+            index += 7
+    return result
+
+
+def timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def main():
+    print("%10s %14s %12s %12s %12s" % ("ranges", "s/flattened",
+                                        "s/count", "s/indices",
+                                        "s/difference"))
+
+    for count in (10000, 100000, 1000000):
+        listed = generate_components(count)
+        assert len_flattened(listed) == components.count(listed)
+
+        indices = components.indices(listed)
+        everything = components.IntervalSet([(0, max(indices.ranges())[1])])
+
+        print("%10i %14.3f %12.3f %12.3f %12.3f" % (
+            count,
+            timed(len_flattened, listed),
+            timed(components.count, listed),
+            timed(components.indices, listed),
+            timed(everything.difference, indices)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark searching a hierarchy for tagged directories
+
+Compares traversing the hierarchy for each query against answering it
+from the index built by `cquery.index.build()`, both when the index was
+revalidated recently and when it revalidates on the query.
+
+Usage:
+    $ python benchmarks/bench_cquery.py 10000 100000
+
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.vendor.cquery import index, lib as cquery
+
+# Directories per level, the hierarchy being three levels deep
+BRANCHES = 20
+
+
+def generate(count):
+    """Return hierarchy of `count` directories, every 10th tagged"""
+    root = _generate(count)
+
+    # Like an existing project, not modified in the last few seconds
+    past = time.time() - 60
+    for base, _, _ in os.walk(root):
+        os.utime(base, (past, past))
+
+    return root
+
+
+def _generate(count):
+    root = tempfile.mkdtemp()
+    created = 0
+    for a in range(count // BRANCHES ** 2 + 1):
+        for b in range(BRANCHES):
+            for c in range(BRANCHES):
+                if created >= count:
+                    return root
+
+                path = os.path.join(root, "seq%i" % a, "shot%i" % b,
+                                    "task%i" % c)
+                os.makedirs(path)
+                if created % 10 == 0:
+                    cquery.tag(path, ".Task")
+                created += 1
+    return root
+
+
+def timed(function):
+    start = time.time()
+    result = function()
+    return time.time() - start, result
+
+
+def main(counts):
+    print("%10s %10s %10s %12s %14s" % ("dirs", "s/walk", "s/build",
+                                        "s/indexed", "s/revalidated"))
+
+    for count in counts:
+        root = generate(count)
+        try:
+            walk, expected = timed(
+                lambda: sorted(cquery.matches(root, ".Task")))
+            build, _ = timed(lambda: index.build(root))
+            indexed, found = timed(
+                lambda: sorted(cquery.matches(root, ".Task")))
+            assert found == expected
+
+            index.MAX_AGE = 0
+            try:
+                revalidated, found = timed(
+                    lambda: sorted(cquery.matches(root, ".Task")))
+            finally:
+                index.MAX_AGE = 60
+            assert found == expected
+
+            print("%10i %10.3f %10.3f %12.4f %14.3f" % (
+                count, walk, build, indexed, revalidated))
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main([int(count) for count in sys.argv[1:]] or [10000, 50000])
@@ -0,0 +1,88 @@
+"""Benchmark expanding instance members to their full hierarchy
+
+Compares the former `get_upstream_hierarchy_fast` of `CollectInstances`,
+which checked for visited parents in a list, against the set-based
+`pyblish_magenta.lib.hierarchy` functions on synthetic DAG paths.
+
+Usage:
+    $ python benchmarks/bench_hierarchy.py
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.lib import hierarchy
+
+# The list based lookup is quadratic, skip it for larger scenes
+MAX_LIST_BASED = 10000
+
+
+def get_upstream_hierarchy_fast(nodes):
+    """The former implementation in `CollectInstances`"""
+    parents = []
+
+    for node in nodes:
+        hierarchy = node.split("|")
+        num = len(hierarchy)
+        for x in range(1, num-1):
+            parent = "|".join(hierarchy[:num-x])
+            if parent in parents:
+                break
+            else:
+                parents.append(parent)
+
+    return parents
+
+
+def generate_paths(count, branches=4):
+    """Return `count` paths of a tree with `branches` children per node"""
+    paths = ["|root_GRP"]
+    i = 0
+    while len(paths) < count:
+        parent = paths[i]
+        for branch in range(branches):
+            paths.append("%s|node%i_%i" % (parent, i, branch))
+        i += 1
+    return paths[:count]
+
+
+def timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def main():
+    print("%10s %12s %12s %12s %12s" % ("paths", "s/list", "s/ancestors",
+                                        "s/index", "s/expand"))
+
+    for count in (10000, 100000, 1000000):
+        paths = generate_paths(count)
+
+        # The members of the instance are the leaves of the tree
+        members = paths[len(paths) // 2:]
+
+        if count <= MAX_LIST_BASED:
+            list_based = "%12.3f" % timed(get_upstream_hierarchy_fast,
+                                          members)
+        else:
+            list_based = "%12s" % "skipped"
+
+        ancestors = timed(hierarchy.get_ancestors, members)
+
+        start = time.time()
+        index = hierarchy.DagIndex(paths)
+        indexing = time.time() - start
+
+        expanding = timed(index.expand, members)
+
+        print("%10i %s %12.3f %12.3f %12.3f" % (
+            count, list_based, ancestors, indexing, expanding))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark checking internal point offsets of a mesh
+
+Compares `ValidateMeshNonZeroVertices.is_invalid()` querying and checking
+the points one by one against bulk mode, which reads all points in one
+query and checks them as a flat array. The queries run against the
+stand-in for `maya.cmds`, so only its overhead per call is measured.
+
+Usage:
+    $ python benchmarks/bench_internal_points.py
+
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.lib import arrays
+from pyblish_magenta.tests.mock_cmds import MockCmds
+
+TOLERANCE = 1e-8
+
+
+def per_point(cmds, mesh):
+    num_pts = cmds.getAttr("{0}.pnts".format(mesh), size=True)
+    for i in range(num_pts):
+        point = cmds.getAttr("{0}.pnts[{1}]".format(mesh, i))[0]
+        if any(abs(v) > TOLERANCE for v in point):
+            return True
+    return False
+
+
+def bulk(cmds, mesh):
+    num_pts = cmds.getAttr("{0}.pnts".format(mesh), size=True)
+    points = cmds.getAttr("{0}.pnts[0:{1}]".format(mesh, num_pts - 1))
+    return arrays.max_abs(arrays.flatten(points)) > TOLERANCE
+
+
+def main():
+    print("NumPy: %s" % ("yes" if arrays.numpy is not None else "no"))
+    print("%10s %12s %12s %10s %10s" % ("points", "calls/point",
+                                        "calls/bulk", "s/point", "s/bulk"))
+
+    for count in (10000, 100000, 1000000):
+        # The worst case for the per point check: all points are valid
+        points = [(0.0, 0.0, 0.0)] * count
+        points[random.randint(0, count - 1)] = (0.0, 1e-9, 0.0)
+
+        cmds = MockCmds()
+        cmds.create_mesh("|mesh", pnts=points)
+
+        results = list()
+        for func in (per_point, bulk):
+            cmds.reset()
+            start = time.time()
+            assert not func(cmds, "|mesh")
+            results.append((cmds.total(), time.time() - start))
+
+        print("%10i %12i %12i %10.3f %10.3f" % (
+            count, results[0][0], results[1][0],
+            results[0][1], results[1][1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark validating and repairing render stats
+
+Compares the former `ValidateShapeRenderStats`, which queried each stat
+of each shape on validation and all of them again on repair, against
+validating through `get_diff()` and repairing from the stored diff.
+Runs against the call-counting stand-in for `maya.cmds`.
+
+Usage:
+    $ python benchmarks/bench_render_stats.py
+
+"""
+
+import os
+import sys
+import time
+import runpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pyblish.api
+
+from pyblish_magenta import lib
+from pyblish_magenta.tests.mock_cmds import MockCmds, mocked
+
+PLUGIN = os.path.join(lib.PLUGINS_PATH, "workflow", "maya",
+                      "validate_shape_render_stats.py")
+
+
+def former(cmds, instance, defaults):
+    """The former validation followed by its repair"""
+
+    def get_invalid():
+        shapes = cmds.ls(instance, long=True, type="surfaceShape")
+        invalid = []
+        for shape in shapes:
+            for attr, required in defaults.items():
+                if cmds.attributeQuery(attr, node=shape, exists=True):
+                    value = cmds.getAttr("{0}.{1}".format(shape, attr))
+                    if value != required:
+                        invalid.append(shape)
+        return invalid
+
+    if not get_invalid():
+        return
+
+    for shape in get_invalid():
+        for attr, default in defaults.items():
+            if cmds.attributeQuery(attr, node=shape, exists=True):
+                plug = "{0}.{1}".format(shape, attr)
+                if cmds.getAttr(plug) != default:
+                    cmds.setAttr(plug, default)
+
+
+def current(plugin, instance):
+    """Validation storing the diff, followed by the repair using it"""
+    try:
+        plugin().process(instance)
+    except ValueError:
+        plugin.repair(instance)
+
+
+def generate_scene(count, changed=0.1):
+    """Return scene of `count` meshes of which a fraction is `changed`"""
+    cmds = MockCmds()
+    for i in range(count):
+        cmds.create("|mesh%i_GEO" % i, "transform")
+        shape = cmds.create_mesh("|mesh%i_GEO|mesh%i_GEOShape" % (i, i))
+        if i < count * changed:
+            shape.attrs.update(castsShadows=False, doubleSided=False)
+    return cmds
+
+
+def main():
+    os.environ["PYBLISH_MAGENTA_INCREMENTAL"] = "0"
+
+    print("%10s %14s %14s %10s %10s" % ("shapes", "calls/former",
+                                        "calls/diff", "s/former", "s/diff"))
+
+    for count in (100, 1000, 10000):
+        results = list()
+        for name in ("former", "current"):
+            cmds = generate_scene(count)
+            context = pyblish.api.Context()
+            instance = context.create_instance("ben")
+            instance[:] = list(cmds.nodes)
+
+            with mocked(cmds):
+                plugin = runpy.run_path(PLUGIN)["ValidateShapeRenderStats"]
+                cmds.reset()
+
+                start = time.time()
+                if name == "former":
+                    former(cmds, instance, plugin.defaults)
+                else:
+                    current(plugin, instance)
+                duration = time.time() - start
+
+                assert not plugin.get_diff(instance)
+
+            results.append((cmds.total(), duration))
+
+        print("%10i %14i %14i %10.3f %10.3f" % (
+            count, results[0][0], results[1][0],
+            results[0][1], results[1][1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark looking up errors of instances in the results of a publish
+
+Compares scanning the full list of results per integrated instance, as
+`Integrator` and the actions did, against `pyblish_magenta.results`
+on synthetic results of 45 plug-ins processing every instance.
+
+Usage:
+    $ python benchmarks/bench_results.py
+
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pyblish.api
+
+from pyblish_magenta import results
+
+PLUGINS = 45
+
+
+def get_errored_instances(context):
+    """The former lookup of `Integrator` and the actions"""
+    instances = list()
+    for result in context.data["results"]:
+        if result["instance"] is None:
+            continue
+
+        if result["error"]:
+            instances.append(result["instance"])
+
+    return instances
+
+
+def generate_context(count):
+    """Return context of `count` instances, every tenth with an error"""
+    context = pyblish.api.Context()
+    context.data["results"] = list()
+
+    instances = [context.create_instance("instance%i" % i)
+                 for i in range(count)]
+
+    for plugin in range(PLUGINS):
+        for i, instance in enumerate(instances):
+            error = plugin == 0 and i % 10 == 0
+            context.data["results"].append({
+                "plugin": plugin,
+                "instance": instance,
+                "error": ValueError() if error else None,
+            })
+
+    return context, instances
+
+
+def scan(context, instances):
+    for instance in instances:
+        any(errored is instance
+            for errored in get_errored_instances(context))
+
+
+def lookup(context, instances):
+    for instance in instances:
+        results.get(context).has_error(instance)
+
+
+def timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def main():
+    print("%10s %10s %12s %12s" % ("instances", "results",
+                                   "s/scan", "s/index"))
+
+    for count in (10, 100, 1000):
+        context, instances = generate_context(count)
+        print("%10i %10i %12.3f %12.3f" % (
+            count, len(context.data["results"]),
+            timed(scan, context, instances),
+            timed(lookup, context, instances)))
+
+
+if __name__ == "__main__":
+    main()
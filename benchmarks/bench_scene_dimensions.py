@@ -0,0 +1,99 @@
+"""Benchmark checking the world bounds of a large layout
+
+Compares checking the bounds of every transform with a shape, as the
+former `ValidateSceneDimensions` did, against `bounds.iter_exceeding()`
+which skips the children of groups within limits. Bounds are served from
+a precomputed table, so the amount of queries is what's measured.
+
+Usage:
+    $ python benchmarks/bench_scene_dimensions.py
+
+"""
+
+import os
+import sys
+import time
+import collections
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.lib import bounds
+from pyblish_magenta.tests.mock_cmds import mocked
+
+FAR = 1e5
+
+
+class BoundsCmds(object):
+    """Stand-in for `maya.cmds` serving precomputed world bounds"""
+
+    def __init__(self, table):
+        self.table = table
+        self.calls = collections.Counter()
+
+    def xform(self, node, **kwargs):
+        self.calls["xform"] += 1
+        return self.table[node]
+
+
+def generate_layout(groups, per_group, far=1):
+    """Return bounds of transforms in `groups` of `per_group` each
+
+    The first `far` transforms are placed beyond limits.
+
+    """
+
+    table = dict()
+    transforms = list()
+    for g in range(groups):
+        group = "|set%i_GRP" % g
+        box = [float(g), 0.0, 0.0, float(g) + 1, 1.0, 1.0]
+        for t in range(per_group):
+            transform = "%s|prop%i_GEO" % (group, t)
+            child = list(box)
+            if len(transforms) < far:
+                child[3] = FAR * 2
+            table[transform] = child
+            transforms.append(transform)
+
+            # Groups span all of their children
+            group_box = table.setdefault(group, list(child))
+            table[group] = (
+                [min(a, b) for a, b in zip(group_box[:3], child[:3])] +
+                [max(a, b) for a, b in zip(group_box[3:], child[3:])])
+
+    return table, transforms
+
+
+def flat(transforms):
+    return [node for node in transforms
+            if any(abs(x) > FAR for x in bounds.get_world_bounds([node])[0])]
+
+
+def hierarchical(transforms):
+    return list(bounds.iter_exceeding(transforms, FAR))
+
+
+def main():
+    print("%10s %12s %12s %10s %10s" % ("nodes", "queries/flat",
+                                        "queries/tree", "s/flat", "s/tree"))
+
+    for groups, per_group in ((100, 100), (1000, 100)):
+        table, transforms = generate_layout(groups, per_group)
+
+        results = list()
+        for func in (flat, hierarchical):
+            cmds = BoundsCmds(table)
+            with mocked(cmds):
+                start = time.time()
+                invalid = func(transforms)
+                results.append((invalid, cmds.calls["xform"],
+                                time.time() - start))
+
+        assert sorted(results[0][0]) == sorted(results[1][0])
+        print("%10i %12i %12i %10.3f %10.3f" % (
+            len(table), results[0][1], results[1][1],
+            results[0][2], results[1][2]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark integrating large files
+
+Compares copying a file and reading it back to checksum it, as our
+integrators did, against checksumming whilst copying through
+`transfer.copy()`, and against copying by the kernel without checksum.
+Files are random and synthetic, sizes in megabytes are given as
+arguments.
+
+Usage:
+    $ python benchmarks/bench_transfer.py 64 256 1024
+
+Note:
+    Files recently written are likely read from the file system cache,
+    measuring the throughput of memory rather than disk.
+
+"""
+
+import os
+import sys
+import time
+import shutil
+import hashlib
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta import transfer
+
+
+def former(src, dst):
+    """Copy, then read the copy back to checksum it"""
+    shutil.copy2(src, dst)
+
+    digest = hashlib.sha256()
+    with open(dst, "rb") as f:
+        for chunk in iter(lambda: f.read(transfer.CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def streaming(src, dst):
+    return transfer.copy(src, dst)
+
+
+def kernel(src, dst):
+    return transfer.copy(src, dst, algorithm=None)
+
+
+def generate(path, size):
+    """Write `size` bytes of random data to `path`"""
+    block = os.urandom(transfer.CHUNK_SIZE)
+    with open(path, "wb") as f:
+        for _ in range(size // len(block)):
+            f.write(block)
+
+
+def main(sizes):
+    directory = tempfile.mkdtemp()
+
+    print("%8s %12s %12s %12s" % ("MB", "MB/s former",
+                                  "MB/s stream", "MB/s kernel"))
+    try:
+        for megabytes in sizes:
+            src = os.path.join(directory, "src.bin")
+            generate(src, megabytes * 1024 ** 2)
+
+            throughput = list()
+            digests = set()
+            for function in (former, streaming, kernel):
+                dst = os.path.join(directory, function.__name__ + ".bin")
+
+                start = time.time()
+                digest = function(src, dst)
+                duration = time.time() - start
+
+                throughput.append(megabytes / max(duration, 1e-9))
+                if digest is not None:
+                    digests.add(digest)
+                os.remove(dst)
+
+            assert len(digests) == 1, digests
+            print("%8i %12.1f %12.1f %12.1f" % ((megabytes,) +
+                                                tuple(throughput)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [64, 256])
@@ -0,0 +1,70 @@
+"""Benchmark checking local matrices of transforms against identity
+
+Compares the former check of `ValidateTransformZero`, comparing the 16
+values of each matrix in a generator, against `arrays.rows_differing()`
+checking all matrices at once on synthetic matrices.
+
+Usage:
+    $ python benchmarks/bench_transform_zero.py
+
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta.lib import arrays
+
+IDENTITY = [1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0]
+TOLERANCE = 1e-30
+
+
+def per_matrix(matrices):
+    """The former implementation in the validator"""
+    return [i for i, mat in enumerate(matrices)
+            if not all(abs(x - y) < TOLERANCE
+                       for x, y in zip(IDENTITY, mat))]
+
+
+def bulk(matrices):
+    return arrays.rows_differing(matrices, IDENTITY, TOLERANCE)
+
+
+def generate_matrices(count, moved=0.01):
+    """Return `count` matrices of which a fraction `moved` is translated"""
+    matrices = list()
+    for _ in range(count):
+        matrix = list(IDENTITY)
+        if random.random() < moved:
+            matrix[12] = random.uniform(-10, 10)
+        matrices.append(matrix)
+    return matrices
+
+
+def main():
+    print("NumPy: %s" % ("yes" if arrays.numpy is not None else "no"))
+    print("%10s %12s %10s %10s" % ("matrices", "invalid",
+                                   "s/matrix", "s/bulk"))
+
+    for count in (1000, 10000, 100000):
+        matrices = generate_matrices(count)
+
+        results = list()
+        for func in (per_matrix, bulk):
+            start = time.time()
+            invalid = func(matrices)
+            results.append((invalid, time.time() - start))
+
+        assert results[0][0] == results[1][0]
+        print("%10i %12i %10.3f %10.3f" % (
+            count, len(results[0][0]), results[0][1], results[1][1]))
+
+
+if __name__ == "__main__":
+    main()
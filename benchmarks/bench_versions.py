@@ -0,0 +1,71 @@
+"""Benchmark finding the next version of a publish directory
+
+Compares listing the directory and passing it to `find_next_version()`,
+as done for every instance before, against `versions.next_version()`
+listing it once and then only checking whether the
+directory changed.
+
+Usage:
+    $ python benchmarks/bench_versions.py 100000
+
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from pyblish_magenta import lib, versions
+
+# Amount of instances looking up the next version
+LOOKUPS = 20
+
+
+def former(directory):
+    return lib.find_next_version(os.listdir(directory))
+
+
+def generate(count):
+    """Return directory of `count` versions"""
+    directory = tempfile.mkdtemp()
+    for version in range(1, count + 1):
+        os.mkdir(os.path.join(directory, lib.format_version(version)))
+
+    past = time.time() - 60
+    os.utime(directory, (past, past))
+    return directory
+
+
+def main(counts):
+    print("%10s %12s %12s %12s" % ("versions", "s/former",
+                                   "s/first", "s/cached"))
+
+    for count in counts:
+        directory = generate(count)
+        try:
+            start = time.time()
+            for _ in range(LOOKUPS):
+                expected = former(directory)
+            former_duration = (time.time() - start) / LOOKUPS
+
+            versions.clear()
+            start = time.time()
+            assert versions.next_version(directory) == expected
+            first_duration = time.time() - start
+
+            start = time.time()
+            for _ in range(LOOKUPS):
+                assert versions.next_version(directory) == expected
+            cached_duration = (time.time() - start) / LOOKUPS
+
+            print("%10i %12.5f %12.5f %12.5f" % (
+                count, former_duration, first_duration, cached_duration))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main([int(count) for count in sys.argv[1:]] or [1000, 10000, 100000])
@@ -1,20 +1,11 @@
 
 import pyblish.api
 
+from . import results, snapshot
 
-def _get_errored_instances_from_context(context):
-
-    instances = list()
-    for result in context.data["results"]:
-
-        if result["instance"] is None:
-            # When instance is None we are on the "context" result
-            continue
-
-        if result["error"]:
-            instances.append(result["instance"])
 
-    return instances
+def _get_errored_instances_from_context(context):
+    return results.get(context).errored_instances()
 
 
 class RepairAction(pyblish.api.Action):
@@ -23,6 +14,9 @@ class RepairAction(pyblish.api.Action):
     To retrieve the invalid nodes this assumes a static `repair(instance)`
     method is available on the plugin.
 
+    Since repairing alters the scene the scene snapshot of the
+    context is invalidated afterwards.
+
     """
     label = "Repair"
     on = "failed"  # This action is only available on a failed plug-in
@@ -40,15 +34,20 @@ class RepairAction(pyblish.api.Action):
         # Apply pyblish.logic to get the instances for the plug-in
         instances = pyblish.api.instances_by_plugin(errored_instances, plugin)
 
-        for instance in instances:
-            plugin.repair(instance)
+        try:
+            for instance in instances:
+                plugin.repair(instance)
+        finally:
+            snapshot.invalidate(context)
 
 
 class SelectInvalidAction(pyblish.api.Action):
     """Select invalid nodes in Maya when plug-in failed.
 
     To retrieve the invalid nodes this assumes a static `get_invalid()`
-    method is available on the plugin.
+    method is available on the plugin. Next to nodes it may return
+    compacted components, e.g. "mesh.vtx[12:40]", which are selected
+    as is, without flattening them.
 
     """
     label = "Select invalid"
@@ -0,0 +1,25 @@
+"""Export Alembic caches from a saved scene, run by mayapy
+
+Each job string is passed as is to `cmds.AbcExport`, which exports all
+jobs of a single call whilst evaluating the scene only once.
+
+Usage:
+    $ mayapy alembic_worker.py scene.mb "-root |ben_GRP -file ben.abc"
+
+"""
+
+import sys
+
+
+def main(scene, *jobs):
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from maya import cmds
+    cmds.loadPlugin("AbcExport", quiet=True)
+    cmds.file(scene, open=True, force=True)
+    cmds.AbcExport(j=list(jobs))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -15,7 +15,8 @@ from .lib import (
 
 from .plugin import (
     Extractor,
-    Integrator
+    Integrator,
+    first_invalid
 )
 
 # third-party
@@ -35,10 +36,11 @@ __all__ = [
     "ValidatePipelineOrder",
     "ValidateContentsOrder",
     "ValidateMeshOrder",
-    "ValidateSceneOrder"
+    "ValidateSceneOrder",
 
     "Extractor",
     "Integrator",
+    "first_invalid",
 
     # third-party
     "humanize",
@@ -0,0 +1,212 @@
+"""Local on-disk cache
+
+Stores small values by key as one file per entry, such that the cache
+persists across sessions and can be shared by simultaneous sessions.
+Entries are written to a temporary file first and then renamed, so
+readers never see a partially written entry.
+
+The least recently used entries are removed once the size of all
+entries exceeds the maximum size of the cache. Reading an entry
+updates its modification time to mark it as used.
+
+Example:
+    >> store = DiskCache(os.path.join(root(), "validation"))
+    >> store.set("a1b2", b"passed")
+    >> store.get("a1b2")
+    'passed'
+
+"""
+
+import os
+import sys
+import errno
+import tempfile
+
+# Environment variable overriding the root directory of all caches
+ENV = "PYBLISH_MAGENTA_CACHE"
+
+# Default maximum size in bytes of the values of a cache
+MAX_SIZE = 64 * 1024 ** 2
+
+# Fraction of the maximum size to evict down to, such that not every
+# write after reaching the maximum size has to evict entries.
+LOW_WATER_MARK = 0.75
+
+
+def root():
+    """Return the directory holding the caches of Pyblish Magenta
+
+    Defaults to the cache directory of the user on this platform, e.g.
+    "~/.cache/pyblish_magenta" on Linux, respecting XDG_CACHE_HOME.
+
+    """
+
+    if os.environ.get(ENV):
+        return os.environ[ENV]
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(
+            os.path.expanduser("~"), "AppData", "Local")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache")
+
+    return os.path.join(base, "pyblish_magenta")
+
+
+class DiskCache(object):
+    """Least recently used cache of values stored in `directory`
+
+    Arguments:
+        directory (str): Directory of the entries, created when needed
+        max_size (int, optional): Maximum size in bytes of all values
+
+    """
+
+    def __init__(self, directory, max_size=MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self._size = None
+
+    def get(self, key):
+        """Return value of `key` or None when it isn't cached"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except (IOError, OSError):
+            return None
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            # Evicted in the meantime, by another session
+            pass
+
+        return value
+
+    def set(self, key, value):
+        """Store `value` under `key`
+
+        Arguments:
+            key (str): Name of the entry, e.g. a hex digest
+            value (bytes): Value of the entry
+
+        """
+
+        if not isinstance(value, bytes):
+            value = value.encode("utf-8")
+
+        path = self._path(key)
+        try:
+            # The replaced value no longer counts towards the size
+            replaced = os.stat(path).st_size
+        except OSError:
+            replaced = 0
+
+        self._ensure_directory()
+        write_atomic(path, value)
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(value) - replaced
+
+        if self._size > self.max_size:
+            self.evict(int(self.max_size * LOW_WATER_MARK))
+
+    def size(self):
+        """Return the size in bytes of all entries"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, size=0):
+        """Remove least recently used entries until at most `size` remains"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        remaining = sum(entry[1] for entry in entries)
+
+        for path, entry_size, _ in entries:
+            if remaining <= size:
+                break
+            _remove(path)
+            remaining -= entry_size
+
+        self._size = remaining
+
+    def clear(self):
+        """Remove all entries"""
+        self.evict(0)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def _ensure_directory(self):
+        try:
+            os.makedirs(self.directory)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+
+    def _entries(self):
+        """Yield (path, size, modification time) per entry"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        for name in names:
+            if name.startswith(".tmp"):
+                continue
+
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            yield path, stat.st_size, stat.st_mtime
+
+
+def write_atomic(path, value):
+    """Write `value` to `path` such that readers never see partial contents
+
+    The value is written to a temporary file in the same directory first,
+    prefixed by ".tmp", which then replaces `path`.
+
+    Arguments:
+        path (str): Path of the file to write
+        value (bytes): Contents of the file
+
+    """
+
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                prefix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        replace(temp, path)
+    except Exception:
+        _remove(temp)
+        raise
+
+
+def replace(src, dst):
+    """Move `src` to `dst`, replacing `dst` when it exists"""
+    if hasattr(os, "replace"):
+        os.replace(src, dst)
+        return
+
+    try:
+        os.rename(src, dst)
+    except OSError:
+        # Windows doesn't allow renaming onto an existing file
+        _remove(dst)
+        os.rename(src, dst)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
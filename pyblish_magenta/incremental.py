@@ -0,0 +1,135 @@
+"""Skip validators whose input is unchanged since they last passed
+
+A validator decorated with `skip_unchanged()` fingerprints its instance
+before validating: the long names and node types of all members, the
+values of the attributes the validator reads and the instance data it
+depends on. When the validator passed before on the same fingerprint,
+it is skipped.
+
+Passing fingerprints are stored in a local on-disk cache keyed by the
+plug-in, its `version` and the fingerprint, so bumping the version of a
+validator whenever its checks change invalidates its cached passes.
+
+Example:
+    >> class ValidateNodeNoGhosting(pyblish.api.InstancePlugin):
+    ..     version = (0, 1, 0)
+    ..
+    ..     @incremental.skip_unchanged(attributes=["ghosting"])
+    ..     def process(self, instance):
+    ..         ...
+
+Note:
+    Only decorate validators whose outcome is fully determined by the
+    fingerprint. E.g. a validator checking mesh topology can't be
+    decorated, since the topology may change without the members, their
+    types or attributes changing.
+
+Set the PYBLISH_MAGENTA_INCREMENTAL environment variable to "0" to
+always run all validators.
+
+"""
+
+import os
+import json
+import hashlib
+import functools
+
+from . import cache, snapshot
+from .lib import get_attributes
+
+# Environment variable to turn skipping unchanged validations off
+ENV = "PYBLISH_MAGENTA_INCREMENTAL"
+
+# Maximum size in bytes of the cache of passed validations
+MAX_SIZE = 16 * 1024 ** 2
+
+_cache = dict()
+
+
+def enabled():
+    """Return whether validations of unchanged input are skipped"""
+    return os.environ.get(ENV, "1") != "0"
+
+
+def get_cache():
+    """Return the cache of passed validations"""
+    directory = os.path.join(cache.root(), "validation")
+    if directory not in _cache:
+        _cache[directory] = cache.DiskCache(directory, MAX_SIZE)
+    return _cache[directory]
+
+
+def fingerprint(instance, attributes=(), data=()):
+    """Return hash of the nodes of `instance` and their `attributes`
+
+    Arguments:
+        instance (pyblish.api.Instance): Instance to fingerprint
+        attributes (list, optional): Attributes to include of all members
+        data (list, optional): Keys of the instance data to include
+
+    Returns:
+        str: Hex digest of the fingerprint
+
+    """
+
+    scene = snapshot.get(instance.context)
+    node_types = scene.node_types(instance)
+    members = sorted(node_types)
+
+    table = get_attributes(members, attributes) if attributes else {}
+
+    hasher = hashlib.sha1()
+    for node in members:
+        row = (node, node_types[node], table.get(node))
+        hasher.update(repr(row).encode("utf-8"))
+
+    for key in data:
+        hasher.update(repr((key, instance.data.get(key))).encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def cache_key(plugin, fingerprint):
+    """Return key of the validation of `fingerprint` by `plugin`"""
+    key = "{0}.{1}|{2}|{3}".format(plugin.__module__,
+                                   plugin.__name__,
+                                   getattr(plugin, "version", None),
+                                   fingerprint)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def skip_unchanged(attributes=(), data=()):
+    """Decorate `process(self, instance)` to skip unchanged instances
+
+    Arguments:
+        attributes (list, optional): Attributes read by the validator
+        data (list, optional): Keys of the instance data read by
+            the validator
+
+    """
+
+    def decorator(process):
+
+        @functools.wraps(process)
+        def wrapper(self, instance):
+            if not enabled():
+                return process(self, instance)
+
+            plugin = type(self)
+            key = cache_key(plugin, fingerprint(instance, attributes, data))
+            store = get_cache()
+
+            if store.get(key) is not None:
+                self.log.info("Skipped, unchanged since last passing")
+                return
+
+            process(self, instance)
+
+            store.set(key, json.dumps({
+                "plugin": plugin.__name__,
+                "version": getattr(plugin, "version", None),
+            }))
+
+        return wrapper
+
+    return decorator
@@ -1,9 +1,10 @@
 import os
-import re
 
 import pyblish.api
 
-from . import plugins
+from .. import plugins, profiler
+from .. import versions as _versions
+from .attributes import get_attributes
 
 
 # Grouped orders for Plug-ins to have structured list of plug-ins that artists
@@ -24,6 +25,9 @@ def find_next_version(versions):
     If multiple numbers are found in a single version,
     the last one found is used. E.g. (6) from "v7_22_6"
 
+    To find the next version of a publish directory, use
+    `versions.next_version()` instead of listing it yourself.
+
     Arguments:
         versions (list): Version numbers as string
 
@@ -43,18 +47,7 @@ def find_next_version(versions):
 
     """
 
-    highest_version = 0
-    for version in versions:
-        matches = re.findall(r"\d+", version)
-
-        if not matches:
-            continue
-
-        version = int(matches[-1])
-        if version > highest_version:
-            highest_version = version
-
-    return highest_version + 1
+    return _versions.highest(versions) + 1
 
 
 def format_version(version):
@@ -85,10 +78,20 @@ def setup():
 
 
 def register_plugins():
-    """Register accompanying plugins"""
+    """Register accompanying plugins
+
+    Plug-ins are profiled when the PYBLISH_MAGENTA_PROFILE
+    environment variable is set, see `pyblish_magenta.profiler`.
+
+    """
+
     for path in PLUGIN_PATHS:
         pyblish.api.register_plugin_path(path)
 
+    if profiler.enabled():
+        profiler.register()
+        print("pyblish_magenta: Profiling plug-ins")
+
     print("pyblish_magenta: Registered plug-ins")
 
 
@@ -97,15 +100,22 @@ def deregister_plugins():
     for path in PLUGIN_PATHS:
         pyblish.api.deregister_plugin_path(path)
 
+    profiler.deregister()
+
     print("pyblish_magenta: Deregistered plug-ins")
 
 
 def compute_publish_directory(path):
     """Given the current file, determine where to publish
 
+    Pyblish Magenta assumes no layout of projects, thus there's no
+    publish directory to derive from `path` and an empty string is
+    returned. Integrators supply the directory themselves, see
+    `pyblish_magenta.api.Integrator`.
+
     Arguments:
         path (str): Absolute path to the current working file
 
     """
-    # TODO: Implement compute publish directory
+
     return ""
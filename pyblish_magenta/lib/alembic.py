@@ -0,0 +1,254 @@
+"""Alembic export options and job strings
+
+Shared by the Alembic extractors, such that the same job string is built
+whether an instance is exported in the current session or elsewhere.
+
+Example:
+    >>> parse_options({"startFrame": 1, "endFrame": 10, "uvWrite": True})
+    '-frameRange 1 10 -uvWrite'
+
+"""
+
+import os
+import logging
+
+log = logging.getLogger(__name__)
+
+
+# Overridable options for Alembic export, given in the following format
+#   - {NAME: EXPECTED TYPE}
+OPTIONS = {
+    "startFrame": float,
+    "endFrame": float,
+    "frameRange": str,  # "start end"; overrides startFrame & endFrame
+    "eulerFilter": bool,
+    "frameRelativeSample": float,
+    "noNormals": bool,
+    "renderableOnly": bool,
+    "step": float,
+    "stripNamespaces": bool,
+    "uvWrite": bool,
+    "wholeFrameGeo": bool,
+    "worldSpace": bool,
+    "writeVisibility": bool,
+    "writeColorSets": bool,
+    "writeFaceSets": bool,
+    "writeCreases": bool,  # Maya 2015 Ext1+
+    "dataFormat": str,
+    "root": (list, tuple),
+    "attr": (list, tuple),
+    "attrPrefix": (list, tuple),
+    "userAttr": (list, tuple),
+    "melPerFrameCallback": str,
+    "melPostJobCallback": str,
+    "pythonPerFrameCallback": str,
+    "pythonPostJobCallback": str,
+    "selection": bool
+}
+
+
+# Options determining which frames are evaluated during export
+FRAME_OPTIONS = ("frameRange", "step", "frameRelativeSample")
+
+
+def default_options():
+    """Return the default options, exporting the current playback range"""
+    from maya import cmds
+
+    start_frame = cmds.playbackOptions(q=True, animationStartTime=True)
+    end_frame = cmds.playbackOptions(q=True, animationEndTime=True)
+
+    return {
+        "startFrame": start_frame,
+        "endFrame": end_frame,
+        "selection": True,
+        "uvWrite": True,
+        "eulerFilter": True,
+        "dataFormat": "ogawa"  # ogawa, hdf5
+    }
+
+
+def instance_options(instance):
+    """Return the options to export `instance` with
+
+    These are the default options, overridden by the data of `instance`.
+
+    """
+
+    options = default_options()
+    options["userAttr"] = ("uuid",)
+    return parse_overrides(instance.data, options)
+
+
+def output_path(instance):
+    """Return path of the Alembic extracted for `instance`"""
+    from ..plugin import temp_dir
+
+    path = os.path.join(temp_dir(instance), "{0}.abc".format(instance.name))
+
+    # Alembic Exporter requires forward slashes
+    return path.replace('\\', '/')
+
+
+def root_job(instance, roots):
+    """Return the options, output path and job string of `instance`
+
+    The job exports `roots` through the `-root` flag, as opposed to
+    the selection, such that it can be run alongside other jobs or in
+    another session.
+
+    Arguments:
+        instance (pyblish.api.Instance): Instance to export
+        roots (list): Long names of the root nodes to export
+
+    Returns:
+        tuple: (options, path, job_str)
+
+    """
+
+    options = instance_options(instance)
+    options.pop("selection", None)
+    options["root"] = roots
+
+    path = output_path(instance)
+    job_str = parse_options(options)
+    job_str += ' -file "{0}"'.format(path)
+
+    return options, path, job_str
+
+
+def parse_overrides(data, options, types=OPTIONS):
+    """Update `options` with the overridden options found in `data`
+
+    Overrides of the wrong type are not included and a warning is logged.
+
+    Arguments:
+        data (dict): Data of an instance
+        options (dict): Options to update
+        types (dict, optional): Overridable options and their types
+
+    Returns:
+        dict: The updated `options`
+
+    """
+
+    for key in data:
+        if key not in types:
+            continue
+
+        # Ensure the data is of correct type
+        value = data[key]
+        if not isinstance(value, types[key]):
+            valid_type = types[key]
+            log.warning(
+                "Overridden attribute {key} was of "
+                "the wrong type: {invalid_type} "
+                "- should have been {valid_type}".format(
+                    key=key,
+                    invalid_type=type(value).__name__,
+                    valid_type=getattr(valid_type, "__name__", valid_type)))
+            continue
+
+        options[key] = value
+
+    return options
+
+
+def parse_options(options):
+    """Convert key-word arguments to job arguments string
+
+    Options are sorted by name, so equal options give equal job strings.
+
+    """
+
+    options = dict(options)
+
+    # Convert `startFrame` and `endFrame` arguments
+    if 'startFrame' in options or 'endFrame' in options:
+        start_frame = options.pop('startFrame', None)
+        end_frame = options.pop('endFrame', None)
+
+        if 'frameRange' in options:
+            log.debug("The `startFrame` and/or `endFrame` arguments "
+                      "are overridden by the provided `frameRange`.")
+        elif start_frame is None or end_frame is None:
+            log.warning("The `startFrame` and `endFrame` arguments "
+                        "must be supplied together.")
+        else:
+            options['frameRange'] = "%s %s" % (start_frame, end_frame)
+
+    job_args = list()
+    for key, value in sorted(options.items()):
+        if isinstance(value, (list, tuple)):
+            for entry in value:
+                job_args.append("-{0} {1}".format(key, entry))
+        elif isinstance(value, bool):
+            if value:
+                job_args.append("-{0}".format(key))
+        else:
+            job_args.append("-{0} {1}".format(key, value))
+
+    job_str = " ".join(job_args)
+
+    return job_str
+
+
+def frames_key(options):
+    """Return hashable key of the frames evaluated when exporting `options`
+
+    Example:
+        >>> a = frames_key({"startFrame": 1, "endFrame": 10})
+        >>> b = frames_key({"frameRange": "1 10", "uvWrite": True})
+        >>> a == b
+        True
+
+    """
+
+    options = dict(options)
+
+    if "frameRange" not in options:
+        options["frameRange"] = "%s %s" % (options.get("startFrame"),
+                                           options.get("endFrame"))
+
+    # E.g. "1 10" and "1.0 10.0" evaluate the same frames
+    frame_range = list()
+    for frame in str(options["frameRange"]).split():
+        try:
+            frame_range.append(float(frame))
+        except ValueError:
+            frame_range.append(frame)
+    options["frameRange"] = tuple(frame_range)
+
+    return tuple(options.get(key) for key in FRAME_OPTIONS)
+
+
+def group_by_frames(options):
+    """Group options of jobs that evaluate the same frames
+
+    Such jobs can be exported by a single call to `cmds.AbcExport`,
+    which then evaluates the frames only once for all jobs.
+
+    Arguments:
+        options (list): The options of each job
+
+    Returns:
+        list: Lists of indices into `options`, in order of first occurrence
+
+    Example:
+        >>> group_by_frames([{"frameRange": "1 10"},
+        ...                  {"frameRange": "1 20"},
+        ...                  {"frameRange": "1 10", "uvWrite": True}])
+        [[0, 2], [1]]
+
+    """
+
+    groups = dict()
+    order = list()
+    for index, job_options in enumerate(options):
+        key = frames_key(job_options)
+        if key not in groups:
+            groups[key] = list()
+            order.append(key)
+        groups[key].append(index)
+
+    return [groups[key] for key in order]
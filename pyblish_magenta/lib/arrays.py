@@ -0,0 +1,100 @@
+"""Vectorized checks on large amounts of values
+
+Uses NumPy when available and falls back to the standard library's
+`array` module otherwise, which is slower yet still avoids creating a
+Python object per value.
+
+"""
+
+import array
+import itertools
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def flatten(rows):
+    """Return a flat array of floats from a sequence of rows
+
+    Arguments:
+        rows (list): Sequence of sequences of numbers,
+            e.g. the list of tuples returned by `cmds.getAttr`
+
+    Returns:
+        numpy.ndarray or array.array: Flat array of doubles
+
+    """
+
+    if numpy is not None:
+        return numpy.asarray(rows, dtype=numpy.float64).ravel()
+
+    return array.array("d", itertools.chain.from_iterable(rows))
+
+
+def table(rows, width):
+    """Return `rows` of `width` numbers each as a two dimensional array
+
+    Returns:
+        numpy.ndarray or list: Array of shape (len(rows), width), or
+            the rows as a list of tuples when NumPy is unavailable
+
+    """
+
+    if numpy is not None:
+        return numpy.asarray(rows, dtype=numpy.float64).reshape(-1, width)
+
+    return [tuple(row) for row in rows]
+
+
+def max_abs(values):
+    """Return the largest absolute value in `values`, 0.0 when empty"""
+    if not len(values):
+        return 0.0
+
+    if numpy is not None:
+        return float(numpy.abs(values).max())
+
+    return float(max(max(values), -min(values)))
+
+
+def rows_differing(rows, reference, tolerance):
+    """Return indices of the `rows` that differ from `reference`
+
+    A row differs when any of its values differs more than `tolerance`
+    from the value at the same position in `reference`.
+
+    Arguments:
+        rows (list): Sequence of rows of numbers, each as long
+            as `reference`, e.g. the matrices of many transforms
+        reference (list): The row of numbers to compare to
+        tolerance (float): Largest difference that's still equal
+
+    Returns:
+        list: Indices of the differing rows, in order
+
+    Example:
+        >>> rows_differing([(0, 1), (0, 1.5), (0, 1)], (0, 1), 0.1)
+        [1]
+
+    """
+
+    if not len(rows):
+        return []
+
+    if numpy is not None:
+        values = numpy.asarray(rows, dtype=numpy.float64)
+        values = values.reshape(-1, len(reference))
+        difference = numpy.abs(values - numpy.asarray(reference,
+                                                      dtype=numpy.float64))
+        return numpy.flatnonzero(difference.max(axis=1) > tolerance).tolist()
+
+    invalid = list()
+    for i, row in enumerate(rows):
+        for value, expected in zip(row, reference):
+            if abs(value - expected) > tolerance:
+                invalid.append(i)
+                break
+
+    return invalid
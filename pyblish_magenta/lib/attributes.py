@@ -0,0 +1,182 @@
+"""Bulk attribute queries
+
+Querying attributes one by one with `cmds.attributeQuery` and `cmds.getAttr`
+costs two round-trips through the command layer per node per attribute.
+`get_attributes()` reads many attributes of many nodes in one go, through
+the Maya Python API 2.0 when available.
+
+"""
+
+# Returned for plugs whose value can't be read through the API
+# exactly as `cmds.getAttr` would return it
+_UNSUPPORTED = object()
+
+
+def get_attributes(nodes, attributes):
+    """Return the values of `attributes` for all `nodes`
+
+    Missing nodes or attributes don't raise an error, instead
+    their value is None in the resulting table.
+
+    Arguments:
+        nodes (list): Names of the nodes to query
+        attributes (list): Names of the attributes to query
+
+    Returns:
+        dict: A row of values per node, ordered like `attributes`.
+            E.g. {"|pCube1": [True, False]}
+
+    Example:
+        >> table = get_attributes(["|a", "|b"], ["visibility", "ghosting"])
+        >> visibility, ghosting = table["|a"]
+
+    """
+
+    nodes = list(nodes)
+    attributes = list(attributes)
+
+    if not nodes or not attributes:
+        return dict((node, [None] * len(attributes)) for node in nodes)
+
+    try:
+        from maya.api import OpenMaya
+    except ImportError:
+        return _get_attributes_cmds(nodes, attributes)
+
+    return _get_attributes_api(OpenMaya, nodes, attributes)
+
+
+def _get_attributes_api(om, nodes, attributes):
+    """Read the attributes through the Maya Python API 2.0
+
+    This doesn't go through the command layer at all, except
+    for attributes of a type that can't be read unambiguously
+    through the API (e.g. those with units).
+
+    """
+
+    from maya import cmds
+
+    fn = om.MFnDependencyNode()
+    selection = om.MSelectionList()
+
+    table = dict()
+    for node in nodes:
+        row = [None] * len(attributes)
+        table[node] = row
+
+        selection.clear()
+        try:
+            selection.add(node)
+        except RuntimeError:
+            # Node does not exist
+            continue
+
+        fn.setObject(selection.getDependNode(0))
+        for i, attr in enumerate(attributes):
+            if not fn.hasAttribute(attr):
+                continue
+
+            value = _plug_value(om, fn.findPlug(attr, False))
+            if value is _UNSUPPORTED:
+                value = cmds.getAttr("{0}.{1}".format(node, attr))
+
+            row[i] = value
+
+    return table
+
+
+def _plug_value(om, plug):
+    """Return value of `plug` formatted like `cmds.getAttr` would"""
+
+    if plug.isArray:
+        return _UNSUPPORTED
+
+    if plug.isCompound:
+        values = tuple(_plug_value(om, plug.child(i))
+                       for i in range(plug.numChildren()))
+        if _UNSUPPORTED in values:
+            return _UNSUPPORTED
+        return [values]
+
+    attr = plug.attribute()
+
+    if attr.hasFn(om.MFn.kNumericAttribute):
+        numeric_type = om.MFnNumericAttribute(attr).numericType()
+        if numeric_type == om.MFnNumericData.kBoolean:
+            return plug.asBool()
+        if numeric_type in (om.MFnNumericData.kFloat,
+                            om.MFnNumericData.kDouble):
+            return plug.asDouble()
+        if numeric_type in (om.MFnNumericData.kByte,
+                            om.MFnNumericData.kChar,
+                            om.MFnNumericData.kShort,
+                            om.MFnNumericData.kInt):
+            return plug.asInt()
+        return _UNSUPPORTED
+
+    if attr.hasFn(om.MFn.kEnumAttribute):
+        return plug.asShort()
+
+    if attr.hasFn(om.MFn.kMatrixAttribute):
+        return list(om.MFnMatrixData(plug.asMObject()).matrix())
+
+    if attr.hasFn(om.MFn.kTypedAttribute):
+        attr_type = om.MFnTypedAttribute(attr).attrType()
+        if attr_type == om.MFnData.kString:
+            return plug.asString() or None
+        if attr_type == om.MFnData.kMatrix:
+            return list(om.MFnMatrixData(plug.asMObject()).matrix())
+
+    return _UNSUPPORTED
+
+
+def _get_attributes_cmds(nodes, attributes):
+    """Read the attributes through `maya.cmds`
+
+    The existence of each attribute is queried once per node type,
+    instead of once per node. Only when an attribute isn't a static
+    attribute of the node type the user-defined attributes of the
+    node are listed, once per node.
+
+    """
+
+    from maya import cmds
+
+    # Query the node types of all nodes in one call. This returns long
+    # names, any other names are looked up separately further below.
+    listed = cmds.ls(nodes, showType=True, long=True) or []
+    node_types = dict(zip(listed[::2], listed[1::2]))
+
+    static = dict()
+    user_defined = dict()
+    table = dict()
+    for node in nodes:
+        row = [None] * len(attributes)
+        table[node] = row
+
+        node_type = node_types.get(node)
+        if node_type is None:
+            if not cmds.objExists(node):
+                continue
+            node_type = cmds.nodeType(node)
+
+        for i, attr in enumerate(attributes):
+            key = (node_type, attr)
+            if key not in static:
+                static[key] = cmds.attributeQuery(attr,
+                                                  type=node_type,
+                                                  exists=True)
+
+            if not static[key]:
+                if node not in user_defined:
+                    user_defined[node] = set(
+                        cmds.listAttr(node, userDefined=True) or []
+                    )
+
+                if attr not in user_defined[node]:
+                    continue
+
+            row[i] = cmds.getAttr("{0}.{1}".format(node, attr))
+
+    return table
@@ -0,0 +1,105 @@
+"""World space bounding boxes of many DAG nodes
+
+`get_world_bounds()` reads the bounds of many nodes in a single pass,
+through the Maya Python API 2.0 when available, into an array of one
+row of (xmin, ymin, zmin, xmax, ymax, zmax) per node.
+
+The bounds of a transform include those of everything below it, thus
+when the bounds of a group are within limits so are those of all of its
+descendants. `iter_exceeding()` makes use of that by checking groups
+before their children, skipping all children of groups within limits.
+
+"""
+
+from . import arrays, hierarchy
+
+
+def get_world_bounds(nodes):
+    """Return the world space bounding boxes of `nodes`
+
+    Arguments:
+        nodes (list): Long names of DAG nodes
+
+    Returns:
+        numpy.ndarray or list: Array of shape (len(nodes), 6), ordered
+            like `nodes`, see `arrays.table()`
+
+    """
+
+    nodes = list(nodes)
+    if not nodes:
+        return arrays.table([], 6)
+
+    try:
+        from maya.api import OpenMaya
+    except ImportError:
+        return arrays.table(_get_world_bounds_cmds(nodes), 6)
+
+    return arrays.table(_get_world_bounds_api(OpenMaya, nodes), 6)
+
+
+def iter_exceeding(nodes, limit):
+    """Yield the nodes of `nodes` with bounds beyond `limit`
+
+    The bounds of the nodes are checked level by level from the top of
+    their hierarchy, including their ancestors, and only the children of
+    nodes exceeding `limit` are checked on the next level.
+
+    Arguments:
+        nodes (list): Long names of DAG nodes
+        limit (float): Largest absolute coordinate within limits
+
+    """
+
+    nodes = set(nodes)
+    paths = nodes.union(hierarchy.get_ancestors(nodes))
+
+    children = dict()
+    for path in paths:
+        children.setdefault(hierarchy.get_parent(path), list()).append(path)
+
+    level = sorted(children.get(None, []))
+    while level:
+        bounds = get_world_bounds(level)
+        exceeding = [level[i] for i in
+                     arrays.rows_differing(bounds, [0.0] * 6, limit)]
+
+        next_level = list()
+        for path in exceeding:
+            if path in nodes:
+                yield path
+            next_level.extend(sorted(children.get(path, [])))
+
+        level = next_level
+
+
+def _get_world_bounds_api(om, nodes):
+    """Read the bounds through the Maya Python API 2.0"""
+
+    fn = om.MFnDagNode()
+    selection = om.MSelectionList()
+
+    rows = list()
+    for node in nodes:
+        selection.clear()
+        selection.add(node)
+        path = selection.getDagPath(0)
+        fn.setObject(path)
+
+        # In the space of the parent, as it includes the transformation
+        # of the node itself, leaving only those of its ancestors.
+        box = fn.boundingBox
+        box.transformUsing(path.exclusiveMatrix())
+
+        rows.append(tuple(box.min)[:3] + tuple(box.max)[:3])
+
+    return rows
+
+
+def _get_world_bounds_cmds(nodes):
+    """Read the bounds through `maya.cmds`, one query per node"""
+
+    from maya import cmds
+
+    return [cmds.xform(node, query=True, worldSpace=True, boundingBox=True)
+            for node in nodes]
@@ -0,0 +1,238 @@
+"""Compacted component lists as sets of intervals
+
+Maya returns consecutive components as a single entry, e.g.
+"pCube1.vtx[0:7]", unless flattened. Flattening millions of components
+is slow, so these functions work on the compacted entries directly.
+
+Example:
+    >>> count(["pCube1.vtx[0:7]", "pCube1.vtx[9]"])
+    9
+    >>> vertices = indices(["pCube1.vtx[0:7]", "pCube1.vtx[9]"])
+    >>> vertices
+    IntervalSet([(0, 8), (9, 10)])
+    >>> len(vertices - IntervalSet([(2, 4)]))
+    7
+
+"""
+
+import re
+import bisect
+
+# A single index or range of indices, e.g. "[3]" or "[0:7]"
+_INDEX = re.compile(r"\[(\d+)(?::(\d+))?\]")
+
+# A range of indices, e.g. "[0:7]"
+_RANGE = re.compile(r"\[(\d+):(\d+)\]")
+
+
+def count(components):
+    """Return the length of `components` as if it was flattened
+
+    Components with multiple indices count all combinations,
+    e.g. "pCube1.vtxFace[1:3][0:1]" counts 6 vertex-faces.
+
+    Arguments:
+        components (list): The non-flattened components
+
+    Returns:
+        int: The amount of components
+
+    """
+
+    # Scanning all components at once is considerably faster than
+    # scanning them one by one, which is only needed for components
+    # of multiple indices.
+    joined = "\n".join(components)
+    if "][" not in joined:
+        return len(components) + sum(int(end) - int(start)
+                                     for start, end in _RANGE.findall(joined))
+
+    n = 0
+    for component in components:
+        product = 1
+        for start, end in _INDEX.findall(component):
+            product *= int(end) - int(start) + 1 if end else 1
+        n += product
+
+    return n
+
+
+def indices(components):
+    """Return the indices of `components` as IntervalSet
+
+    Arguments:
+        components (list): Non-flattened components with a single
+            index each, e.g. ["pCube1.vtx[0:7]", "pCube1.vtx[9]"]
+
+    Raises:
+        ValueError: On components without or with multiple indices
+
+    """
+
+    joined = "\n".join(components)
+    found = _INDEX.findall(joined)
+    if len(found) != len(components) or "][" in joined:
+        raise ValueError("Not all components are of a single index: "
+                         "%s" % ", ".join(components[:10]))
+
+    return IntervalSet((int(start), int(end or start) + 1)
+                       for start, end in found)
+
+
+class IntervalSet(object):
+    """Set of integers stored as sorted and disjoint half-open intervals
+
+    Arguments:
+        intervals (list, optional): (start, end) pairs, with `end`
+            excluded. These may overlap and be in any order.
+
+    Example:
+        >>> a = IntervalSet([(0, 10)])
+        >>> b = IntervalSet([(5, 15), (20, 25)])
+        >>> a | b
+        IntervalSet([(0, 15), (20, 25)])
+        >>> a & b
+        IntervalSet([(5, 10)])
+        >>> b - a
+        IntervalSet([(10, 15), (20, 25)])
+        >>> b.complement(30)
+        IntervalSet([(0, 5), (15, 20), (25, 30)])
+
+    """
+
+    def __init__(self, intervals=()):
+        self._intervals = _merge(intervals)
+        self._starts = None
+
+    @classmethod
+    def from_indices(cls, indices):
+        """Return IntervalSet of the integers `indices`"""
+        return cls((index, index + 1) for index in indices)
+
+    @property
+    def intervals(self):
+        """Return the (start, end) pairs, with `end` excluded"""
+        return list(self._intervals)
+
+    def ranges(self):
+        """Return the (first, last) pairs, as used by Maya"""
+        return [(start, end - 1) for start, end in self._intervals]
+
+    def components(self, prefix):
+        """Return compacted components of these indices
+
+        Example:
+            >>> IntervalSet([(0, 8), (9, 10)]).components("pCube1.vtx")
+            ['pCube1.vtx[0:7]', 'pCube1.vtx[9]']
+
+        """
+
+        return ["%s[%i]" % (prefix, start) if start == last else
+                "%s[%i:%i]" % (prefix, start, last)
+                for start, last in self.ranges()]
+
+    def union(self, other):
+        return IntervalSet(self._intervals + other._intervals)
+
+    def intersection(self, other):
+        result = list()
+        a, b = self._intervals, other._intervals
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+            if start < end:
+                result.append((start, end))
+
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        return _from_merged(result)
+
+    def difference(self, other):
+        result = list()
+        b = other._intervals
+        j = 0
+        for start, end in self._intervals:
+            # Skip intervals of `other` entirely before this one
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+
+            k = j
+            while k < len(b) and b[k][0] < end:
+                if b[k][0] > start:
+                    result.append((start, b[k][0]))
+                start = max(start, b[k][1])
+                k += 1
+
+            if start < end:
+                result.append((start, end))
+
+        return _from_merged(result)
+
+    def complement(self, size):
+        """Return the integers of [0, `size`) not in this set"""
+        return IntervalSet([(0, size)]).difference(self)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __len__(self):
+        return sum(end - start for start, end in self._intervals)
+
+    def __bool__(self):
+        return bool(self._intervals)
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        for start, end in self._intervals:
+            for index in range(start, end):
+                yield index
+
+    def __contains__(self, index):
+        if self._starts is None:
+            self._starts = [start for start, _ in self._intervals]
+
+        i = bisect.bisect_right(self._starts, index) - 1
+        return i >= 0 and index < self._intervals[i][1]
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._intervals == other._intervals
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "IntervalSet(%r)" % self._intervals
+
+
+def _merge(intervals):
+    """Return sorted list of disjoint intervals covering `intervals`"""
+    merged = list()
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _from_merged(intervals):
+    """Return IntervalSet of `intervals` that are known to be merged"""
+    interval_set = IntervalSet()
+    interval_set._intervals = intervals
+    return interval_set
@@ -0,0 +1,145 @@
+"""Hierarchy queries on DAG paths
+
+These functions work solely on the long names (full paths) of DAG nodes,
+e.g. "|ben_GRP|ben_GEO", without querying the scene.
+
+"""
+
+import bisect
+
+
+def get_parent(path):
+    """Return parent path of `path` or None for root nodes
+
+    Example:
+        >>> get_parent("|a|b|c")
+        '|a|b'
+        >>> get_parent("|a") is None
+        True
+
+    """
+
+    return path.rsplit("|", 1)[0] or None
+
+
+def get_ancestors(paths):
+    """Return all ancestors of `paths`
+
+    Each ancestor is visited only once, so shared ancestors of
+    many paths don't add to the cost.
+
+    Example:
+        >>> sorted(get_ancestors(["|a|b|c", "|a|d"]))
+        ['|a', '|a|b']
+
+    """
+
+    ancestors = set()
+    for path in paths:
+        parent = get_parent(path)
+        while parent and parent not in ancestors:
+            ancestors.add(parent)
+            parent = get_parent(parent)
+
+    return ancestors
+
+
+def get_roots(paths):
+    """Return the paths of `paths` that are not below another path
+
+    Example:
+        >>> get_roots(["|a|b|c", "|a|b", "|a|bb", "|d"])
+        ['|a|b', '|a|bb', '|d']
+
+    """
+
+    # When sorted, all paths starting with the same string are adjacent.
+    # Those may be interleaved with similar names, e.g. "|a|bb" sorts in
+    # between "|a|b" and "|a|b|c", hence the stack of candidate roots.
+    roots = list()
+    stack = list()
+    for path in sorted(set(paths)):
+        while stack and not path.startswith(stack[-1]):
+            stack.pop()
+
+        if stack and path.startswith(stack[-1] + "|"):
+            continue
+
+        roots.append(path)
+        stack.append(path)
+
+    return roots
+
+
+def _end_of_subtree(path):
+    """Return key sorting directly after all descendants of `path`
+
+    All descendants start with `path` followed by "|" and
+    "}" is the character sorting directly after "|".
+
+    """
+
+    return path + "}"
+
+
+class DagIndex(object):
+    """Sorted index of all DAG paths in the scene
+
+    In a sorted list of paths all descendants of a path directly follow it,
+    so the descendants are found through bisection instead of walking the
+    hierarchy. The descendants of each path are cached, such that subtrees
+    shared by multiple instances are only looked up once.
+
+    Arguments:
+        paths (list): Long names of all DAG nodes in the scene
+        exclude (list, optional): Paths never returned as a descendant,
+            e.g. intermediate objects.
+
+    Example:
+        >>> index = DagIndex(["|a", "|a|b", "|a|b|c", "|ab"])
+        >>> index.descendants("|a")
+        ('|a|b', '|a|b|c')
+
+    """
+
+    def __init__(self, paths, exclude=None):
+        exclude = set(exclude or ())
+        self._paths = sorted(path for path in set(paths)
+                             if path not in exclude)
+        self._descendants = dict()
+
+    def descendants(self, path):
+        """Return all descendants of `path`"""
+        descendants = self._descendants.get(path)
+        if descendants is None:
+            start = bisect.bisect_right(self._paths, path + "|")
+            end = bisect.bisect_left(self._paths, _end_of_subtree(path))
+            descendants = tuple(self._paths[start:end])
+            self._descendants[path] = descendants
+
+        return descendants
+
+    def expand(self, nodes):
+        """Return `nodes` with all their ancestors and descendants
+
+        Non-DAG nodes in `nodes` are included as they are.
+
+        Returns:
+            set: The expanded nodes
+
+        """
+
+        expanded = set(nodes)
+        dag = [node for node in expanded if node.startswith("|")]
+
+        ancestors = get_ancestors(dag)
+        expanded.update(ancestors)
+
+        # Descendants of the ancestors include those of the nodes, so only
+        # those of the root nodes (assemblies) need to be looked up.
+        roots = set(path for path in ancestors.union(dag)
+                    if get_parent(path) is None)
+        for root in roots:
+            expanded.update(self.descendants(root))
+
+        return expanded
@@ -0,0 +1,279 @@
+"""Topology checks of many meshes at once
+
+`cmds.polyInfo` accepts many meshes at once and returns the offending
+components of all of them in a single list, e.g. ["pCube1.f[3]"]. The
+owner of each component is named by its shortest unique name, being
+either the mesh or its transform, with any namespace. `NameIndex` maps
+all names a mesh may be referred to by back to its long name.
+
+Example:
+    >> invalid = poly_info(meshes, "laminaFaces")
+    >> invalid["|ben_GRP|ben_GEO|ben_GEOShape"]
+    ['ben_GEO.f[3]', 'ben_GEO.f[7:9]']
+
+The results of checks solely depending on the topology of a mesh are
+cached on disk by a fingerprint of that topology, such that meshes
+referenced many times, or published unchanged, are checked only once.
+
+    >> invalid = cached_poly_info(meshes, "laminaFaces")
+
+"""
+
+import os
+import json
+import array
+import hashlib
+
+from .. import cache
+
+# Maximum size in bytes of the cache of topology checks
+MAX_SIZE = 32 * 1024 ** 2
+
+# Bump when the format of the fingerprint or of the cached results changes
+CACHE_VERSION = 1
+
+_cache = dict()
+
+
+def poly_info(meshes, flag):
+    """Return the components found by `cmds.polyInfo` grouped by mesh
+
+    Arguments:
+        meshes (list): Long names of the meshes to check
+        flag (str): Query flag of `cmds.polyInfo`, e.g. "laminaFaces"
+
+    Returns:
+        dict: Components by the long name of their mesh, only
+            including meshes for which any components were found.
+
+    """
+
+    from maya import cmds
+
+    meshes = list(meshes)
+    if not meshes:
+        return dict()
+
+    found = cmds.polyInfo(meshes, **{flag: True}) or []
+    return NameIndex(meshes).group(found)
+
+
+def cached_poly_info(meshes, flag):
+    """Return `poly_info()` of `meshes`, cached by their topology
+
+    Components are named by the long name of their mesh,
+    e.g. "|ben_GRP|ben_GEO|ben_GEOShape.f[3]".
+
+    """
+
+    return cached(flag, meshes, lambda missing: poly_info(missing, flag))
+
+
+class NameIndex(object):
+    """Resolve any name of a mesh, or its transform, to its long name
+
+    All partial paths of the meshes and of their transforms are indexed,
+    e.g. "pCube1", "grp|pCube1" and "|grp|pCube1" for "|grp|pCube1" and
+    its shape. Names shared by multiple meshes are ambiguous and thus not
+    indexed. Maya never returns these, but the unique name of the mesh.
+
+    Arguments:
+        meshes (list): Long names of meshes
+
+    Example:
+        >>> index = NameIndex(["|a|pCube1|pCubeShape1",
+        ...                    "|b|pCube1|pCubeShape1"])
+        >>> index.resolve("a|pCube1")
+        '|a|pCube1|pCubeShape1'
+        >>> index.resolve("pCube1") is None
+        True
+
+    """
+
+    def __init__(self, meshes):
+        names = dict()
+        ambiguous = set()
+
+        for mesh in meshes:
+            transform = mesh.rsplit("|", 1)[0]
+            for path in (mesh, transform):
+                if not path:
+                    continue
+
+                parts = path.split("|")
+                for i in range(len(parts)):
+                    name = "|".join(parts[i:])
+                    if not name:
+                        continue
+                    if names.setdefault(name, mesh) != mesh:
+                        ambiguous.add(name)
+
+        for name in ambiguous:
+            del names[name]
+
+        self._names = names
+
+    def resolve(self, name):
+        """Return long name of the mesh named `name`, if known"""
+        return self._names.get(name)
+
+    def group(self, components):
+        """Group `components` by the long name of their mesh
+
+        Components of unknown meshes are grouped by their given name.
+
+        """
+
+        grouped = dict()
+        for component in components:
+            name = component.rsplit(".", 1)[0]
+            mesh = self._names.get(name, name)
+            grouped.setdefault(mesh, []).append(component)
+
+        return grouped
+
+
+def get_cache():
+    """Return the cache of topology checks"""
+    directory = os.path.join(cache.root(), "topology")
+    if directory not in _cache:
+        _cache[directory] = cache.DiskCache(directory, MAX_SIZE)
+    return _cache[directory]
+
+
+def fingerprint(mesh):
+    """Return hash of the topology of `mesh`
+
+    The topology consists of the amount of vertices, edges and faces
+    and the vertex indices of each face, regardless of the position
+    of the vertices or the name of the mesh.
+
+    Returns:
+        str: Hex digest of the fingerprint
+
+    """
+
+    try:
+        from maya.api import OpenMaya
+    except ImportError:
+        return _fingerprint_cmds(mesh)
+
+    return _fingerprint_api(OpenMaya, mesh)
+
+
+def cached(check, meshes, compute):
+    """Return the components of `meshes` found by `check`, cached
+
+    Only meshes whose topology wasn't checked before are passed on to
+    `compute`. Components are cached relative to their mesh, e.g. "f[3]",
+    and returned prefixed by the long name of the mesh they're found in.
+
+    Arguments:
+        check (str): Unique name of the check, including any version,
+            e.g. "laminaFaces"
+        meshes (list): Long names of the meshes to check
+        compute (callable): Returns the components of the meshes
+            passed to it, grouped by mesh like `poly_info()` does
+
+    Returns:
+        dict: Components by the long name of their mesh, only
+            including meshes for which any components were found.
+            Components not resolved to any of `meshes` are included
+            by the name of their mesh as given by `compute`.
+
+    """
+
+    from .. import incremental
+
+    meshes = list(meshes)
+    if not meshes or not incremental.enabled():
+        return compute(meshes) if meshes else dict()
+
+    store = get_cache()
+    keys = dict((mesh, _cache_key(check, fingerprint(mesh)))
+                for mesh in meshes)
+
+    found = dict()
+    missing = list()
+    for mesh in meshes:
+        value = store.get(keys[mesh])
+        if value is None:
+            missing.append(mesh)
+        elif value != b"[]":
+            found[mesh] = ["%s.%s" % (mesh, component) for component
+                           in json.loads(value.decode("utf-8"))]
+
+    computed = compute(missing) if missing else dict()
+
+    # Components not resolved to any of the meshes may belong to any of
+    # them, so none of the meshes without components can be trusted to
+    # be valid. These are left uncached and the components passed on.
+    unresolved = set(computed) - set(missing)
+    for name in unresolved:
+        found[name] = computed[name]
+
+    for mesh in missing:
+        relative = [component.rsplit(".", 1)[-1]
+                    for component in computed.get(mesh, [])]
+        if relative or not unresolved:
+            store.set(keys[mesh], json.dumps(relative))
+
+        if relative:
+            found[mesh] = ["%s.%s" % (mesh, component)
+                           for component in relative]
+
+    return found
+
+
+def _cache_key(check, fingerprint):
+    key = "{0}|{1}|{2}".format(CACHE_VERSION, check, fingerprint)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _fingerprint_api(om, mesh):
+    """Fingerprint through the Maya Python API 2.0"""
+
+    selection = om.MSelectionList()
+    selection.add(mesh)
+    fn = om.MFnMesh(selection.getDagPath(0))
+
+    counts, indices = fn.getVertices()
+
+    hasher = hashlib.sha1()
+    hasher.update(repr((fn.numVertices,
+                        fn.numEdges,
+                        fn.numPolygons)).encode("utf-8"))
+    hasher.update(_to_bytes(counts))
+    hasher.update(_to_bytes(indices))
+
+    return hasher.hexdigest()
+
+
+def _fingerprint_cmds(mesh):
+    """Fingerprint through `maya.cmds`
+
+    The vertices of the faces are listed as text, considerably slower
+    than reading them through the API.
+
+    """
+
+    from maya import cmds
+
+    counts = cmds.polyEvaluate(mesh, vertex=True, edge=True, face=True)
+    faces = cmds.polyInfo(mesh, faceToVertex=True) or []
+
+    hasher = hashlib.sha1()
+    hasher.update(repr(sorted(counts.items())).encode("utf-8"))
+    for face in faces:
+        hasher.update(" ".join(face.split()).encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def _to_bytes(values):
+    values = array.array("i", values)
+    try:
+        return values.tobytes()
+    except AttributeError:
+        # Python 2
+        return values.tostring()
@@ -0,0 +1,175 @@
+"""Visibility of DAG nodes, resolved once per publish
+
+Whether a node is visible depends on its own attributes and on those of
+all of its parents. Checking many nodes one by one queries the shared
+parents over and over again, instead the `Resolver` reads the attributes
+of the nodes and all of their parents in a single query and resolves
+their visibility top-down, remembering the result of each parent.
+
+The resolver is stored on the context, such that all plug-ins of a
+publish share it. Like the scene snapshot it assumes the scene doesn't
+change whilst validating, it's discarded along with the snapshot by
+`snapshot.invalidate()`.
+
+Example:
+    >> from pyblish_magenta.lib import visibility
+    >> resolver = visibility.get(instance.context)
+    >> visible = resolver.visible(joints, displayLayer=True)
+    >> hidden = [joint for joint in joints if not visible[joint]]
+
+"""
+
+from . import hierarchy
+from .attributes import get_attributes
+from .. import snapshot
+
+# The key under which the resolver is stored in `context.data`
+KEY = "visibilityResolver"
+
+# Attributes read per node, in order
+ATTRIBUTES = ("visibility",
+              "intermediateObject",
+              "overrideEnabled",
+              "overrideVisibility")
+
+
+def get(context):
+    """Return the resolver of `context`, create it if it doesn't exist
+
+    Arguments:
+        context (pyblish.api.Context): Context of the current publish
+
+    Returns:
+        Resolver: The resolver shared by all plug-ins of this publish
+
+    """
+
+    scene = snapshot.get(context)
+
+    resolver = context.data.get(KEY)
+    if resolver is None or resolver.scene is not scene:
+        resolver = Resolver(scene)
+        context.data[KEY] = resolver
+
+    return resolver
+
+
+class Resolver(object):
+    """Resolve the visibility of DAG nodes by their long names
+
+    Arguments:
+        scene (snapshot.Snapshot, optional): The snapshot of the scene
+            the results are valid for
+
+    """
+
+    def __init__(self, scene=None):
+        self.scene = scene
+
+        self._attributes = dict()  # long name -> row of ATTRIBUTES
+        self._shown = dict()       # (displayLayer, visibility) -> results
+
+    def visible(self, nodes,
+                displayLayer=True,
+                intermediateObject=True,
+                parentHidden=True,
+                visibility=True):
+        """Return whether each of `nodes` is visible
+
+        Returns whether a node is hidden by one of the following methods:
+        - The node exists (always checked)
+        - The node must be a dagNode (always checked)
+        - The node's visibility is off.
+        - The node is set as intermediate Object.
+        - The node is in a disabled displayLayer.
+        - Whether any of its parent nodes is hidden.
+
+        Roughly based on: http://ewertb.soundlinker.com/mel/mel.098.php
+
+        Arguments:
+            nodes (list): Long names of the nodes to resolve
+            displayLayer (bool, optional): Check for disabled display layers
+            intermediateObject (bool, optional): Check whether the node
+                itself is an intermediate object
+            parentHidden (bool, optional): Check the parents of the node
+            visibility (bool, optional): Check the visibility attribute
+
+        Returns:
+            dict: Visibility by long name
+
+        """
+
+        nodes = list(nodes)
+        paths = set(nodes)
+        for node in nodes:
+            if not node.startswith("|"):
+                raise ValueError("Not a long name: %s" % node)
+
+        if parentHidden:
+            paths.update(hierarchy.get_ancestors(nodes))
+        self._read(paths)
+
+        if parentHidden:
+            shown = self._resolve(paths, displayLayer, visibility)
+        else:
+            shown = dict((node, self._shows(node, displayLayer, visibility))
+                         for node in nodes)
+
+        result = dict()
+        for node in nodes:
+            is_shown = shown[node]
+
+            # Intermediate objects are never drawn
+            if is_shown and intermediateObject and self._attributes[node][1]:
+                is_shown = False
+
+            result[node] = is_shown
+
+        return result
+
+    def _read(self, paths):
+        """Read the attributes of `paths` not read before, at once"""
+        missing = [path for path in paths if path not in self._attributes]
+        if missing:
+            self._attributes.update(get_attributes(missing, ATTRIBUTES))
+
+    def _shows(self, node, displayLayer, visibility):
+        """Return whether `node` itself, disregarding its parents, shows"""
+        (node_visibility,
+         _,
+         override_enabled,
+         override_visibility) = self._attributes[node]
+
+        # Only existing dagNodes can be visible (only these have `visibility`)
+        if node_visibility is None:
+            return False
+
+        if visibility and not node_visibility:
+            return False
+
+        if displayLayer:
+            # Display layers set overrideEnabled and overrideVisibility on
+            # members, hiding them when the layer is hidden
+            if override_enabled and not override_visibility:
+                return False
+
+        return True
+
+    def _resolve(self, paths, displayLayer, visibility):
+        """Return whether `paths` and all of their parents show
+
+        Parents sort before their children, so by resolving the paths in
+        order the result of the parent of each path is known.
+
+        """
+
+        shown = self._shown.setdefault((displayLayer, visibility), dict())
+        for path in sorted(paths):
+            if path in shown:
+                continue
+
+            parent = hierarchy.get_parent(path)
+            shown[path] = ((parent is None or shown[parent]) and
+                           self._shows(path, displayLayer, visibility))
+
+        return shown
@@ -1,6 +1,55 @@
-import tempfile
+import json
+import itertools
 import pyblish.api
 
+from . import results, transfer, workspace
+
+# Name of the metadata sidecar written alongside extracted files
+METADATA = "metadata.meta"
+
+# Amount of invalid nodes a validator finds before it fails, unless
+# overridden through the `max_invalid` attribute of the validator
+MAX_INVALID = 10
+
+
+def temp_dir(instance):
+    """Provide a temporary directory in which to store extracted files
+
+    The directory is taken once per instance from the pool of
+    extraction directories of this session, see `workspace`, and
+    stored in the "extractDir" data of the instance.
+
+    """
+
+    extract_dir = instance.data.get('extractDir', None)
+
+    if not extract_dir:
+        extract_dir = workspace.get().acquire()
+        instance.data['extractDir'] = extract_dir
+
+    return extract_dir
+
+
+def first_invalid(plugin, instance):
+    """Return the first invalid nodes of `instance` found by `plugin`
+
+    Validators yield their invalid nodes from `iter_invalid(instance)`,
+    such that validation can fail as soon as the first `max_invalid`
+    nodes are found. Use `get_invalid(instance)` to get all of them,
+    e.g. to select or repair them.
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Validator implementing `iter_invalid`
+        instance (pyblish.api.Instance): Instance to validate
+
+    Returns:
+        list: Up to `plugin.max_invalid` invalid nodes, all when None
+
+    """
+
+    limit = getattr(plugin, "max_invalid", MAX_INVALID)
+    return list(itertools.islice(plugin.iter_invalid(instance), limit))
+
 
 class Extractor(pyblish.api.InstancePlugin):
     """Extractor base class.
@@ -8,20 +57,14 @@ class Extractor(pyblish.api.InstancePlugin):
     The extractor base class implements a "temp_dir" function used to generate
     a temporary directory for an instance to extract to.
 
-    This temporary directory is generated through `tempfile.mkdtemp()`
+    This temporary directory is taken from the pool of `workspace.get()`
 
     """
     order = pyblish.api.ExtractorOrder
 
     def temp_dir(self, instance):
         """Provide a temporary directory in which to store extracted files"""
-        extract_dir = instance.data.get('extractDir', None)
-
-        if not extract_dir:
-            extract_dir = tempfile.mkdtemp()
-            instance.data['extractDir'] = extract_dir
-
-        return extract_dir
+        return temp_dir(instance)
 
 
 class Integrator(pyblish.api.InstancePlugin):
@@ -33,6 +76,16 @@ class Integrator(pyblish.api.InstancePlugin):
     This means integration will only take place if up to this point in time
     all of publishing was successful and had no errors.
 
+    Extracted files are integrated through `integrate()`, which moves them
+    to the publish directory and checksums them in the same pass. Where
+    to publish depends on the layout of the project, which subclasses
+    supply, e.g. reserving the next version through `versions.reserve()`:
+
+        def process(self, instance):
+            super(IntegrateAsset, self).process(instance)
+            _, directory = versions.reserve(instance.data["publishDir"])
+            self.integrate(instance, directory)
+
     Note:
         When subclassing from this Integrator ensure to call this class'
         process method using, for example for your CustomIntegrator class:
@@ -41,6 +94,12 @@ class Integrator(pyblish.api.InstancePlugin):
     """
     order = pyblish.api.IntegratorOrder
 
+    # Algorithm to checksum integrated files with, see `transfer.hasher()`
+    algorithm = transfer.ALGORITHM
+
+    # Amount of files integrated at once
+    processes = transfer.PROCESSES
+
     def process(self, instance):
         """
 
@@ -51,18 +110,55 @@ class Integrator(pyblish.api.InstancePlugin):
 
         """
 
-        context = instance.context
-        results = context.data['results']
-
-        # Get the errored instances
-        errored_instances = []
-        for result in results:
-            if result["error"] is not None and result["instance"] is not None:
-                if result["error"]:
-                    instance = result["instance"]
-                    errored_instances.append(instance)
-
-        if instance in errored_instances:
+        if results.get(instance.context).has_error(instance):
             raise RuntimeError("Skipping because of errors being present for"
                                " this instance before Integration: "
                                "{0}".format(instance))
+
+    def integrate(self, instance, directory):
+        """Move the extracted files of `instance` to `directory`
+
+        The files are moved `processes` at a time and renamed into place
+        once all of them are moved. When any of them fails, none remain
+        in `directory`.
+
+        The checksums of the files are added to the metadata sidecar in
+        `directory`, created when not extracted, and stored in the
+        "checksums" data of the instance. The size of the extracted
+        files is stored in the "extractionUsage" data of the context
+        beforehand, as reported by the `CleanupTempdir` plug-in.
+
+        Arguments:
+            instance (pyblish.api.Instance): Instance to integrate
+            directory (str): The publish directory, created when needed
+
+        Returns:
+            dict: Hex digest by path relative to `directory`
+
+        """
+
+        extract_dir = instance.data["extractDir"]
+
+        # Measured up front, as no files remain once moved
+        usage = instance.context.data.setdefault("extractionUsage", dict())
+        usage[instance.name] = workspace.disk_usage(extract_dir)
+
+        self.log.info("Integrating %s to %s.." % (extract_dir, directory))
+        with transfer.Transaction(directory, self.algorithm) as transaction:
+            checksums = transaction.stage_tree(extract_dir, self.processes)
+            checksums.pop(METADATA, None)
+
+            metadata = transaction.read(METADATA)
+            metadata = json.loads(metadata.decode("utf-8")) if metadata \
+                else dict()
+
+            metadata["checksums"] = {
+                "algorithm": self.algorithm,
+                "files": checksums,
+            }
+
+            value = json.dumps(metadata, indent=2, sort_keys=True)
+            transaction.write(METADATA, value.encode("utf-8"))
+
+        instance.data["checksums"] = checksums
+        return checksums
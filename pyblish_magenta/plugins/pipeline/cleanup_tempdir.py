@@ -1,20 +1,33 @@
-import shutil
 import pyblish.api
 
+from pyblish_magenta import workspace
+
 
 class CleanupTempdir(pyblish.api.InstancePlugin):
-    """Remove temporary directories used during extraction"""
+    """Remove temporary directories used during extraction
+
+    The directories are removed in the background, such that
+    publishing finishes without waiting for the removal.
+
+    The size of the extracted files is reported per instance in
+    the "extractionUsage" data of the context, in bytes. Integrated
+    instances keep the size measured before their files were moved.
+
+    """
     label = "Cleanup"
     order = 99
+    threadsafe = True
 
     def process(self, instance):
         if not instance.has_data("extractDir"):
             return
 
-        try:
-            dirname = instance.data("extractDir")
-            self.log.info("Cleaning up %s.." % dirname)
-            shutil.rmtree(dirname)
-            self.log.info("All clean")
-        except IOError:
-            self.log.info("Failed, there might be things lying around")
+        dirname = instance.data("extractDir")
+        self.log.info("Cleaning up %s.." % dirname)
+        size = workspace.get().release(dirname)
+
+        usage = instance.context.data.setdefault("extractionUsage", dict())
+        size = usage.setdefault(instance.name, size)
+
+        self.log.info("Extracted %.1f MB, removing in the background"
+                      % (size / 1024.0 ** 2))
@@ -1,25 +1,6 @@
 import pyblish.api
-import pyblish_maya
 
-
-def get_upstream_hierarchy_fast(nodes):
-    """Passed in nodes must be long names!"""
-
-    matched = set()
-    parents = []
-
-    for node in nodes:
-        hierarchy = node.split("|")
-        num = len(hierarchy)
-        for x in range(1, num-1):
-            parent = "|".join(hierarchy[:num-x])
-            if parent in parents:
-                break
-            else:
-                parents.append(parent)
-                matched.add(parent)
-
-    return parents
+from pyblish_magenta.lib import hierarchy
 
 
 class CollectInstances(pyblish.api.ContextPlugin):
@@ -31,6 +12,10 @@ class CollectInstances(pyblish.api.ContextPlugin):
     All other user-defined attributes of the object set
     is accessible within each instance's data.
 
+    The members of each instance are expanded to include all their parents
+    and children. The hierarchy of the scene is indexed once for all
+    instances, see `pyblish_magenta.lib.hierarchy.DagIndex`.
+
     """
 
     order = pyblish.api.CollectorOrder
@@ -43,6 +28,8 @@ class CollectInstances(pyblish.api.ContextPlugin):
     def process(self, context):
         from maya import cmds
 
+        index = None
+
         for objset in cmds.ls("*_INST",
                               objectsOnly=True,
                               type='objectSet',
@@ -76,23 +63,14 @@ class CollectInstances(pyblish.api.ContextPlugin):
             self.log.info("Collecting: %s" % objset)
 
             # Maintain nested object sets
-            members = cmds.sets(objset, query=True)
-            members = cmds.ls(members, long=True)
-
-            # Include all parents and children
-            parents = get_upstream_hierarchy_fast(members)
-
-            children = cmds.listRelatives(members + parents,
-                                          allDescendents=True,
-                                          fullPath=True) or []
+            members = cmds.sets(objset, query=True) or []
+            members = cmds.ls(members, long=True) if members else []
 
-            # Exclude intermediate objects
-            children = cmds.ls(children, noIntermediate=True, long=True)
+            if index is None:
+                index = self.index_scene()
 
-            nodes = members + parents + children
-
-            # Ensure unique
-            nodes = list(set(nodes))
+            # Include all parents and children
+            nodes = list(index.expand(members))
 
             if self.verbose:
                 self.log.debug("Collecting nodes: %s" % nodes)
@@ -124,3 +102,18 @@ class CollectInstances(pyblish.api.ContextPlugin):
 
         context[:] = sorted(
             context, key=lambda instance: instance.data("family"))
+
+    @staticmethod
+    def index_scene():
+        """Return index of the DAG hierarchy of the current scene
+
+        Intermediate objects are excluded from the children of members.
+
+        """
+
+        from maya import cmds
+
+        paths = cmds.ls(dag=True, long=True)
+        intermediates = cmds.ls(dag=True, long=True, intermediateObjects=True)
+
+        return hierarchy.DagIndex(paths, exclude=intermediates)
@@ -12,6 +12,7 @@ class CollectInstanceMetadata(pyblish.api.InstancePlugin):
     """
     order = pyblish.api.CollectorOrder + 0.21
     label = "Instance Metadata"
+    threadsafe = True
 
     mapping = {
         # frame ranges
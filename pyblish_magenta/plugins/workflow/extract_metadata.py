@@ -2,16 +2,19 @@ import os
 import json
 import pyblish_magenta.api
 
+from pyblish_magenta.plugin import METADATA
+
 
 class ExtractMetadata(pyblish_magenta.api.Extractor):
     """Extract origin metadata from scene"""
 
     label = "Metadata"
+    threadsafe = True
 
     def process(self, instance):
 
         temp_dir = self.temp_dir(instance)
-        temp_file = os.path.join(temp_dir, "metadata.meta")
+        temp_file = os.path.join(temp_dir, METADATA)
 
         metadata = instance.data("metadata")
         self.log.info("Extracting %s" % metadata)
@@ -0,0 +1,33 @@
+import os
+
+import pyblish.api
+import pyblish_magenta.api
+
+from pyblish_magenta import stamp
+
+
+class ExtractValidationStamp(pyblish_magenta.api.Extractor):
+    """Stamp extracted files with the validators they passed
+
+    Writes a sidecar next to each extracted file, published along with
+    it, such that validators can skip the nodes of references to the
+    published file later on. See `pyblish_magenta.stamp`.
+
+    """
+
+    label = "Validation Stamp"
+    order = pyblish.api.ExtractorOrder + 0.45
+
+    def process(self, instance):
+        extract_dir = instance.data.get("extractDir")
+        if not extract_dir:
+            return
+
+        validators = stamp.passed_validators(instance)
+
+        for name in sorted(os.listdir(extract_dir)):
+            path = os.path.join(extract_dir, name)
+            if name.endswith(stamp.SUFFIX) or not os.path.isfile(path):
+                continue
+
+            self.log.info("Stamped %s" % stamp.write(path, validators))
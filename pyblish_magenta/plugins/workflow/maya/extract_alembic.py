@@ -5,6 +5,8 @@ import contextlib
 import pyblish_maya
 import pyblish_magenta.api
 
+from pyblish_magenta.lib import alembic
+
 from maya import cmds
 
 
@@ -72,34 +74,7 @@ class ExtractAlembic(pyblish_magenta.api.Extractor):
 
         """
 
-        return {
-            "startFrame": float,
-            "endFrame": float,
-            "frameRange": str,  # "start end"; overrides startFrame & endFrame
-            "eulerFilter": bool,
-            "frameRelativeSample": float,
-            "noNormals": bool,
-            "renderableOnly": bool,
-            "step": float,
-            "stripNamespaces": bool,
-            "uvWrite": bool,
-            "wholeFrameGeo": bool,
-            "worldSpace": bool,
-            "writeVisibility": bool,
-            "writeColorSets": bool,
-            "writeFaceSets": bool,
-            "writeCreases": bool,  # Maya 2015 Ext1+
-            "dataFormat": str,
-            "root": (list, tuple),
-            "attr": (list, tuple),
-            "attrPrefix": (list, tuple),
-            "userAttr": (list, tuple),
-            "melPerFrameCallback": str,
-            "melPostJobCallback": str,
-            "pythonPerFrameCallback": str,
-            "pythonPostJobCallback": str,
-            "selection": bool
-        }
+        return dict(alembic.OPTIONS)
 
     @property
     def default_options(self):
@@ -110,33 +85,22 @@ class ExtractAlembic(pyblish_magenta.api.Extractor):
 
         """
 
-        from maya import cmds
-
-        start_frame = cmds.playbackOptions(q=True, animationStartTime=True)
-        end_frame = cmds.playbackOptions(q=True, animationEndTime=True)
-
-        return {
-            "startFrame": start_frame,
-            "endFrame": end_frame,
-            "selection": True,
-            "uvWrite": True,
-            "eulerFilter": True,
-            "dataFormat": "ogawa"  # ogawa, hdf5
-        }
+        return alembic.default_options()
 
     def process(self, instance):
+        # Instances may have been extracted elsewhere already,
+        # e.g. by the worker processes of `ExtractAlembicWorkers`.
+        path = instance.data.get("alembicOutput")
+        if path:
+            self.log.info("Already extracted to: {0}".format(path))
+            return
+
         # Ensure alembic exporter is loaded
         cmds.loadPlugin('AbcExport', quiet=True)
 
         # Define extract output file path
-        temp_dir = self.temp_dir(instance)
-        # parent_dir = os.path.join(temp_dir, instance.data("name"))
-        parent_dir = temp_dir
-        filename = "{0}.abc".format(instance.name)
-        path = os.path.join(parent_dir, filename)
-
-        # Alembic Exporter requires forward slashes
-        path = path.replace('\\', '/')
+        path = alembic.output_path(instance)
+        parent_dir = os.path.dirname(path)
 
         options = self.default_options
         options["userAttr"] = ("uuid",)
@@ -165,6 +129,8 @@ class ExtractAlembic(pyblish_magenta.api.Extractor):
                 cmds.select(instance.data("setMembers"), hierarchy=True)
                 cmds.AbcExport(j=job_str, verbose=verbose)
 
+        instance.data["alembicOutput"] = path
+
     def parse_overrides(self, instance, options):
         """Inspect data of instance to determine overridden options
 
@@ -173,54 +139,9 @@ class ExtractAlembic(pyblish_magenta.api.Extractor):
 
         """
 
-        for key in instance.data():
-            if key not in self.options:
-                continue
-
-            # Ensure the data is of correct type
-            value = instance.data(key)
-            if not isinstance(value, self.options[key]):
-                self.log.warning(
-                    "Overridden attribute {key} was of "
-                    "the wrong type: {invalid_type} "
-                    "- should have been {valid_type}".format(
-                        key=key,
-                        invalid_type=type(value).__name__,
-                        valid_type=self.options[key].__name__))
-                continue
-
-            options[key] = value
-
-        return options
+        return alembic.parse_overrides(instance.data, options, self.options)
 
     @classmethod
     def parse_options(cls, options):
         """Convert key-word arguments to job arguments string"""
-
-        # Convert `startFrame` and `endFrame` arguments
-        if 'startFrame' in options or 'endFrame' in options:
-            start_frame = options.pop('startFrame', None)
-            end_frame = options.pop('endFrame', None)
-
-            if 'frameRange' in options:
-                cls.log.debug("The `startFrame` and/or `endFrame` arguments "
-                              "are overridden by the provided `frameRange`.")
-            elif start_frame is None or end_frame is None:
-                cls.log.warning("The `startFrame` and `endFrame` arguments "
-                                "must be supplied together.")
-            else:
-                options['frameRange'] = "%s %s" % (start_frame, end_frame)
-
-        job_args = list()
-        for key, value in options.iteritems():
-            if isinstance(value, (list, tuple)):
-                for entry in value:
-                    job_args.append("-{0} {1}".format(key, entry))
-            elif isinstance(value, bool):
-                job_args.append("-{0}".format(key))
-            else:
-                job_args.append("-{0} {1}".format(key, value))
-
-        job_str = " ".join(job_args)
-
-        return job_str
+        return alembic.parse_options(options)
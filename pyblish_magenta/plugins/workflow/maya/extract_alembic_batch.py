@@ -0,0 +1,79 @@
+import pyblish.api
+
+from pyblish_magenta.lib import alembic, hierarchy
+
+
+class ExtractAlembicBatch(pyblish.api.ContextPlugin):
+    """Extract Alembic caches of instances sharing a frame range at once
+
+    `cmds.AbcExport` accepts multiple jobs, evaluating the frames of all
+    jobs only once. Instances evaluating the same frames (frame range,
+    step and relative samples) are exported together, through `-root`
+    as opposed to selecting their members.
+
+    The options of each instance are those of `ExtractAlembic`, which
+    skips the instances extracted here. Instances without others to
+    share their frames with are left to `ExtractAlembic`, as are those
+    of a batch that failed.
+
+    This is turned off by default, as exporting through `-root` doesn't
+    write the same hierarchy as selecting the members does, e.g. for
+    members parented under nodes outside of the instance.
+
+    """
+
+    label = "Alembic (Batch)"
+    order = pyblish.api.ExtractorOrder - 0.05
+    hosts = ["maya"]
+    families = ["model", "pointcache", "proxy"]
+    optional = True
+    active = False
+
+    def process(self, context):
+        from maya import cmds
+
+        instances = [
+            instance for instance in
+            pyblish.api.instances_by_plugin(context, type(self))
+            if instance.data.get("publish", True) and
+            not instance.data.get("alembicOutput")
+        ]
+
+        jobs = list()
+        for instance in instances:
+            members = cmds.ls(instance.data["setMembers"],
+                              dag=True, long=True)
+            options, path, job_str = alembic.root_job(
+                instance, hierarchy.get_roots(members))
+
+            jobs.append((instance, options, path, job_str))
+
+        groups = alembic.group_by_frames([job[1] for job in jobs])
+        groups = [group for group in groups if len(group) > 1]
+
+        if not groups:
+            self.log.info("No instances share their frames, "
+                          "leaving extraction to ExtractAlembic")
+            return
+
+        cmds.loadPlugin("AbcExport", quiet=True)
+
+        for group in groups:
+            batch = [jobs[index] for index in group]
+            names = ", ".join(str(job[0]) for job in batch)
+            self.log.info("Extracting {0} at once..".format(names))
+
+            try:
+                cmds.refresh(suspend=True)
+                cmds.AbcExport(j=[job[3] for job in batch])
+            except RuntimeError as error:
+                self.log.warning("Extracting {0} failed, these will be "
+                                 "extracted separately instead: "
+                                 "{1}".format(names, error))
+                continue
+            finally:
+                cmds.refresh(suspend=False)
+
+            for instance, options, path, job_str in batch:
+                self.log.info("Extracted {0} to: {1}".format(instance, path))
+                instance.data["alembicOutput"] = path
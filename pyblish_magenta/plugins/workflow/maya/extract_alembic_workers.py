@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+
+import pyblish.api
+import pyblish_magenta
+
+from pyblish_magenta import workers
+from pyblish_magenta.lib import alembic, hierarchy
+
+# Script exporting the Alembic caches within the worker processes
+WORKER = os.path.join(os.path.dirname(pyblish_magenta.__file__),
+                      "alembic_worker.py")
+
+
+class ExtractAlembicWorkers(pyblish.api.ContextPlugin):
+    """Extract Alembic caches in parallel, outside of the current session
+
+    The scene is exported once, after which the instances are extracted
+    by a pool of headless Maya processes, one instance per process.
+    See `pyblish_magenta.workers` on configuring the processes.
+
+    The options of each instance are those of `ExtractAlembic`, except
+    that the members are exported through `-root` as opposed to selecting
+    them. Extracted instances are skipped by `ExtractAlembic`, which does
+    extract those that failed in a worker in the current session.
+
+    This is turned off by default, as starting the processes and loading
+    the scene only pays off when extracting many or heavy instances.
+
+    """
+
+    label = "Alembic (Workers)"
+    order = pyblish.api.ExtractorOrder - 0.1
+    hosts = ["maya"]
+    families = ["model", "pointcache", "proxy"]
+    optional = True
+    active = False
+
+    # Maximum amount of simultaneous processes, defaults to the CPU count
+    processes = None
+
+    def process(self, context):
+        from maya import cmds
+
+        instances = [
+            instance for instance in
+            pyblish.api.instances_by_plugin(context, type(self))
+            if instance.data.get("publish", True) and
+            not instance.data.get("alembicOutput")
+        ]
+
+        if not instances:
+            self.log.info("No instances to extract")
+            return
+
+        jobs = list()
+        for instance in instances:
+            members = cmds.ls(instance.data["setMembers"],
+                              dag=True, long=True)
+
+            _, path, job_str = alembic.root_job(
+                instance, hierarchy.get_roots(members))
+
+            jobs.append((instance, path, job_str))
+
+        scene_dir = tempfile.mkdtemp()
+        try:
+            scene = os.path.join(scene_dir, "scene.mb").replace("\\", "/")
+            self.log.info("Saving scene for workers to: {0}".format(scene))
+            cmds.file(scene,
+                      force=True,
+                      typ="mayaBinary",
+                      exportAll=True,
+                      preserveReferences=True)
+
+            self.log.info("Extracting {0} instances..".format(len(jobs)))
+            errors = workers.run([[WORKER, scene, job_str]
+                                  for _, _, job_str in jobs],
+                                 processes=self.processes)
+        finally:
+            shutil.rmtree(scene_dir, ignore_errors=True)
+
+        for (instance, path, job_str), error in zip(jobs, errors):
+            if error is None and not os.path.exists(path):
+                error = "No Alembic written to: {0}".format(path)
+
+            if error is not None:
+                self.log.warning("Extracting {0} failed, it will be "
+                                 "extracted in the current session "
+                                 "instead:\n{1}".format(instance, error))
+                instance.data["alembicError"] = error
+                continue
+
+            self.log.info("Extracted {0} to: {1}".format(instance, path))
+            instance.data["alembicOutput"] = path
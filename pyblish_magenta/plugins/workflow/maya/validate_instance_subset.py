@@ -24,6 +24,7 @@ class ValidateSubsetName(pyblish.api.InstancePlugin):
     order = pyblish_magenta.api.ValidateContentsOrder
     families = ["*"]
     label = "Subset Name"
+    threadsafe = True
 
     def process(self, instance):
 
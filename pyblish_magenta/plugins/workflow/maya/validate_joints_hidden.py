@@ -1,68 +1,11 @@
 import pyblish.api
 import pyblish_magenta.api
+from pyblish_magenta import incremental
 from pyblish_magenta.action import SelectInvalidAction
+from pyblish_magenta.lib import visibility
 from maya import cmds
 
 
-def is_visible(node,
-               displayLayer=True,
-               intermediateObject=True,
-               parentHidden=True,
-               visibility=True):
-    """Is `node` visible?
-
-    Returns whether a node is hidden by one of the following methods:
-    - The node exists (always checked)
-    - The node must be a dagNode (always checked)
-    - The node's visibility is off.
-    - The node is set as intermediate Object.
-    - The node is in a disabled displayLayer.
-    - Whether any of its parent nodes is hidden.
-
-    Roughly based on: http://ewertb.soundlinker.com/mel/mel.098.php
-
-    Returns:
-        bool: Whether the node is visible in the scene
-
-    """
-
-    # Only existing objects can be visible
-    if not cmds.objExists(node):
-        return False
-
-    # Only dagNodes can be visible
-    if not cmds.objectType(node, isAType='dagNode'):
-        return False
-
-    if visibility:
-        if not cmds.getAttr('{0}.visibility'.format(node)):
-            return False
-
-    if intermediateObject and cmds.objectType(node, isAType='shape'):
-        if cmds.getAttr('{0}.intermediateObject'.format(node)):
-            return False
-
-    if displayLayer:
-        # Display layers set overrideEnabled and overrideVisibility on members
-        if cmds.attributeQuery('overrideEnabled', node=node, exists=True):
-            if cmds.getAttr('{0}.overrideEnabled'.format(node)) and \
-               cmds.getAttr('{0}.overrideVisibility'.format(node)):
-                return False
-
-    if parentHidden:
-        parents = cmds.listRelatives(node, parent=True, fullPath=True)
-        if parents:
-            parent = parents[0]
-            if not is_visible(parent,
-                              displayLayer=displayLayer,
-                              intermediateObject=False,
-                              parentHidden=parentHidden,
-                              visibility=visibility):
-                return False
-
-    return True
-
-
 class ValidateJointsHidden(pyblish.api.InstancePlugin):
     """Validate all joints are hidden visually.
 
@@ -83,13 +26,25 @@ class ValidateJointsHidden(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction]
 
     @staticmethod
-    def get_invalid(instance):
+    def iter_invalid(instance):
         joints = cmds.ls(instance, type='joint', long=True)
-        return [joint for joint in joints if is_visible(joint, displayLayer=True)]
-
+        visible = visibility.get(instance.context).visible(joints,
+                                                           displayLayer=True)
+        for joint in joints:
+            if visible[joint]:
+                yield joint
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
+
+    @incremental.skip_unchanged(attributes=["visibility",
+                                            "intermediateObject",
+                                            "overrideEnabled",
+                                            "overrideVisibility"])
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Visible joints found: "
@@ -1,40 +1,12 @@
-import re
 from maya import cmds
 import pyblish.api
 import pyblish_magenta.api
 
+from pyblish_magenta import snapshot, stamp
+from pyblish_magenta.lib import components
 from pyblish_magenta.action import SelectInvalidAction
 
 
-def len_flattened(components):
-    """Return the length of the list as if it was flattened.
-
-    Maya will return consecutive components as a single entry
-    when requesting with `maya.cmds.ls` without the `flatten`
-    flag. Though enabling `flatten` on a large list (e.g. millions)
-    will result in a slow result. This command will return the amount
-    of entries in a non-flattened list by parsing the result with 
-    regex.
-
-    Args:
-        components (list): The non-flattened components.
-
-    Returns:
-        int: The amount of entries.
-
-    """
-    assert isinstance(components, (list, tuple))
-    n = 0
-    for c in components:
-        match = re.search("\[([0-9]+):([0-9]+)\]", c)
-        if match:
-            start, end = match.groups()
-            n += int(end) - int(start) + 1
-        else:
-            n += 1
-    return n
-
-
 class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
     """Validate the current mesh has UVs.
 
@@ -53,17 +25,25 @@ class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
     optional = True
 
     @classmethod
-    def get_invalid(cls, instance):
-        invalid = []
+    def iter_invalid(cls, instance):
+        """Yield meshes without UVs and vertices without UVs
+
+        Vertices are yielded as compacted components, e.g. "mesh.vtx[3:9]"
+
+        """
 
-        for node in cmds.ls(instance, type='mesh'):
-            uv = cmds.polyEvaluate(node, uv=True)
+        scene = snapshot.get(instance.context)
+        meshes = stamp.unstamped(cls, instance,
+                                 scene.ls(instance, type='mesh'))
+        for node in meshes:
+            stats = scene.mesh_stats(node)
+            uv = stats["uvcoord"]
 
             if uv == 0:
-                invalid.append(node)
+                yield node
                 continue
 
-            vertex = cmds.polyEvaluate(node, vertex=True)
+            vertex = stats["vertex"]
             if uv < vertex:
 
                 # Workaround:
@@ -77,18 +57,24 @@ class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
                 #       again will lose this information.
                 uv_to_vertex = cmds.polyListComponentConversion(node + ".map[*]",
                                                                 toVertex=True)
-                uv_vertex_count = len_flattened(uv_to_vertex)
-                if uv_vertex_count < vertex:
-                    invalid.append(node)
+
+                # The vertices without UVs
+                missing = components.indices(uv_to_vertex or []).complement(
+                    vertex)
+                if missing:
+                    for component in missing.components(node + ".vtx"):
+                        yield component
                 else:
                     cls.log.warning("Node has instanced UV points: {0}".format(node))
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
-            raise RuntimeError("Meshes found in instance without "
-                               "valid UVs: {0}".format(invalid))
+            raise RuntimeError("Meshes or vertices found in instance "
+                               "without valid UVs: {0}".format(invalid))
@@ -1,7 +1,8 @@
 import pyblish.api
 import pyblish_magenta.api
+from pyblish_magenta import snapshot, stamp
+from pyblish_magenta.lib import topology
 from pyblish_magenta.action import SelectInvalidAction
-from maya import cmds
 
 
 class ValidateMeshLaminaFaces(pyblish.api.InstancePlugin):
@@ -19,15 +20,30 @@ class ValidateMeshLaminaFaces(pyblish.api.InstancePlugin):
     label = 'Mesh Lamina Faces'
     actions = [SelectInvalidAction]
 
-    @staticmethod
-    def get_invalid(instance):
-        meshes = cmds.ls(instance, type='mesh', long=True)
-        return [mesh for mesh in meshes if cmds.polyInfo(mesh, laminaFaces=True)]
+    @classmethod
+    def iter_invalid(cls, instance):
+        # Intermediate shapes share the name of their transform with the
+        # shape they're the input of, making it ambiguous to `polyInfo`
+        meshes = snapshot.get(instance.context).ls(instance, type='mesh',
+                                                   noIntermediate=True)
+        meshes = stamp.unstamped(cls, instance, meshes)
+        found = topology.cached_poly_info(meshes, 'laminaFaces')
+        for mesh in meshes:
+            if mesh in found:
+                yield mesh
+
+        # Components of meshes that couldn't be resolved
+        for name in sorted(set(found) - set(meshes)):
+            yield name
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Meshes found with lamina faces: "
@@ -1,5 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
+from pyblish_magenta import snapshot
 from pyblish_magenta.action import SelectInvalidAction
 from maya import cmds
 
@@ -23,26 +24,25 @@ class ValidateMeshNoNegativeScale(pyblish.api.Validator):
     actions = [SelectInvalidAction]
 
     @staticmethod
-    def get_invalid(instance):
-        meshes = cmds.ls(instance,
-                         type='mesh',
-                         long=True,
-                         noIntermediate=True)
+    def iter_invalid(instance):
+        scene = snapshot.get(instance.context)
+        meshes = scene.ls(instance, type='mesh', noIntermediate=True)
 
-        invalid = []
         for mesh in meshes:
-            transform = cmds.listRelatives(mesh, parent=True, fullPath=True)[0]
+            transform = scene.parent(mesh)
             scale = cmds.getAttr("{0}.scale".format(transform))[0]
 
             if any(x < 0 for x in scale):
-                invalid.append(mesh)
+                yield mesh
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Meshes found with negative "
@@ -1,6 +1,8 @@
 import pyblish.api
 import pyblish_magenta.api
 
+from pyblish_magenta import snapshot, stamp
+from pyblish_magenta.lib import topology
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -18,24 +20,42 @@ class ValidateMeshNonManifold(pyblish.api.Validator):
     label = 'Mesh Non-Manifold Vertices/Edges'
     actions = [SelectInvalidAction]
 
-    @staticmethod
-    def get_invalid(instance):
-        from maya import cmds
+    @classmethod
+    def iter_invalid(cls, instance):
+        # Intermediate shapes share the name of their transform with the
+        # shape they're the input of, making it ambiguous to `polyInfo`
+        meshes = snapshot.get(instance.context).ls(instance, type='mesh',
+                                                   noIntermediate=True)
+        meshes = stamp.unstamped(cls, instance, meshes)
+
+        # Edges are only queried when more invalid meshes are asked for
+        # than those with non-manifold vertices
+        found = topology.cached_poly_info(meshes, 'nonManifoldVertices')
+        for mesh in meshes:
+            if mesh in found:
+                yield mesh
 
-        meshes = cmds.ls(instance, type='mesh', long=True)
+        # Components of meshes that couldn't be resolved
+        for name in sorted(set(found) - set(meshes)):
+            yield name
 
-        invalid = []
-        for mesh in meshes:
-            if (cmds.polyInfo(mesh, nonManifoldVertices=True) or
-                    cmds.polyInfo(mesh, nonManifoldEdges=True)):
-                invalid.append(mesh)
+        remaining = [mesh for mesh in meshes if mesh not in found]
+        found = topology.cached_poly_info(remaining, 'nonManifoldEdges')
+        for mesh in remaining:
+            if mesh in found:
+                yield mesh
+
+        for name in sorted(set(found) - set(remaining)):
+            yield name
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Meshes found with non-manifold "
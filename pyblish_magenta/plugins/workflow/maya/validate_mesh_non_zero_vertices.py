@@ -2,7 +2,9 @@ import pyblish.api
 import pyblish_magenta.api
 import pyblish_maya
 
+from pyblish_magenta import snapshot, stamp
 from pyblish_magenta.action import SelectInvalidAction, RepairAction
+from pyblish_magenta.lib import arrays
 
 from maya import cmds
 
@@ -14,6 +16,10 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
     deformers and are difficult to track down. The offset values can be seen
     in the channelBox when selecting the vertices, all values there should be
     zero.
+
+    By default all offsets of a mesh are read in a single query and checked
+    at once, disable `bulk` to query and check the points one by one.
+
     """
 
     order = pyblish_magenta.api.ValidateMeshOrder
@@ -24,8 +30,19 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
     label = 'Mesh Non Zero Vertices'
     actions = [SelectInvalidAction, RepairAction]
 
+    bulk = True
     _tolerance = 1e-8
 
+    @staticmethod
+    def _get_internal_pts(mesh):
+        """Return the internal offset values of all points as flat array"""
+        num_pts = cmds.getAttr('{0}.pnts'.format(mesh), size=True)
+        if not num_pts:
+            return arrays.flatten([])
+
+        attr = '{0}.pnts[0:{1}]'.format(mesh, num_pts - 1)
+        return arrays.flatten(cmds.getAttr(attr))
+
     @staticmethod
     def _iter_internal_pts(mesh):
         """Yield the internal offset values for each point of the mesh"""
@@ -36,6 +53,10 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
 
     @classmethod
     def is_invalid(cls, mesh):
+        if cls.bulk:
+            pts = cls._get_internal_pts(mesh)
+            return arrays.max_abs(pts) > cls._tolerance
+
         pts = cls._iter_internal_pts(mesh)
         for pt in pts:
             if any(abs(v) > cls._tolerance for v in pt):
@@ -43,14 +64,20 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
         return False
 
     @classmethod
-    def get_invalid(cls, instance):
+    def iter_invalid(cls, instance):
+        meshes = snapshot.get(instance.context).ls(instance, type='mesh')
+        meshes = stamp.unstamped(cls, instance, meshes)
+        for mesh in meshes:
+            if cls.is_invalid(mesh):
+                yield mesh
 
-        meshes = cmds.ls(instance, type='mesh', long=True)
-        return [mesh for mesh in meshes if cls.is_invalid(mesh)]
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all meshes"""
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise RuntimeError("Meshes found with non-zero vertices: "
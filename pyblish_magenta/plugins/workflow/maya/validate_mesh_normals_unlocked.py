@@ -2,6 +2,7 @@ import pyblish.api
 import pyblish_magenta.api
 from maya import cmds
 
+from pyblish_magenta import snapshot, stamp
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
@@ -33,16 +34,23 @@ class ValidateMeshNormalsUnlocked(pyblish.api.Validator):
                                             freezeNormal=True))
 
     @classmethod
-    def get_invalid(cls, instance):
-        """Return the meshes with locked normals in instance"""
+    def iter_invalid(cls, instance):
+        """Yield the meshes with locked normals in instance"""
+
+        meshes = snapshot.get(instance.context).ls(instance, type='mesh')
+        meshes = stamp.unstamped(cls, instance, meshes)
+        for mesh in meshes:
+            if cls.has_locked_normals(mesh):
+                yield mesh
 
-        meshes = cmds.ls(instance, type='mesh', long=True)
-        return [mesh for mesh in meshes if cls.has_locked_normals(mesh)]
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Raise invalid when any of the meshes have locked normals"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Meshes found with "
@@ -1,6 +1,7 @@
 import pyblish.api
 import pyblish_magenta.api
 
+from pyblish_magenta import snapshot, stamp
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
@@ -19,13 +20,13 @@ class ValidateMeshSingleUVSet(pyblish.api.InstancePlugin):
     label = "Mesh Single UV Set"
     actions = [SelectInvalidAction, RepairAction]
 
-    @staticmethod
-    def get_invalid(instance):
+    @classmethod
+    def iter_invalid(cls, instance):
         from maya import cmds
 
-        meshes = cmds.ls(instance, type='mesh', long=True)
+        meshes = snapshot.get(instance.context).ls(instance, type='mesh')
+        meshes = stamp.unstamped(cls, instance, meshes)
 
-        invalid = []
         for mesh in meshes:
             uvSets = cmds.polyUVSet(mesh, 
                                     query=True, 
@@ -35,14 +36,16 @@ class ValidateMeshSingleUVSet(pyblish.api.InstancePlugin):
             uvSets = set(uvSets)    
 
             if len(uvSets) != 1:
-                invalid.append(mesh)
+                yield mesh
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Nodes found with multiple "
@@ -1,40 +1,12 @@
-import re
 from maya import cmds
 import pyblish.api
 import pyblish_magenta.api
 
+from pyblish_magenta import snapshot, stamp
+from pyblish_magenta.lib import components, topology
 from pyblish_magenta.action import SelectInvalidAction
 
 
-def len_flattened(components):
-    """Return the length of the list as if it was flattened.
-
-    Maya will return consecutive components as a single entry
-    when requesting with `maya.cmds.ls` without the `flatten`
-    flag. Though enabling `flatten` on a large list (e.g. millions)
-    will result in a slow result. This command will return the amount
-    of entries in a non-flattened list by parsing the result with 
-    regex.
-
-    Args:
-        components (list): The non-flattened components.
-
-    Returns:
-        int: The amount of entries.
-
-    """
-    assert isinstance(components, (list, tuple))
-    n = 0
-    for c in components:
-        match = re.search("\[([0-9]+):([0-9]+)\]", c)
-        if match:
-            start, end = match.groups()
-            n += int(end) - int(start) + 1
-        else:
-            n += 1
-    return n
-
-
 class ValidateMeshVerticesHaveEdges(pyblish.api.InstancePlugin):
     """Validate meshes have only vertices that are connected by to edges.
     
@@ -62,26 +34,46 @@ class ValidateMeshVerticesHaveEdges(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction]
 
     @classmethod
-    def get_invalid(cls, instance):
-        invalid = []
+    def iter_invalid(cls, instance):
+        """Yield the vertices without edges
 
-        meshes = cmds.ls(instance, type="mesh", long=True)
-        for mesh in meshes:
-            num_vertices = cmds.polyEvaluate(mesh, vertex=True)
+        Vertices are yielded as compacted components, e.g. "mesh.vtx[3:9]"
+
+        """
+
+        scene = snapshot.get(instance.context)
+        meshes = scene.ls(instance, type="mesh", noIntermediate=True)
+        meshes = stamp.unstamped(cls, instance, meshes)
+
+        def compute(meshes):
+            invalid = dict()
+            for mesh in meshes:
+                num_vertices = scene.mesh_stats(mesh)["vertex"]
 
-            # Vertices from all edges
-            edges = mesh + ".e[*]"
-            vertices = cmds.polyListComponentConversion(edges, toVertex=True)
-            num_vertices_from_edges = len_flattened(vertices)
+                # Vertices from all edges
+                edges = mesh + ".e[*]"
+                vertices = cmds.polyListComponentConversion(edges,
+                                                            toVertex=True)
+                vertices = components.indices(vertices or [])
 
-            if num_vertices != num_vertices_from_edges:
-                invalid.append(mesh)
+                missing = vertices.complement(num_vertices)
+                if missing:
+                    invalid[mesh] = missing.components(mesh + ".vtx")
+            return invalid
 
-        return invalid
+        # Whether vertices have edges solely depends on the topology
+        found = topology.cached("verticesWithoutEdges", meshes, compute)
+        for mesh in meshes:
+            for component in found.get(mesh, []):
+                yield component
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise RuntimeError("Meshes found in instance with vertices that "
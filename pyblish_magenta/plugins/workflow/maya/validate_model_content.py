@@ -2,66 +2,7 @@ import pyblish.api
 import pyblish_magenta.api
 
 from pyblish_magenta.action import SelectInvalidAction
-from maya import cmds
-
-
-def is_visible(node,
-               displayLayer=True,
-               intermediateObject=True,
-               parentHidden=True,
-               visibility=True):
-    """Is `node` visible?
-
-    Returns whether a node is hidden by one of the following methods:
-    - The node exists (always checked)
-    - The node must be a dagNode (always checked)
-    - The node's visibility is off.
-    - The node is set as intermediate Object.
-    - The node is in a disabled displayLayer.
-    - Whether any of its parent nodes is hidden.
-
-    Roughly based on: http://ewertb.soundlinker.com/mel/mel.098.php
-
-    Returns:
-        bool: Whether the node is visible in the scene
-
-    """
-
-    # Only existing objects can be visible
-    if not cmds.objExists(node):
-        return False
-
-    # Only dagNodes can be visible
-    if not cmds.objectType(node, isAType='dagNode'):
-        return False
-
-    if visibility:
-        if not cmds.getAttr('{0}.visibility'.format(node)):
-            return False
-
-    if intermediateObject and cmds.objectType(node, isAType='shape'):
-        if cmds.getAttr('{0}.intermediateObject'.format(node)):
-            return False
-
-    if displayLayer:
-        # Display layers set overrideEnabled and overrideVisibility on members
-        if cmds.attributeQuery('overrideEnabled', node=node, exists=True):
-            if cmds.getAttr('{0}.overrideEnabled'.format(node)) and \
-               cmds.getAttr('{0}.overrideVisibility'.format(node)):
-                return False
-
-    if parentHidden:
-        parents = cmds.listRelatives(node, parent=True, fullPath=True)
-        if parents:
-            parent = parents[0]
-            if not is_visible(parent,
-                              displayLayer=displayLayer,
-                              intermediateObject=False,
-                              parentHidden=parentHidden,
-                              visibility=visibility):
-                return False
-
-    return True
+from pyblish_magenta.lib import visibility
 
 
 class ValidateModelContent(pyblish.api.InstancePlugin):
@@ -79,7 +20,15 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction]
 
     @classmethod
-    def get_invalid(cls, instance):
+    def iter_invalid(cls, instance):
+        """Yield the invalid nodes in the instance
+
+        Raises:
+            RuntimeError: When the instance holds no nodes to blame,
+                e.g. when it has no top group.
+
+        """
+
         from maya import cmds
 
         # Ensure only valid node types
@@ -90,7 +39,9 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
 
         if invalid:
             cls.log.error("These nodes are not allowed: %s" % invalid)
-            return list(invalid)
+            for node in invalid:
+                yield node
+            return
 
         # Top group
         assemblies = cmds.ls(instance, assemblies=True, long=True)
@@ -100,38 +51,44 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
             if len(assemblies) == 0:
                 cls.log.warning("No top group found. "
                                 "(Are there objects in the instance?)")
-            return assemblies or True
+                raise RuntimeError("Model content has no top group.")
+            for assembly in assemblies:
+                yield assembly
+            return
 
         if not valid:
             cls.log.error("No valid nodes in the instance")
-            return True
+            raise RuntimeError("Model content has no valid nodes.")
+
+        # Ensure at least one shape is visible
+        shapes = cmds.ls(valid, long=True, shapes=True)
 
-        def _is_visible(node):
-            """Return whether node is visible"""
-            return is_visible(node,
-                              displayLayer=False,
-                              intermediateObject=True,
-                              parentHidden=True,
-                              visibility=True)
+        visible = visibility.get(instance.context).visible(
+            assemblies + shapes,
+            displayLayer=False,
+            intermediateObject=True,
+            parentHidden=True,
+            visibility=True)
 
         # The roots must be visible (the assemblies)
         for assembly in assemblies:
-            if not _is_visible(assembly):
+            if not visible[assembly]:
                 cls.log.error("Invisible assembly (root node) is not "
                               "allowed: {0}".format(assembly))
-                invalid.add(assembly)
+                yield assembly
 
-        # Ensure at least one shape is visible
-        shapes = cmds.ls(valid, long=True, shapes=True)
-        if not any(_is_visible(shape) for shape in shapes):
+        if not any(visible[shape] for shape in shapes):
             cls.log.error("No visible shapes in the model instance")
-            invalid.update(shapes)
+            for shape in shapes:
+                yield shape
 
-        return list(invalid)
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise RuntimeError("Model content is invalid. See log.")
@@ -21,23 +21,26 @@ class ValidateNoAnimation(pyblish.api.Validator):
     actions = [SelectInvalidAction]
 
     @staticmethod
-    def get_invalid(instance):
+    def iter_invalid(instance):
         from maya import cmds
 
         nodes = instance[:]
 
         if not nodes:
-            return []
+            return
 
         curves = cmds.keyframe(nodes, q=1, name=True)
         if curves:
-            return list(set(cmds.listConnections(curves)))
+            for node in set(cmds.listConnections(curves)):
+                yield node
 
-        return []
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise RuntimeError("Keyframes found: {0}".format(invalid))
@@ -20,11 +20,17 @@ class ValidateNoDefaultCameras(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction]
 
     @staticmethod
-    def get_invalid(instance):
+    def iter_invalid(instance):
         cameras = cmds.ls(instance, type='camera', long=True)
-        return [cam for cam in cameras if cmds.camera(cam, query=True, startupCamera=True)]
+        for cam in cameras:
+            if cmds.camera(cam, query=True, startupCamera=True):
+                yield cam
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the cameras in the instance"""
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
         assert not invalid, "Default cameras found: {0}".format(invalid)
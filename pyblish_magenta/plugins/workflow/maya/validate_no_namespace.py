@@ -1,6 +1,7 @@
 import pyblish.api
 import pyblish_magenta.api
 import maya.cmds as cmds
+from pyblish_magenta import incremental
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
@@ -26,13 +27,20 @@ class ValidateNoNamespace(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction, RepairAction]
 
     @staticmethod
-    def get_invalid(instance):
+    def iter_invalid(instance):
         nodes = cmds.ls(instance, long=True)
-        return [node for node in nodes if get_namespace(node)]
+        for node in nodes:
+            if get_namespace(node):
+                yield node
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
+    @incremental.skip_unchanged()
     def process(self, instance):
         """Process all the nodes in the instance"""
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Namespaces found: {0}".format(invalid))
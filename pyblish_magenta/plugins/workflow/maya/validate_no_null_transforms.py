@@ -1,5 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
+from pyblish_magenta import stamp
 from pyblish_magenta.action import RepairAction, SelectInvalidAction
 import maya.cmds as cmds
 
@@ -12,16 +13,12 @@ def has_shape_children(node):
     if not allDescendents:
         return False
 
-    # Check if there are any shapes at all
-    shapes = cmds.ls(allDescendents, shapes=True)
+    # Check if there are any shapes that are not intermediateObjects;
+    # if all are intermediate we consider this node a null node.
+    shapes = cmds.ls(allDescendents, shapes=True, noIntermediate=True)
     if not shapes:
         return False
 
-    # Check if all descendent shapes are intermediateObjects;
-    # if so we consider this node a null node and return False.
-    if all(cmds.getAttr('{0}.intermediateObject'.format(x)) for x in shapes):
-        return False
-
     return True
 
 
@@ -44,22 +41,24 @@ class ValidateNoNullTransforms(pyblish.api.InstancePlugin):
     label = 'No Empty/Null Transforms'
     actions = [RepairAction, SelectInvalidAction]
 
-    @staticmethod
-    def get_invalid(instance):
-        """Return invalid transforms in instance"""
+    @classmethod
+    def iter_invalid(cls, instance):
+        """Yield invalid transforms in instance"""
 
         transforms = cmds.ls(instance, type='transform', long=True)
+        transforms = stamp.unstamped(cls, instance, transforms)
 
-        invalid = []
         for transform in transforms:
             if not has_shape_children(transform):
-                invalid.append(transform)
+                yield transform
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the transform nodes in the instance """
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
                 
         if invalid:
             raise ValueError("Empty transforms found: {0}".format(invalid))
@@ -23,12 +23,17 @@ class ValidateNoUnknownNodes(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction]
 
     @staticmethod
-    def get_invalid(instance):
-        return cmds.ls(instance, type='unknown')
+    def iter_invalid(instance):
+        for node in cmds.ls(instance, type='unknown'):
+            yield node
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
         if invalid:
             raise ValueError("Unknown nodes found: {0}".format(invalid))
@@ -1,7 +1,9 @@
 import pyblish.api
 import pyblish_magenta.api
 from maya import cmds
+from pyblish_magenta import incremental
 from pyblish_magenta.action import SelectInvalidAction
+from pyblish_magenta.lib import get_attributes
 
 
 class ValidateNodeNoGhosting(pyblish.api.InstancePlugin):
@@ -25,24 +27,28 @@ class ValidateNodeNoGhosting(pyblish.api.InstancePlugin):
     _attributes = {'ghosting': 0}
 
     @classmethod
-    def get_invalid(cls, instance):
+    def iter_invalid(cls, instance):
 
         # Transforms and shapes seem to have ghosting
         nodes = cmds.ls(instance, long=True, type=['transform', 'shape'])
-        invalid = []
-        for node in nodes:
-            for attr, required_value in cls._attributes.iteritems():
-                if cmds.attributeQuery(attr, node=node, exists=True):
 
-                    value = cmds.getAttr('{0}.{1}'.format(node, attr))
-                    if value != required_value:
-                        invalid.append(node)
+        attrs = list(cls._attributes)
+        table = get_attributes(nodes, attrs)
+
+        for node in nodes:
+            for attr, value in zip(attrs, table[node]):
+                if value is not None and value != cls._attributes[attr]:
+                    yield node
+                    break
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
+    @incremental.skip_unchanged(attributes=list(_attributes))
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Nodes with ghosting enabled found: "
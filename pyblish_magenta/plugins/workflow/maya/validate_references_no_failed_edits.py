@@ -2,6 +2,7 @@ import pyblish.api
 import pyblish_magenta.api
 from maya import cmds
 
+from pyblish_magenta import results, snapshot
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -15,12 +16,7 @@ class RepairFailedEditsAction(pyblish.api.Action):
         self.log.info("Finding bad nodes..")
 
         # Get the errored instances
-        errored_instances = []
-        for result in context.data["results"]:
-            if result["error"] is not None and result["instance"] is not None:
-                if result["error"]:
-                    instance = result["instance"]
-                    errored_instances.append(instance)
+        errored_instances = results.get(context).errored_instances()
 
         # Apply pyblish.logic to get the instances for the plug-in
         instances = pyblish.api.instances_by_plugin(errored_instances, plugin)
@@ -41,6 +37,7 @@ class RepairFailedEditsAction(pyblish.api.Action):
                                removeEdits=True,
                                failedEdits=True,
                                successfulEdits=False)
+        snapshot.invalidate(context)
         self.log.info("Removed failed edits")
 
 
@@ -70,8 +67,8 @@ class ValidateReferencesNoFailedEdits(pyblish.api.InstancePlugin):
     actions = [SelectInvalidAction, RepairFailedEditsAction]
 
     @staticmethod
-    def get_invalid(instance):
-        """Return invalid reference nodes in the instance
+    def iter_invalid(instance):
+        """Yield invalid reference nodes in the instance
 
         Terminology:
             reference node: The node that is the actual reference containing
@@ -82,7 +79,7 @@ class ValidateReferencesNoFailedEdits(pyblish.api.InstancePlugin):
         """
         referenced_nodes = cmds.ls(instance, referencedNodes=True, long=True)
         if not referenced_nodes:
-            return list()
+            return
 
         # Get reference nodes from referenced nodes
         # (note that reference_nodes != referenced_nodes)
@@ -93,21 +90,22 @@ class ValidateReferencesNoFailedEdits(pyblish.api.InstancePlugin):
                 reference_nodes.add(reference_node)
 
         # Check for failed edits on each reference node.
-        invalid = []
         for reference_node in reference_nodes:
             failed_edits = cmds.referenceQuery(reference_node,
                                                editNodes=True,
                                                failedEdits=True,
                                                successfulEdits=False)
             if failed_edits:
-                invalid.append(reference_node)
+                yield reference_node
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Reference nodes found with failed "
@@ -0,0 +1,51 @@
+import pyblish.api
+import pyblish_magenta.api
+from pyblish_magenta import snapshot
+from pyblish_magenta.action import SelectInvalidAction
+from pyblish_magenta.lib import bounds
+
+
+class ValidateSceneDimensions(pyblish.api.InstancePlugin):
+    """Validates Scene isn't too big in size.
+
+    Ensures objects are not positioned in the far corners of the 3D space
+    beyond the "usual" visible realm. (Far is considered as: 100000 units)
+
+    The bounds of groups are checked before those of their children, so
+    the children of groups that are within limits aren't checked at all.
+
+    """
+
+    order = pyblish.api.ValidatorOrder
+    families = ['model']
+    hosts = ['maya']
+    category = 'geometry'
+    optional = True
+    version = (0, 2, 0)
+    label = "Scene Dimensions"
+    actions = [SelectInvalidAction]
+
+    # The far distance threshold
+    __far = 1e5
+
+    @classmethod
+    def iter_invalid(cls, instance):
+        scene = snapshot.get(instance.context)
+        shapes = scene.ls(instance, type='shape')
+        transforms = set(scene.parent(shape) for shape in shapes)
+        transforms.discard(None)
+
+        for node in bounds.iter_exceeding(transforms, cls.__far):
+            yield node
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
+
+    def process(self, instance):
+        """Process all the nodes in the instance"""
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
+
+        if invalid:
+            raise ValueError("Nodes found far away or of big size "
+                             "('{far}'): {0}".format(invalid, far=self.__far))
@@ -2,6 +2,7 @@ import re
 
 import pyblish.api
 import pyblish_magenta.api
+from pyblish_magenta import incremental
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
@@ -69,14 +70,21 @@ class ValidateShapeDefaultNames(pyblish.api.InstancePlugin):
             return False
 
     @classmethod
-    def get_invalid(cls, instance):
+    def iter_invalid(cls, instance):
         shapes = cmds.ls(instance, shapes=True, long=True)
-        return [shape for shape in shapes if not cls._is_valid(shape)]
+        for shape in shapes:
+            if not cls._is_valid(shape):
+                yield shape
+
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
+    @incremental.skip_unchanged()
     def process(self, instance):
         """Process all the shape nodes in the instance"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
         if invalid:
             raise ValueError("Incorrectly named shapes "
                              "found: {0}".format(invalid))
@@ -1,5 +1,9 @@
+import collections
+
 import pyblish.api
 import pyblish_magenta.api
+from pyblish_magenta import incremental, snapshot
+from pyblish_magenta.lib import get_attributes
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
@@ -29,40 +33,65 @@ class ValidateShapeRenderStats(pyblish.api.Validator):
                 'doubleSided': 1,
                 'opposite': 0}
 
-    @staticmethod
-    def get_invalid(instance):
+    @classmethod
+    def get_diff(cls, instance):
+        """Return the render stats differing from their defaults
+
+        All render stats of all shapes are read in a single query.
+
+        Returns:
+            OrderedDict: The differing stats by shape, ordered like the
+                instance, e.g. {"|a_GEOShape": {"opposite": (1, 0)}}
+                with (actual, default) values per attribute.
+
+        """
+
         # It seems the "surfaceShape" and those derived from it have
         # `renderStat` attributes.
-        shapes = cmds.ls(instance, long=True, type='surfaceShape')
-        invalid = []
+        scene = snapshot.get(instance.context)
+        shapes = scene.ls(instance, type='surfaceShape')
+
+        attrs = list(cls.defaults)
+        table = get_attributes(shapes, attrs)
+
+        diff = collections.OrderedDict()
         for shape in shapes:
-            for attr, requiredValue in \
-                    ValidateShapeRenderStats.defaults.iteritems():
+            for attr, value in zip(attrs, table[shape]):
+                default = cls.defaults[attr]
+                if value is not None and value != default:
+                    diff.setdefault(shape, dict())[attr] = (value, default)
+
+        return diff
 
-                if cmds.attributeQuery(attr, node=shape, exists=True):
-                    value = cmds.getAttr('{node}.{attr}'.format(node=shape,
-                                                                attr=attr))
-                    if value != requiredValue:
-                        invalid.append(shape)
+    @classmethod
+    def iter_invalid(cls, instance):
+        for shape in cls.get_diff(instance):
+            yield shape
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
+    @incremental.skip_unchanged(attributes=list(defaults))
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        # Stored for the repair, so it doesn't need to query anew
+        diff = self.get_diff(instance)
+        instance.data["renderStatsDiff"] = diff
 
-        if invalid:
+        if diff:
             raise ValueError("Shapes with non-standard renderStats "
-                             "found: {0}".format(invalid))
+                             "found: {0}".format(list(diff)))
 
-    @staticmethod
-    def repair(instance):
+    @classmethod
+    def repair(cls, instance):
+        """Reset the differing render stats found on validation"""
 
-        for shape in ValidateShapeRenderStats.get_invalid(instance):
-            for attr, default_value in ValidateShapeRenderStats.defaults.iteritems():
+        diff = instance.data.pop("renderStatsDiff", None)
+        if diff is None:
+            diff = cls.get_diff(instance)
 
-                if cmds.attributeQuery(attr, node=shape, exists=True):
-                    plug = '{0}.{1}'.format(shape, attr)
-                    value = cmds.getAttr(plug)
-                    if value != default_value:
-                        cmds.setAttr(plug, default_value)
+        for shape, stats in diff.items():
+            for attr, (_, default) in stats.items():
+                plug = '{0}.{1}'.format(shape, attr)
+                cmds.setAttr(plug, default)
@@ -1,6 +1,7 @@
 import pyblish.api
 import pyblish_magenta.api
 from maya import cmds
+from pyblish_magenta import incremental, stamp
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -58,10 +59,10 @@ class ValidateTransformNamingSuffix(pyblish.api.Validator):
             return False
 
     @classmethod
-    def get_invalid(cls, instance):
+    def iter_invalid(cls, instance):
         transforms = cmds.ls(instance, type='transform', long=True)
+        transforms = stamp.unstamped(cls, instance, transforms)
 
-        invalid = []
         for transform in transforms:
             shapes = cmds.listRelatives(transform,
                                         shapes=True,
@@ -70,14 +71,17 @@ class ValidateTransformNamingSuffix(pyblish.api.Validator):
 
             shape_type = cmds.nodeType(shapes[0]) if shapes else None
             if not cls.is_valid_name(transform, shape_type):
-                invalid.append(transform)
+                yield transform
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
+    @incremental.skip_unchanged(attributes=["intermediateObject"])
     def process(self, instance):
         """Process all the nodes in the instance"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Incorrectly named geometry "
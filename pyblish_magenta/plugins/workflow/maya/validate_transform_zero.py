@@ -2,6 +2,7 @@ import pyblish.api
 import pyblish_magenta.api
 
 from pyblish_magenta.action import SelectInvalidAction
+from pyblish_magenta.lib import arrays, get_attributes
 
 from maya import cmds
 
@@ -13,6 +14,10 @@ class ValidateTransformZero(pyblish.api.Validator):
     as the transforms, rotation and scale values are zero,
     you're all good.
 
+    By default the local matrices of all transforms are read in a single
+    query and compared to the identity matrix at once, disable `bulk` to
+    query and check the transforms one by one.
+
     """
 
     order = pyblish_magenta.api.ValidateContentsOrder
@@ -29,9 +34,11 @@ class ValidateTransformZero(pyblish.api.Validator):
                  0.0, 0.0, 0.0, 1.0]
     _tolerance = 1e-30
 
+    bulk = True
+
     @classmethod
-    def get_invalid(cls, instance):
-        """Returns the invalid transforms in the instance.
+    def iter_invalid(cls, instance):
+        """Yields the invalid transforms in the instance.
 
         This is the same as checking:
         - translate == [0, 0, 0] and rotate == [0, 0, 0] and
@@ -41,26 +48,37 @@ class ValidateTransformZero(pyblish.api.Validator):
             This will also catch camera transforms if those
             are in the instances.
 
-        Returns:
-            list: Transforms that are not identity matrix
+        Yields:
+            str: Transforms that are not identity matrix
 
         """
 
-        transforms = cmds.ls(instance, type="transform")
+        transforms = cmds.ls(instance, type="transform", long=True)
+
+        if cls.bulk:
+            # The local matrix is the same as queried by `cmds.xform`
+            table = get_attributes(transforms, ["matrix"])
+            matrices = [table[transform][0] for transform in transforms]
+            for i in arrays.rows_differing(matrices,
+                                           cls._identity,
+                                           cls._tolerance):
+                yield transforms[i]
+            return
 
-        invalid = []
         for transform in transforms:
             mat = cmds.xform(transform, q=1, matrix=True, objectSpace=True)
             if not all(abs(x-y) < cls._tolerance
                        for x, y in zip(cls._identity, mat)):
-                invalid.append(transform)
+                yield transform
 
-        return invalid
+    @classmethod
+    def get_invalid(cls, instance):
+        return list(cls.iter_invalid(instance))
 
     def process(self, instance):
         """Process all the nodes in the instance "objectSet"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.api.first_invalid(self, instance)
 
         if invalid:
             raise ValueError("Nodes found with transform "
@@ -0,0 +1,415 @@
+"""Profiling of publishing
+
+Records per plug-in and instance the wall time, the amount of calls into
+`maya.cmds` and the peak memory, and writes a report in JSON along with a
+text summary sorted by time once publishing finished.
+
+The peak memory is that allocated through Python whilst processing, as
+traced by `tracemalloc` on Python 3.9 and above. Allocations made by
+Maya itself aren't traced, nor are those of other threads told apart.
+Along with it the high-water mark of the memory of the whole process so
+far is recorded, which only shows which plug-in first reached it.
+
+Profiling is turned on by setting the PYBLISH_MAGENTA_PROFILE environment
+variable to the directory to write the reports to, before plug-ins are
+registered with `pyblish_magenta.register_plugins()`. When not set,
+nothing is registered and publishing isn't affected at all.
+
+Example:
+    $ export PYBLISH_MAGENTA_PROFILE=/tmp/profiles
+    >> import pyblish_magenta
+    >> pyblish_magenta.register_plugins()
+    >> pyblish.util.publish()
+    # Written /tmp/profiles/profile_20151012_101520.json and .txt
+
+"""
+
+import os
+import sys
+import json
+import time
+import inspect
+import logging
+import functools
+
+import pyblish.api
+
+log = logging.getLogger(__name__)
+
+# Environment variable holding the directory to write reports to
+ENV = "PYBLISH_MAGENTA_PROFILE"
+
+# The key under which the profile is stored in `context.data`
+KEY = "profile"
+
+# Total amount of calls into `maya.cmds`, once counting
+_cmds_calls = [0]
+
+# The original functions of `maya.cmds` by name, whilst counting
+_cmds_originals = dict()
+
+# Whether `tracemalloc` was started by `register()`
+_tracing = [False]
+
+# Whether `register()` ran since the last `deregister()`
+_registered = [False]
+
+
+def enabled():
+    """Return whether profiling is turned on"""
+    return bool(os.environ.get(ENV))
+
+
+def register():
+    """Profile all plug-ins discovered from now on
+
+    Discovery filters were added to pyblish-base after 1.4, without them
+    only plug-ins published through `scheduler.publish()` are profiled.
+
+    """
+
+    if hasattr(pyblish.api, "register_discovery_filter"):
+        pyblish.api.register_discovery_filter(discovery_filter)
+    else:
+        log.warning("Discovery filters are unsupported by this version "
+                    "of pyblish-base, only plug-ins published through "
+                    "pyblish_magenta.scheduler are profiled")
+
+    pyblish.api.register_callback("published", on_published)
+    count_cmds()
+    trace_memory()
+
+    _registered[0] = True
+
+
+def deregister():
+    """Stop profiling plug-ins discovered from now on
+
+    Does nothing unless registered through `register()`.
+
+    """
+
+    if not _registered[0]:
+        return
+
+    if hasattr(pyblish.api, "deregister_discovery_filter"):
+        try:
+            pyblish.api.deregister_discovery_filter(discovery_filter)
+        except (KeyError, ValueError):
+            # Not registered
+            pass
+
+    try:
+        pyblish.api.deregister_callback("published", on_published)
+    except (KeyError, ValueError):
+        # Not registered, pyblish-base 1.4 raises KeyError
+        pass
+
+    uncount_cmds()
+    untrace_memory()
+
+    _registered[0] = False
+
+
+def discovery_filter(plugins):
+    for plugin in plugins:
+        profile_plugin(plugin)
+
+
+def on_published(context):
+    write(context, os.environ.get(ENV))
+
+
+def get(context):
+    """Return the profile of `context`, create it if it doesn't exist"""
+    profile = context.data.get(KEY)
+    if profile is None:
+        profile = Profile()
+        context.data[KEY] = profile
+    return profile
+
+
+def profile_plugin(plugin):
+    """Replace `process` of `plugin` by one that is profiled
+
+    Returns:
+        bool: Whether `plugin` is profiled
+
+    """
+
+    if plugin.__dict__.get("__profiled__"):
+        return True
+
+    func = getattr(plugin.process, "__func__", plugin.process)
+    wrapper = _wrapper(func)
+    if wrapper is None:
+        log.warning("Can't profile %s, unsupported arguments" % plugin)
+        return False
+
+    plugin.process = wrapper
+    plugin.__profiled__ = True
+    return True
+
+
+def count_cmds():
+    """Count all calls into `maya.cmds`, when available"""
+    try:
+        from maya import cmds
+    except ImportError:
+        return
+
+    if getattr(cmds, "__profiled__", False):
+        return
+
+    for name, func in list(vars(cmds).items()):
+        if name.startswith("_") or not callable(func):
+            continue
+        _cmds_originals[name] = func
+        setattr(cmds, name, _counted(func))
+
+    cmds.__profiled__ = True
+
+
+def uncount_cmds():
+    """Restore the functions of `maya.cmds` replaced by `count_cmds()`"""
+    try:
+        from maya import cmds
+    except ImportError:
+        return
+
+    if not getattr(cmds, "__profiled__", False):
+        return
+
+    for name, func in _cmds_originals.items():
+        setattr(cmds, name, func)
+
+    _cmds_originals.clear()
+    del cmds.__profiled__
+
+
+def trace_memory():
+    """Trace allocations through Python, when supported"""
+    tracemalloc = _tracemalloc()
+    if tracemalloc is not None and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracing[0] = True
+
+
+def untrace_memory():
+    """Stop tracing allocations, when started by `trace_memory()`"""
+    tracemalloc = _tracemalloc()
+    if tracemalloc is not None and _tracing[0]:
+        tracemalloc.stop()
+        _tracing[0] = False
+
+
+def cmds_calls():
+    """Return the amount of calls made into `maya.cmds` so far"""
+    return _cmds_calls[0]
+
+
+def process_peak_memory():
+    """Return the high-water mark in bytes of the process, if known
+
+    This is the peak memory since the process started, rather than
+    that of any one plug-in.
+
+    """
+
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # In bytes on OSX and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write(context, directory):
+    """Write the report of `context` to `directory`
+
+    Returns:
+        tuple: Paths of the JSON report and the text summary
+
+    """
+
+    profile = get(context)
+
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    name = time.strftime("profile_%Y%m%d_%H%M%S")
+    json_path = os.path.join(directory, name + ".json")
+    text_path = os.path.join(directory, name + ".txt")
+
+    with open(json_path, "w") as f:
+        json.dump(profile.report(), f, indent=2, sort_keys=True)
+
+    with open(text_path, "w") as f:
+        f.write(profile.summary())
+
+    log.info("Written profile to %s" % text_path)
+    return json_path, text_path
+
+
+class Profile(object):
+    """Measurements of a single publish"""
+
+    def __init__(self):
+        self.records = list()
+
+    def add(self, plugin, instance, duration, calls, peak,
+            process_peak=None):
+        self.records.append({
+            "plugin": plugin.__name__,
+            "instance": None if instance is None else str(instance),
+            "duration": duration,
+            "cmdsCalls": calls,
+            "peakMemory": peak,
+            "processPeakMemory": process_peak,
+        })
+
+    def plugins(self):
+        """Return totals per plug-in, slowest first"""
+        totals = dict()
+        for record in self.records:
+            total = totals.setdefault(record["plugin"], {
+                "plugin": record["plugin"],
+                "duration": 0.0,
+                "cmdsCalls": 0,
+                "count": 0,
+            })
+            total["duration"] += record["duration"]
+            total["cmdsCalls"] += record["cmdsCalls"] or 0
+            total["count"] += 1
+
+        return sorted(totals.values(),
+                      key=lambda total: total["duration"],
+                      reverse=True)
+
+    def report(self):
+        """Return the full report as JSON-compatible dict"""
+        return {
+            "plugins": self.plugins(),
+            "records": sorted(self.records,
+                              key=lambda record: record["duration"],
+                              reverse=True),
+        }
+
+    def summary(self):
+        """Return text summary of the report, slowest first"""
+        lines = ["%-40s %10s %8s %10s" % ("Plug-in", "Time (s)",
+                                          "Count", "cmds"), ""]
+        for total in self.plugins():
+            lines.append("%-40s %10.3f %8i %10i" % (
+                total["plugin"], total["duration"],
+                total["count"], total["cmdsCalls"]))
+
+        lines += ["", "%-40s %-20s %10s %10s %12s %14s" % (
+            "Plug-in", "Instance", "Time (s)", "cmds",
+            "Peak (MB)", "Process (MB)"), ""]
+
+        for record in self.report()["records"]:
+            lines.append("%-40s %-20s %10.3f %10i %12s %14s" % (
+                record["plugin"], record["instance"] or "",
+                record["duration"], record["cmdsCalls"] or 0,
+                _megabytes(record["peakMemory"]),
+                _megabytes(record.get("processPeakMemory"))))
+
+        return "\n".join(lines) + "\n"
+
+
+def _megabytes(size):
+    return "" if size is None else "%.1f" % (size / 1024.0 ** 2)
+
+
+def _tracemalloc():
+    """Return `tracemalloc` when it can measure peaks per plug-in"""
+    try:
+        import tracemalloc
+    except ImportError:
+        # Python 2
+        return None
+
+    # Resetting the peak was added in Python 3.9
+    if not hasattr(tracemalloc, "reset_peak"):
+        return None
+
+    return tracemalloc
+
+
+def _counted(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _cmds_calls[0] += 1
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _call(func, self, context, instance, args):
+    tracemalloc = _tracemalloc()
+    tracing = tracemalloc is not None and tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+
+    calls = cmds_calls()
+    start = time.time()
+    try:
+        return func(self, *args)
+    finally:
+        duration = time.time() - start
+        peak = tracemalloc.get_traced_memory()[1] if tracing else None
+        if context is not None:
+            get(context).add(type(self), instance, duration,
+                             cmds_calls() - calls, peak,
+                             process_peak_memory())
+
+
+def _wrapper(func):
+    """Return profiled `func`, with the same arguments
+
+    Pyblish determines what to process by the names of
+    the arguments of `process`, thus they are kept intact.
+
+    """
+
+    try:
+        arguments = inspect.getfullargspec(func).args
+    except AttributeError:
+        # Python 2
+        arguments = inspect.getargspec(func).args
+
+    arguments = tuple(arguments[1:])
+
+    if arguments == ("instance",):
+        def process(self, instance):
+            return _call(func, self, instance.context, instance,
+                         (instance,))
+
+    elif arguments == ("context",):
+        def process(self, context):
+            return _call(func, self, context, None, (context,))
+
+    elif arguments == ("context", "instance"):
+        def process(self, context, instance):
+            return _call(func, self, context, instance,
+                         (context, instance))
+
+    elif arguments == ("instance", "context"):
+        def process(self, instance, context):
+            return _call(func, self, context, instance,
+                         (instance, context))
+
+    elif arguments == ():
+        def process(self):
+            return _call(func, self, None, None, ())
+
+    else:
+        return None
+
+    process.__name__ = func.__name__
+    process.__doc__ = func.__doc__
+    return process
@@ -0,0 +1,109 @@
+"""Index of the results of the current publish
+
+Plug-ins and actions looking for errors used to scan the full
+`context.data["results"]` list, once per instance. With hundreds of
+instances and dozens of plug-ins that is quadratic overall.
+
+The index groups the results by instance and by plug-in and is stored on
+the context, such that each result is only looked at once per publish.
+Results appended after the index was built are added on the next lookup.
+
+Example:
+    >> from pyblish_magenta import results
+    >> if results.get(context).has_error(instance):
+    ..     raise RuntimeError("Errors present for %s" % instance)
+
+"""
+
+# The key under which the index is stored in `context.data`
+KEY = "resultsIndex"
+
+
+def get(context):
+    """Return the up-to-date results index of `context`
+
+    Arguments:
+        context (pyblish.api.Context): Context of the current publish
+
+    Returns:
+        ResultsIndex: The index of `context.data["results"]`
+
+    """
+
+    results = context.data.get("results")
+    if results is None:
+        results = list()
+        context.data["results"] = results
+
+    index = context.data.get(KEY)
+    if index is None or not index.indexes(results):
+        index = ResultsIndex(results)
+        context.data[KEY] = index
+
+    index.update()
+    return index
+
+
+class ResultsIndex(object):
+    """Results grouped by instance and by plug-in
+
+    Instances are compared by identity, as with `is`, since
+    Pyblish instances are lists and as such can't be hashed.
+
+    Arguments:
+        results (list): The results of a publish, the index
+            keeps track of results appended to it later on.
+
+    """
+
+    def __init__(self, results):
+        self._results = results
+        self._count = 0
+
+        self._by_instance = dict()
+        self._by_plugin = dict()
+
+        # Instances with errors, in order of their first error
+        self._errored = dict()
+        self._errored_order = list()
+
+    def indexes(self, results):
+        """Return whether this is the index of `results`"""
+        return results is self._results and len(results) >= self._count
+
+    def update(self):
+        """Add results appended since the last update"""
+        for result in self._results[self._count:]:
+            self._add(result)
+        self._count = len(self._results)
+
+    def by_instance(self, instance):
+        """Return the results of `instance`"""
+        return list(self._by_instance.get(id(instance), ()))
+
+    def by_plugin(self, plugin):
+        """Return the results of `plugin`"""
+        return list(self._by_plugin.get(plugin, ()))
+
+    def has_error(self, instance):
+        """Return whether any plug-in failed on `instance`"""
+        return id(instance) in self._errored
+
+    def errored_instances(self):
+        """Return all instances with errors, in order of their first error"""
+        return list(self._errored_order)
+
+    def _add(self, result):
+        instance = result["instance"]
+        self._by_plugin.setdefault(result["plugin"], []).append(result)
+
+        if instance is None:
+            # The result of a context plug-in
+            return
+
+        key = id(instance)
+        self._by_instance.setdefault(key, []).append(result)
+
+        if result["error"] and key not in self._errored:
+            self._errored[key] = instance
+            self._errored_order.append(instance)
@@ -0,0 +1,213 @@
+"""Publishing with thread-safe plug-ins processed in parallel
+
+Plug-ins that don't depend on the host, such as those writing metadata
+or validating instance data, can declare themselves thread-safe.
+
+    class ExtractMetadata(pyblish_magenta.api.Extractor):
+        threadsafe = True
+
+`publish()` processes the instances of such plug-ins on a pool of
+worker threads, whilst all other plug-ins keep running on the calling
+thread, which for Maya has to be the main thread.
+
+Processing remains ordered as follows:
+    - An instance is processed by a plug-in only once all plug-ins
+      before it have finished processing that instance.
+    - Plug-ins processing the context wait for all previous work.
+    - All work of one stage, e.g. validation, finishes before the
+      next stage starts. As such the registered test sees all errors
+      up to the stage it is evaluated for.
+
+Results are added to `context.data["results"]` like `pyblish.util`
+does, only possibly in a different order across instances.
+
+"""
+
+import logging
+import threading
+import multiprocessing.pool
+
+import pyblish.api
+import pyblish.logic
+import pyblish.plugin
+
+from . import profiler
+
+log = logging.getLogger(__name__)
+
+
+def is_threadsafe(plugin):
+    """Return whether `plugin` may process instances off the main thread"""
+    return getattr(plugin, "threadsafe", False)
+
+
+def publish(context=None, plugins=None, processes=None):
+    """Publish, processing thread-safe plug-ins in parallel
+
+    Arguments:
+        context (Context, optional): Context, defaults to
+            creating a new context
+        plugins (list, optional): Plug-ins to process,
+            defaults to results of discover()
+        processes (int, optional): Amount of worker threads,
+            defaults to the amount of CPUs
+
+    Returns:
+        Context: The context processed by the plug-ins
+
+    Usage:
+        >> context = publish()
+
+    """
+
+    context = context if context is not None else pyblish.api.Context()
+    plugins = plugins if plugins is not None else pyblish.api.discover()
+
+    # Without discovery filters, see `profiler.register()`
+    if profiler.enabled():
+        profiler.discovery_filter(plugins)
+
+    scheduler = Scheduler(context, processes)
+    try:
+        scheduler.run(plugins)
+    finally:
+        scheduler.close()
+
+    pyblish.api.emit("published", context=context)
+
+    return context
+
+
+class Scheduler(object):
+    """Process plug-ins on the main thread and a pool of worker threads
+
+    Arguments:
+        context (Context): Context to process
+        processes (int, optional): Amount of worker threads,
+            defaults to the amount of CPUs
+
+    """
+
+    def __init__(self, context, processes=None):
+        self.context = context
+        self.processes = processes
+
+        self._pool = None
+
+        # Work submitted to the pool as (instance, result) pairs,
+        # in order of submission
+        self._pending = list()
+        self._orders_with_error = list()
+
+        if "results" not in context.data:
+            context.data["results"] = list()
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.pool.ThreadPool(self.processes)
+        return self._pool
+
+    def run(self, plugins):
+        """Process `plugins` in order"""
+
+        test = pyblish.logic.registered_test()
+        stage = None
+
+        for plugin in plugins:
+            if not plugin.active:
+                continue
+
+            if int(plugin.order) != stage:
+                stage = int(plugin.order)
+                self.wait()
+            else:
+                self.collect()
+
+            message = test(nextOrder=plugin.order,
+                           ordersWithError=self._orders_with_error)
+            if message:
+                log.warning("Stopped due to: %s" % message)
+                break
+
+            if not plugin.__instanceEnabled__:
+                self.wait()
+                self._record(self._process(plugin, None))
+                continue
+
+            for instance in pyblish.api.instances_by_plugin(self.context,
+                                                            plugin):
+                if instance.data.get("publish") is False:
+                    continue
+
+                if is_threadsafe(plugin):
+                    self.submit(plugin, instance)
+                else:
+                    self.wait(instance)
+                    self._record(self._process(plugin, instance))
+
+        self.wait()
+
+    def submit(self, plugin, instance):
+        """Process `instance` with `plugin` on a worker thread"""
+
+        # Work is taken from the pool in order of submission, so any
+        # previous work on the instance has started by the time this
+        # work starts, and waiting for it can't lock up the pool.
+        previous = None
+        for pending_instance, pending in reversed(self._pending):
+            if pending_instance is instance:
+                previous = pending
+                break
+
+        pending = self.pool.apply_async(self._process_after,
+                                        (previous, plugin, instance))
+        self._pending.append((instance, pending))
+
+    def wait(self, instance=None):
+        """Wait for the pending work on `instance`, or all work"""
+        for pending_instance, pending in list(self._pending):
+            if instance is None or pending_instance is instance:
+                self._record(pending.get())
+                self._pending.remove((pending_instance, pending))
+
+    def collect(self):
+        """Store the results of finished work without waiting"""
+        for pending_instance, pending in list(self._pending):
+            if pending.ready():
+                self._record(pending.get())
+                self._pending.remove((pending_instance, pending))
+
+    def close(self):
+        """Stop the worker threads once all pending work is done"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _process_after(self, previous, plugin, instance):
+        if previous is not None:
+            previous.wait()
+        return self._process(plugin, instance)
+
+    def _process(self, plugin, instance):
+        result = pyblish.plugin.process(plugin, self.context, instance)
+
+        # Log records are captured through the root logger and
+        # thus include those of work done on other threads.
+        thread = threading.current_thread().ident
+        result["records"] = [record for record in result["records"]
+                             if record.thread == thread]
+
+        return result
+
+    def _record(self, result):
+        """Add `result` to the results of the context, on the main thread"""
+        results = self.context.data["results"]
+
+        # Depending on its version, Pyblish stores the result itself
+        if not any(existing is result for existing in reversed(results)):
+            results.append(result)
+
+        if result["error"] is not None:
+            self._orders_with_error.append(result["plugin"].order)
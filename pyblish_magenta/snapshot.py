@@ -0,0 +1,222 @@
+"""Per-publish snapshot of the collected scene
+
+Many validators query the same information for the same nodes, for example
+`cmds.ls(instance, type="mesh", long=True)` followed by a `polyEvaluate` per
+mesh. On large instances this redundant querying dominates publishing time.
+
+The snapshot gathers node types, parent/child links, shapes and basic mesh
+statistics once per publish and stores them on the context so all plug-ins
+can share the results.
+
+Example:
+    >> from pyblish_magenta import snapshot
+    >> scene = snapshot.get(instance.context)
+    >> for mesh in scene.ls(instance, type="mesh"):
+    ..     stats = scene.mesh_stats(mesh)
+
+Note:
+    The snapshot assumes the scene doesn't change whilst validating.
+    Anything that alters the scene (like `RepairAction`) must call
+    `invalidate()` so the next plug-in queries the scene anew.
+
+"""
+
+# The key under which the snapshot is stored in `context.data`
+KEY = "sceneSnapshot"
+
+# Statistics gathered per mesh by `Snapshot.mesh_stats()`
+MESH_STATS = ("vertex", "edge", "face", "uvcoord")
+
+# Pseudo node type used to cache the intermediate objects
+INTERMEDIATE = "intermediateObject"
+
+
+def get(context):
+    """Return the snapshot for `context`, create it if it doesn't exist
+
+    Arguments:
+        context (pyblish.api.Context): Context of the current publish
+
+    Returns:
+        Snapshot: The snapshot shared by all plug-ins of this publish
+
+    """
+
+    scene = context.data.get(KEY)
+    if scene is None:
+        scene = Snapshot()
+        context.data[KEY] = scene
+
+    return scene
+
+
+def invalidate(context):
+    """Discard the snapshot of `context`
+
+    The next call to `get()` creates a new snapshot
+    so the scene is queried anew.
+
+    """
+
+    context.data.pop(KEY, None)
+
+
+class Snapshot(object):
+    """Cached view on the nodes of a publish
+
+    All nodes are stored by their long names. Node types are queried with a
+    single `maya.cmds.ls` call per type for all nodes known to the snapshot,
+    so type inheritance (e.g. "joint" is a "transform") matches Maya.
+
+    Parent and child relationships are derived from the long names and only
+    span the nodes known to the snapshot, which for instances collected by
+    `CollectInstances` includes their full hierarchy.
+
+    """
+
+    def __init__(self):
+        from maya import cmds
+        self._cmds = cmds
+
+        self._nodes = set()     # long names of all known nodes
+        self._members = dict()  # id(nodes) -> (nodes, long names)
+        self._types = dict()    # node type -> set of long names
+        self._children = None   # parent -> list of children
+        self._stats = dict()    # mesh -> statistics
+        self._node_types = dict()  # long name -> exact node type
+
+    def members(self, nodes):
+        """Return the long names of `nodes`
+
+        The result is cached by the identity of `nodes`,
+        e.g. an instance is resolved only once per publish.
+
+        """
+
+        key = id(nodes)
+        cached = self._members.get(key)
+
+        # The original object is kept alongside the result so its id()
+        # can't be reused by another object during the publish.
+        if cached is not None and cached[0] is nodes:
+            return cached[1]
+
+        members = tuple(self._cmds.ls(list(nodes), long=True)) if nodes else ()
+        self._members[key] = (nodes, members)
+        self._index(members)
+
+        return members
+
+    def ls(self, nodes, type=None, noIntermediate=False):
+        """Return long names of `nodes` of `type`
+
+        This is the equivalent of `cmds.ls(nodes, type=type, long=True)`.
+
+        Arguments:
+            nodes (list): Nodes to filter, e.g. an instance
+            type (str or tuple, optional): Node type(s) to filter by
+            noIntermediate (bool, optional): Exclude intermediate objects
+
+        """
+
+        members = self.members(nodes)
+
+        if type is not None:
+            types = type if isinstance(type, (list, tuple)) else (type,)
+            matches = set()
+            for node_type in types:
+                matches.update(self._of_type(node_type))
+            members = [node for node in members if node in matches]
+
+        if noIntermediate:
+            intermediates = self._of_type(INTERMEDIATE)
+            members = [node for node in members if node not in intermediates]
+
+        return list(members)
+
+    def node_types(self, nodes):
+        """Return the exact node type of each of `nodes`
+
+        Returns:
+            dict: Node type by long name, e.g. {"|a_GEO": "transform"}
+
+        """
+
+        members = self.members(nodes)
+
+        missing = [node for node in members if node not in self._node_types]
+        if missing:
+            listed = self._cmds.ls(missing, showType=True, long=True) or []
+            self._node_types.update(zip(listed[::2], listed[1::2]))
+
+        return dict((node, self._node_types.get(node)) for node in members)
+
+    def parent(self, node):
+        """Return the parent of `node` or None for root nodes"""
+        parent = node.rsplit("|", 1)[0]
+        return parent or None
+
+    def children(self, node):
+        """Return the known children of `node`"""
+        if self._children is None:
+            children = dict()
+            for child in self._nodes:
+                children.setdefault(self.parent(child), list()).append(child)
+            self._children = children
+
+        return list(self._children.get(node, []))
+
+    def shapes(self, node):
+        """Return the known shapes directly below `node`"""
+        shapes = self._of_type("shape")
+        return [child for child in self.children(node) if child in shapes]
+
+    def mesh_stats(self, mesh):
+        """Return basic statistics of `mesh`
+
+        Returns:
+            dict: Component counts by the names in `MESH_STATS`
+
+        """
+
+        stats = self._stats.get(mesh)
+        if stats is None:
+            flags = dict((stat, True) for stat in MESH_STATS)
+            stats = self._cmds.polyEvaluate(mesh, **flags)
+            self._stats[mesh] = stats
+
+        return stats
+
+    def _of_type(self, node_type):
+        """Return the set of known nodes of `node_type`"""
+        nodes = self._types.get(node_type)
+        if nodes is None:
+            nodes = self._ls_type(self._nodes, node_type)
+            self._types[node_type] = nodes
+        return nodes
+
+    def _ls_type(self, nodes, node_type):
+        if not nodes:
+            return set()
+
+        if node_type == INTERMEDIATE:
+            nodes = self._cmds.ls(list(nodes),
+                                  intermediateObjects=True,
+                                  long=True)
+        else:
+            nodes = self._cmds.ls(list(nodes), type=node_type, long=True)
+
+        return set(nodes)
+
+    def _index(self, members):
+        """Add `members` to the known nodes"""
+        new = set(members) - self._nodes
+        if not new:
+            return
+
+        self._nodes.update(new)
+        self._children = None
+
+        # Keep the already queried types up to date
+        for node_type, nodes in self._types.items():
+            nodes.update(self._ls_type(new, node_type))
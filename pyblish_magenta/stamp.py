@@ -0,0 +1,261 @@
+"""Validation stamps of published files
+
+Published files are validated before they're published, yet once
+referenced into another scene, e.g. a model into a rig, the validators
+check all of their nodes again. A validation stamp records which
+validators, at which version, passed on a published file, such that
+validators can skip the nodes of references to files they passed on
+before.
+
+The stamp is written to a sidecar file next to each extracted file,
+e.g. "ben_model.ma.validation.json", holding the hash of the file and
+the validators that passed. A stamp is only trusted when the hash still
+matches the referenced file, and by validators of the same version.
+Nodes with reference edits, e.g. attributes set or connected in the
+referencing scene, are always validated, as are validators depending on
+the transforms or parents of nodes, which may change without editing
+the node itself.
+
+Example:
+    >> meshes = snapshot.get(instance.context).ls(instance, type="mesh")
+    >> meshes = stamp.unstamped(cls, instance, meshes)
+
+Skipping stamped references is turned on by setting the
+PYBLISH_MAGENTA_STAMPS environment variable to "1".
+
+"""
+
+import os
+import json
+import hashlib
+
+import pyblish.api
+
+from . import cache, results, snapshot
+
+# Environment variable to turn skipping stamped references on
+ENV = "PYBLISH_MAGENTA_STAMPS"
+
+# The key under which the stamps are stored in `context.data`
+KEY = "validationStamps"
+
+# Appended to the path of a file to get the path of its stamp
+SUFFIX = ".validation.json"
+
+
+def enabled():
+    """Return whether nodes of stamped references are skipped"""
+    return os.environ.get(ENV, "0") == "1"
+
+
+def get(context):
+    """Return the stamps of the references of `context`
+
+    Like the scene snapshot it assumes the scene doesn't change whilst
+    validating, it's discarded along with the snapshot.
+
+    Returns:
+        Stamps: The stamps shared by all plug-ins of this publish
+
+    """
+
+    scene = snapshot.get(context)
+
+    stamps = context.data.get(KEY)
+    if stamps is None or stamps.scene is not scene:
+        stamps = Stamps(scene)
+        context.data[KEY] = stamps
+
+    return stamps
+
+
+def unstamped(plugin, instance, nodes):
+    """Return `nodes` of `instance` still to be validated by `plugin`
+
+    Nodes of references to files stamped as passed by `plugin`
+    are left out, when turned on through `enabled()`. Nodes with
+    successful reference edits are never left out.
+
+    Arguments:
+        plugin (pyblish.api.Plugin): The validator
+        instance (pyblish.api.Instance): The instance being validated
+        nodes (list): Long names of the nodes to validate
+
+    """
+
+    if not enabled():
+        return list(nodes)
+
+    return get(instance.context).unstamped(plugin, nodes)
+
+
+def sidecar(path):
+    """Return the path of the stamp of the file at `path`"""
+    return path + SUFFIX
+
+
+def file_hash(path, chunk_size=1024 ** 2):
+    """Return the hex digest of the contents of the file at `path`"""
+    hasher = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def passed_validators(instance):
+    """Return the versions of the validators that passed on `instance`
+
+    Returns:
+        dict: Version by name of the validator, e.g.
+            {"ValidateMeshHasUVs": [0, 1, 0]}
+
+    """
+
+    passed = dict()
+    for result in results.get(instance.context).by_instance(instance):
+        plugin = result["plugin"]
+        if not (pyblish.api.ValidatorOrder <= plugin.order <
+                pyblish.api.ExtractorOrder):
+            continue
+
+        if result["error"] is None:
+            passed[plugin.__name__] = _version(plugin)
+
+    return passed
+
+
+def write(path, validators):
+    """Stamp the file at `path` as passed by `validators`
+
+    Arguments:
+        path (str): Path to the validated file
+        validators (dict): Versions by name, see `passed_validators()`
+
+    Returns:
+        str: Path to the written stamp
+
+    """
+
+    stamp = {
+        "hash": file_hash(path),
+        "validators": validators,
+    }
+
+    value = json.dumps(stamp, indent=2, sort_keys=True)
+    cache.write_atomic(sidecar(path), value.encode("utf-8"))
+
+    return sidecar(path)
+
+
+def read(path):
+    """Return the validators the file at `path` passed, if still valid
+
+    Returns:
+        dict or None: Versions by name of the validators, None when the
+            file isn't stamped or changed since it was stamped.
+
+    """
+
+    try:
+        with open(sidecar(path)) as f:
+            stamp = json.load(f)
+        current = file_hash(path)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if stamp.get("hash") != current:
+        return None
+
+    return stamp.get("validators") or dict()
+
+
+class Stamps(object):
+    """The validation stamps of all references in the scene
+
+    The referenced files and edited nodes are queried once per
+    reference and each file is read and hashed at most once.
+
+    Arguments:
+        scene (snapshot.Snapshot, optional): The snapshot of the scene
+            the stamps are valid for
+
+    """
+
+    def __init__(self, scene=None):
+        self.scene = scene
+
+        self._files = None      # long name of unedited node -> file
+        self._stamps = dict()   # referenced file -> validators or None
+
+    def unstamped(self, plugin, nodes):
+        """Return `nodes` not in references stamped as passed by `plugin`"""
+        if self._files is None:
+            self._files = _referenced_files()
+
+        name = plugin.__name__
+        version = _version(plugin)
+
+        remaining = list()
+        for node in nodes:
+            path = self._files.get(node)
+            if path is not None:
+                if path not in self._stamps:
+                    self._stamps[path] = read(path)
+
+                validators = self._stamps[path]
+                if validators and validators.get(name, False) == version:
+                    continue
+
+            remaining.append(node)
+
+        return remaining
+
+
+def _version(plugin):
+    """Return version of `plugin` as stored in the stamp"""
+    version = getattr(plugin, "version", None)
+    return list(version) if version is not None else None
+
+
+def _referenced_files():
+    """Return the referenced file of all unedited referenced nodes
+
+    Nodes with successful reference edits differ from the referenced
+    file and are left out.
+
+    Returns:
+        dict: Referenced file by long name of the node
+
+    """
+
+    from maya import cmds
+
+    files = dict()
+    for reference in cmds.ls(type="reference") or []:
+        try:
+            path = cmds.referenceQuery(reference,
+                                       filename=True,
+                                       withoutCopyNumber=True)
+            nodes = cmds.referenceQuery(reference, nodes=True, dagPath=True)
+            edited = cmds.referenceQuery(reference,
+                                         editNodes=True,
+                                         successfulEdits=True,
+                                         failedEdits=False)
+        except RuntimeError:
+            # Not associated with a file, e.g. "sharedReferenceNode"
+            continue
+
+        # Edited plugs are returned as "node.attribute", and `cmds.ls()`
+        # lists all nodes of the scene when given none.
+        edited = [node.split(".", 1)[0] for node in edited or []]
+        edited = set(cmds.ls(edited, long=True) or []) if edited else set()
+
+        if not nodes:
+            continue
+
+        for node in cmds.ls(nodes, long=True) or []:
+            if node not in edited:
+                files[node] = path
+
+    return files
@@ -1,7 +1,5 @@
 """These only run once for tests in this package"""
 
-from maya import cmds
-
 
 def setup():
     # Import pymel, as opposed to maya.standalone.initialise()
@@ -19,5 +17,6 @@ def teardown():
     # Maya throws a segmentation fault unless
     # we run the following little hack.
     # https://goo.gl/4oTQ2d
+    from maya import cmds
     cmds.file(new=True, force=True)
     # os._exit(0)
@@ -0,0 +1,32 @@
+"""Stand-in for mayapy running `pyblish_magenta/alembic_worker.py`
+
+Writes the scene and job string to the file of each job, instead of
+exporting an Alembic. Jobs with the root "|fail_GRP" fail.
+
+Usage:
+    $ python fake_mayapy.py alembic_worker.py scene.mb "-root |a -file a.abc"
+
+"""
+
+import os
+import sys
+import shlex
+
+
+def main(script, scene, *jobs):
+    assert os.path.exists(script), "Worker script not found: %s" % script
+    assert os.path.exists(scene), "Scene not found: %s" % scene
+
+    for job in jobs:
+        args = shlex.split(job)
+        if "|fail_GRP" in args:
+            sys.stderr.write("Failed to export: %s\n" % job)
+            sys.exit(1)
+
+        path = args[args.index("-file") + 1]
+        with open(path, "w") as f:
+            f.write(job)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,441 @@
+"""Pure-Python stand-in for `maya.cmds`
+
+Implements the subset of commands used by the library functions of
+Pyblish Magenta on a tiny in-memory scene and counts every call made,
+such that tests can assert on the amount of round-trips through the
+command layer without running Maya.
+
+Example:
+    >> cmds = MockCmds()
+    >> cmds.create("|ben_GRP", "transform")
+    >> cmds.create("|ben_GRP|ben_GEO", "transform")
+    >> cmds.create("|ben_GRP|ben_GEO|ben_GEOShape", "mesh")
+    >> with mocked(cmds):
+    ..     do_things()
+    >> cmds.calls["ls"]
+    1
+
+"""
+
+import sys
+import types
+import collections
+import contextlib
+
+
+# Node types and the types they inherit from, as `cmds.ls(type=...)` matches
+# inherited types too.
+INHERITANCE = {
+    "transform": ("dagNode", "transform"),
+    "joint": ("dagNode", "transform", "joint"),
+    "mesh": ("dagNode", "shape", "surfaceShape", "controlPoint",
+             "deformableShape", "mesh"),
+    "nurbsCurve": ("dagNode", "shape", "controlPoint", "deformableShape",
+                   "curveShape", "nurbsCurve"),
+    "camera": ("dagNode", "shape", "camera"),
+    "objectSet": ("objectSet",),
+    "displayLayer": ("displayLayer",),
+}
+
+# Attributes (with their defaults) available on all nodes of a given type
+ATTRIBUTES = {
+    "dagNode": {"visibility": True,
+                "overrideEnabled": False,
+                "overrideVisibility": True,
+                "ghosting": False},
+    "transform": {"matrix": [1.0, 0.0, 0.0, 0.0,
+                             0.0, 1.0, 0.0, 0.0,
+                             0.0, 0.0, 1.0, 0.0,
+                             0.0, 0.0, 0.0, 1.0]},
+    "shape": {"intermediateObject": False},
+    "surfaceShape": {"castsShadows": True,
+                     "receiveShadows": True,
+                     "motionBlur": True,
+                     "primaryVisibility": True,
+                     "smoothShading": True,
+                     "visibleInReflections": True,
+                     "visibleInRefractions": True,
+                     "doubleSided": True,
+                     "opposite": False},
+}
+
+
+class MockNode(object):
+    def __init__(self, name, node_type):
+        self.name = name
+        self.type = node_type
+        self.types = INHERITANCE.get(node_type, (node_type,))
+        self.attrs = dict()
+        for inherited in self.types:
+            self.attrs.update(ATTRIBUTES.get(inherited, {}))
+        self.stats = dict()
+
+        # Vertices converted to by `polyListComponentConversion` per
+        # component type, e.g. {"e": ["mesh.vtx[0:3]"]}, defaults to all
+        self.vertices = dict()
+
+        # World space bounds of the node itself, excluding its children
+        self.bounds = None
+
+        # Vertices per face as returned by `polyInfo(faceToVertex=True)`
+        self.faces = None
+
+
+def _counted(func):
+    def wrapper(self, *args, **kwargs):
+        self.calls[func.__name__] += 1
+        return func(self, *args, **kwargs)
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+class MockCmds(object):
+    """Stand-in for `maya.cmds` that counts its calls
+
+    Attributes:
+        calls (collections.Counter): Number of calls per command
+
+    """
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.nodes = collections.OrderedDict()
+        self.playback = (1.0, 10.0)
+        self.exports = list()
+        self.selection = list()
+
+        # Components returned by `polyInfo` per query flag, as Maya
+        # returns them, e.g. {"laminaFaces": ["pCube1.f[3]"]}
+        self.poly_info = dict()
+
+        # Referenced file and long names of the nodes per reference node
+        self.references = collections.OrderedDict()
+
+        # Nodes with successful reference edits per reference node
+        self.edits = dict()
+
+    # Scene construction (not counted)
+
+    def create(self, name, node_type, **attrs):
+        """Add node of long `name` and `node_type` to the scene"""
+        node = MockNode(name, node_type)
+        node.attrs.update(attrs)
+        self.nodes[name] = node
+        return node
+
+    def create_mesh(self, name, vertex=8, edge=12, face=6, uvcoord=14,
+                    **attrs):
+        """Add a mesh with the given component counts to the scene"""
+        node = self.create(name, "mesh", **attrs)
+        node.stats.update(vertex=vertex, edge=edge,
+                          face=face, uvcoord=uvcoord)
+        return node
+
+    def reset(self):
+        """Reset the call counts"""
+        self.calls.clear()
+
+    def total(self):
+        """Return the total amount of calls made"""
+        return sum(self.calls.values())
+
+    def node(self, name):
+        """Return MockNode by long, partial or short `name`"""
+        if name in self.nodes:
+            return self.nodes[name]
+
+        for long_name, node in self.nodes.items():
+            if long_name.endswith("|" + name):
+                return node
+
+        raise ValueError("No object matches name: %s" % name)
+
+    # Commands
+
+    @_counted
+    def ls(self, *args, **kwargs):
+        long = kwargs.get("long", kwargs.get("l", False))
+        node_types = kwargs.get("type", kwargs.get("typ"))
+        if node_types is not None and not isinstance(node_types,
+                                                     (list, tuple)):
+            node_types = (node_types,)
+
+        if node_types is not None and "reference" in node_types:
+            return list(self.references)
+
+        if args:
+            names = args[0]
+            if not isinstance(names, (list, tuple)):
+                names = [names]
+
+            # Return in scene order, like Maya does
+            selected = set()
+            for name in names:
+                try:
+                    selected.add(self.node(name).name)
+                except ValueError:
+                    continue
+
+            if kwargs.get("dag"):
+                selected.update(
+                    name for name in self.nodes
+                    if any(name.startswith(parent + "|")
+                           for parent in selected)
+                )
+            nodes = [node for name, node in self.nodes.items()
+                     if name in selected]
+        else:
+            nodes = list(self.nodes.values())
+
+        result = list()
+        for node in nodes:
+            if node_types and not any(t in node.types for t in node_types):
+                continue
+            if kwargs.get("shapes") and "shape" not in node.types:
+                continue
+            if kwargs.get("noIntermediate") and \
+                    node.attrs.get("intermediateObject"):
+                continue
+            if kwargs.get("intermediateObjects") and \
+                    not node.attrs.get("intermediateObject"):
+                continue
+
+            name = node.name if long else node.name.rsplit("|", 1)[-1]
+            result.append(name)
+            if kwargs.get("showType"):
+                result.append(node.type)
+
+        return result
+
+    @_counted
+    def listRelatives(self, nodes, **kwargs):
+        if not isinstance(nodes, (list, tuple)):
+            nodes = [nodes]
+        full_path = kwargs.get("fullPath", False)
+
+        result = list()
+        for name in nodes:
+            path = self.node(name).name
+            if kwargs.get("parent"):
+                parent = path.rsplit("|", 1)[0]
+                if parent:
+                    result.append(parent)
+                continue
+
+            prefix = path + "|"
+            for child in self.nodes.values():
+                if not child.name.startswith(prefix):
+                    continue
+                if not kwargs.get("allDescendents") and \
+                        "|" in child.name[len(prefix):]:
+                    continue
+                if kwargs.get("shapes") and "shape" not in child.types:
+                    continue
+                result.append(child.name)
+
+        if not full_path:
+            result = [name.rsplit("|", 1)[-1] for name in result]
+
+        return result or None
+
+    @_counted
+    def referenceQuery(self, reference, filename=False, nodes=False,
+                       **kwargs):
+        if self.references.get(reference) is None:
+            raise RuntimeError("No reference node: %s" % reference)
+
+        path, members = self.references[reference]
+        if kwargs.get("editNodes"):
+            return list(self.edits.get(reference, []))
+        if filename:
+            return path
+        if nodes:
+            return list(members)
+
+    @_counted
+    def objExists(self, name):
+        node_name, _, attr = name.partition(".")
+        try:
+            node = self.node(node_name)
+        except ValueError:
+            return False
+        return not attr or attr in node.attrs
+
+    @_counted
+    def nodeType(self, name):
+        return self.node(name).type
+
+    @_counted
+    def objectType(self, name, isAType=None):
+        node = self.node(name)
+        if isAType is not None:
+            return isAType in node.types
+        return node.type
+
+    @_counted
+    def attributeQuery(self, attr, node=None, type=None, exists=False):
+        if type is not None:
+            # Static attributes of the node type
+            return any(attr in ATTRIBUTES.get(inherited, {})
+                       for inherited in INHERITANCE.get(type, (type,)))
+        return attr in self.node(node).attrs
+
+    @_counted
+    def listAttr(self, node, userDefined=False):
+        node = self.node(node)
+        if not userDefined:
+            return list(node.attrs)
+
+        static = set()
+        for inherited in node.types:
+            static.update(ATTRIBUTES.get(inherited, {}))
+        return [attr for attr in node.attrs if attr not in static] or None
+
+    @_counted
+    def getAttr(self, plug, **kwargs):
+        node_name, attr = plug.split(".", 1)
+        node = self.node(node_name)
+
+        # Array attributes, e.g. "pnts[3]" or "pnts[0:7]"
+        attr, _, index = attr.partition("[")
+        if attr not in node.attrs:
+            raise ValueError("No object matches name: %s" % plug)
+
+        value = node.attrs[attr]
+        if kwargs.get("size"):
+            return len(value)
+
+        if index:
+            start, _, end = index.rstrip("]").partition(":")
+            end = end or start
+            return value[int(start):int(end) + 1]
+
+        return value
+
+    @_counted
+    def setAttr(self, plug, value, **kwargs):
+        node_name, attr = plug.split(".", 1)
+        self.node(node_name).attrs[attr] = value
+
+    @_counted
+    def xform(self, name, query=False, q=False, matrix=False,
+              boundingBox=False, **kwargs):
+        if matrix:
+            return list(self.node(name).attrs["matrix"])
+
+        if boundingBox:
+            # The union of the bounds of the node and its descendants
+            node = self.node(name)
+            boxes = [other.bounds for other in self.nodes.values()
+                     if other.bounds is not None and
+                     (other is node or
+                      other.name.startswith(node.name + "|"))]
+            if not boxes:
+                return [0.0] * 6
+            return ([min(box[i] for box in boxes) for i in range(3)] +
+                    [max(box[i] for box in boxes) for i in range(3, 6)])
+
+    @_counted
+    def polyEvaluate(self, mesh, **kwargs):
+        stats = self.node(mesh).stats
+        flags = [key for key, value in kwargs.items() if value]
+        if len(flags) == 1:
+            return stats[flags[0]]
+        return dict((flag, stats[flag]) for flag in flags)
+
+    @_counted
+    def polyInfo(self, meshes, **kwargs):
+        meshes = [meshes] if isinstance(meshes, str) else meshes
+
+        if kwargs.get("faceToVertex"):
+            # Quads of consecutive vertices, unless set otherwise
+            node = self.node(meshes[0])
+            if node.faces is not None:
+                return list(node.faces)
+            return ["FACE %6i: %6i %6i %6i %6i \n" % (
+                face, face, face + 1, face + 2, face + 3)
+                for face in range(node.stats["face"])]
+        queried = set(self.node(mesh).name for mesh in meshes)
+
+        found = list()
+        for flag, value in kwargs.items():
+            for component in self.poly_info.get(flag, []) if value else []:
+                name = component.rsplit(".", 1)[0]
+                node = self.node(name)
+                if node.type != "mesh":
+                    # Components of a transform are those of its mesh
+                    node = next(other for other in self.nodes.values()
+                                if other.name.startswith(node.name + "|"))
+                if node.name in queried:
+                    found.append(component)
+
+        return found or None
+
+    @_counted
+    def playbackOptions(self, query=False, q=False, **kwargs):
+        if kwargs.get("animationStartTime") or kwargs.get("minTime"):
+            return self.playback[0]
+        return self.playback[1]
+
+    @_counted
+    def file(self, path=None, **kwargs):
+        if kwargs.get("exportAll") or kwargs.get("exportSelected"):
+            # Written files only hold the names of the nodes
+            with open(path, "w") as f:
+                f.write("\n".join(self.nodes))
+            return path
+
+    @_counted
+    def loadPlugin(self, name, quiet=False):
+        return [name]
+
+    @_counted
+    def refresh(self, suspend=False):
+        pass
+
+    @_counted
+    def AbcExport(self, j, **kwargs):
+        """Record the jobs of each export in `exports`"""
+        jobs = [j] if not isinstance(j, (list, tuple)) else list(j)
+        self.exports.append(jobs)
+
+    @_counted
+    def polyListComponentConversion(self, components, toVertex=False):
+        name, _, component = components.partition(".")
+        node = self.node(name)
+        kind = component.partition("[")[0]
+        if kind in node.vertices:
+            return list(node.vertices[kind])
+        return ["%s.vtx[0:%i]" % (name, node.stats["vertex"] - 1)]
+
+    @_counted
+    def select(self, *args, **kwargs):
+        self.selection = list(args[0]) if args else []
+
+
+@contextlib.contextmanager
+def mocked(cmds):
+    """Temporarily replace `maya.cmds` by `cmds`
+
+    Only affects imports made whilst inside of the context,
+    such as the function-level imports in the library.
+
+    """
+
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+
+    original = dict((name, sys.modules.get(name))
+                    for name in ("maya", "maya.cmds"))
+
+    sys.modules["maya"] = maya
+    sys.modules["maya.cmds"] = cmds
+    try:
+        yield cmds
+    finally:
+        for name, module in original.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
@@ -0,0 +1,80 @@
+import os
+import runpy
+
+import pyblish.api
+
+from pyblish_magenta import lib
+from pyblish_magenta.lib import alembic
+
+from .mock_cmds import MockCmds, mocked
+
+PLUGIN = os.path.join(lib.PLUGINS_PATH, "workflow", "maya",
+                      "extract_alembic_batch.py")
+
+
+def test_parse_options():
+    """Options convert to a job string in order of their names"""
+    job_str = alembic.parse_options({"startFrame": 1,
+                                     "endFrame": 10,
+                                     "uvWrite": True,
+                                     "worldSpace": False,
+                                     "root": ["|a", "|b"]})
+    assert job_str == "-frameRange 1 10 -root |a -root |b -uvWrite", job_str
+
+
+def test_parse_overrides():
+    """Overrides of the wrong type are ignored"""
+    options = alembic.parse_overrides({"step": 0.5,
+                                       "uvWrite": "yes",
+                                       "family": "pointcache"},
+                                      {"uvWrite": True})
+    assert options == {"step": 0.5, "uvWrite": True}, options
+
+
+def test_group_by_frames():
+    """Jobs are grouped by frame range, step and relative samples"""
+    options = [
+        {"startFrame": 1.0, "endFrame": 10.0, "uvWrite": True},
+        {"frameRange": "1 10", "worldSpace": True},
+        {"startFrame": 1.0, "endFrame": 10.0, "step": 0.5},
+        {"startFrame": 1.0, "endFrame": 20.0},
+        {"frameRange": "1.0 10.0", "frameRelativeSample": 0.2},
+        {"startFrame": 1.0, "endFrame": 10.0, "dataFormat": "hdf5"},
+    ]
+    assert alembic.group_by_frames(options) == [[0, 1, 5], [2], [3], [4]]
+
+
+def test_group_by_frames_empty():
+    assert alembic.group_by_frames([]) == []
+
+
+def test_extract_alembic_batch():
+    """Instances sharing frames are exported at once, others are left"""
+    plugin = runpy.run_path(PLUGIN)["ExtractAlembicBatch"]
+
+    cmds = MockCmds()
+    context = pyblish.api.Context()
+    for name, overrides in (("ben", {}),
+                            ("jerry", {"worldSpace": True}),
+                            ("tom", {"frameRange": "1 100"})):
+        cmds.create("|%s_GRP" % name, "transform")
+        cmds.create("|%s_GRP|%s_GEO" % (name, name), "transform")
+
+        instance = context.create_instance(name)
+        instance.data["family"] = "pointcache"
+        instance.data["setMembers"] = ["|%s_GRP" % name]
+        instance.data["extractDir"] = "/tmp/%s" % name
+        instance.data.update(overrides)
+
+    with mocked(cmds):
+        plugin().process(context)
+
+    assert len(cmds.exports) == 1, cmds.exports
+    ben_job, jerry_job = cmds.exports[0]
+    assert "-root |ben_GRP " in ben_job, ben_job
+    assert "-worldSpace" in jerry_job, jerry_job
+
+    ben, jerry, tom = context
+    assert ben.data["alembicOutput"] == "/tmp/ben/ben.abc"
+    assert jerry.data["alembicOutput"] == "/tmp/jerry/jerry.abc"
+    assert "alembicOutput" not in tom.data
@@ -0,0 +1,23 @@
+from pyblish_magenta.lib import arrays
+
+
+def test_flatten():
+    """Rows are flattened into a single array of floats"""
+    values = arrays.flatten([(0, 1, 2), (3.5, 4, 5)])
+    assert list(values) == [0.0, 1.0, 2.0, 3.5, 4.0, 5.0]
+    assert len(arrays.flatten([])) == 0
+
+
+def test_max_abs():
+    """Largest absolute value includes negative values"""
+    assert arrays.max_abs(arrays.flatten([(0, 1e-9, -2e-9)])) == 2e-9
+    assert arrays.max_abs(arrays.flatten([(0, 3, -2)])) == 3.0
+    assert arrays.max_abs(arrays.flatten([])) == 0.0
+
+
+def test_rows_differing():
+    """Rows differing more than the tolerance are found"""
+    rows = [(1, 0), (1, 1e-9), (1, 0), (0.5, 0)]
+    assert arrays.rows_differing(rows, (1, 0), 1e-8) == [3]
+    assert arrays.rows_differing(rows, (1, 0), 1e-30) == [1, 3]
+    assert arrays.rows_differing([], (1, 0), 1e-8) == []
@@ -0,0 +1,94 @@
+from pyblish_magenta.lib import get_attributes
+
+from .mock_cmds import MockCmds, mocked
+
+
+RENDER_STATS = ["castsShadows", "receiveShadows", "motionBlur",
+                "primaryVisibility", "smoothShading", "visibleInReflections",
+                "visibleInRefractions", "doubleSided", "opposite"]
+
+
+def _scene(count):
+    cmds = MockCmds()
+    for i in range(count):
+        cmds.create("|mesh%i_GEO" % i, "transform")
+        cmds.create_mesh("|mesh%i_GEO|mesh%i_GEOShape" % (i, i))
+    return cmds
+
+
+def _get_attributes_per_node(cmds, nodes, attributes):
+    """The per node and per attribute approach replaced by get_attributes"""
+    table = dict()
+    for node in nodes:
+        row = list()
+        for attr in attributes:
+            value = None
+            if cmds.attributeQuery(attr, node=node, exists=True):
+                value = cmds.getAttr("{0}.{1}".format(node, attr))
+            row.append(value)
+        table[node] = row
+    return table
+
+
+def test_get_attributes():
+    """Bulk attribute values match those of getAttr"""
+    cmds = _scene(2)
+    cmds.node("|mesh1_GEO|mesh1_GEOShape").attrs["opposite"] = True
+
+    with mocked(cmds):
+        table = get_attributes(["|mesh0_GEO|mesh0_GEOShape",
+                                "|mesh1_GEO|mesh1_GEOShape"],
+                               ["visibility", "opposite"])
+
+    assert table == {
+        "|mesh0_GEO|mesh0_GEOShape": [True, False],
+        "|mesh1_GEO|mesh1_GEOShape": [True, True],
+    }, table
+
+
+def test_get_attributes_missing():
+    """Missing nodes and attributes are None"""
+    cmds = _scene(1)
+
+    with mocked(cmds):
+        table = get_attributes(["|mesh0_GEO", "|notExist"],
+                               ["visibility", "intermediateObject"])
+
+    assert table["|mesh0_GEO"] == [True, None]
+    assert table["|notExist"] == [None, None]
+
+
+def test_get_attributes_user_defined():
+    """Attributes that are not static to the node type are found"""
+    cmds = _scene(2)
+    cmds.node("|mesh1_GEO").attrs["uuid"] = "abc"
+
+    with mocked(cmds):
+        table = get_attributes(["|mesh0_GEO", "|mesh1_GEO"], ["uuid"])
+
+    assert table == {"|mesh0_GEO": [None], "|mesh1_GEO": ["abc"]}
+
+
+def test_get_attributes_call_count():
+    """Bulk query makes less calls than querying per node"""
+    cmds = _scene(100)
+    nodes = list(cmds.nodes)
+
+    per_node = _get_attributes_per_node(cmds, nodes, RENDER_STATS)
+    per_node_calls = cmds.total()
+    cmds.reset()
+
+    with mocked(cmds):
+        bulk = get_attributes(nodes, RENDER_STATS)
+    bulk_calls = cmds.total()
+
+    assert bulk == per_node
+
+    # Existence is queried once per node type instead of once per node
+    # and per attribute, leaving a single `getAttr` per existing plug.
+    shapes = len(nodes) // 2
+    assert per_node_calls == (len(nodes) + shapes) * len(RENDER_STATS)
+    assert cmds.calls["attributeQuery"] == 2 * len(RENDER_STATS)
+    assert cmds.calls["listAttr"] == len(nodes) - shapes
+    assert cmds.calls["getAttr"] == shapes * len(RENDER_STATS)
+    assert bulk_calls < per_node_calls, (bulk_calls, per_node_calls)
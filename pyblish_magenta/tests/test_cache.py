@@ -0,0 +1,67 @@
+import os
+import time
+import shutil
+import tempfile
+
+from pyblish_magenta import cache
+
+
+def _cache(max_size=cache.MAX_SIZE):
+    return cache.DiskCache(os.path.join(tempfile.mkdtemp(), "test"),
+                           max_size)
+
+
+def test_get_set():
+    """Values are stored on disk and persist across instances"""
+    store = _cache()
+    try:
+        assert store.get("a") is None
+        store.set("a", b"value")
+        assert store.get("a") == b"value"
+
+        store = cache.DiskCache(store.directory)
+        assert store.get("a") == b"value"
+        assert store.size() == len(b"value")
+    finally:
+        shutil.rmtree(os.path.dirname(store.directory))
+
+
+def test_evict_least_recently_used():
+    """Exceeding the maximum size evicts the least recently used values"""
+    store = _cache(max_size=30)
+    try:
+        for key in ("a", "b", "c"):
+            store.set(key, b"0123456789")
+
+            # Ensure distinct modification times
+            path = os.path.join(store.directory, key)
+            stamp = time.time() - 100 + len(os.listdir(store.directory))
+            os.utime(path, (stamp, stamp))
+
+        # Reading "a" marks it as most recently used
+        assert store.get("a") == b"0123456789"
+
+        store.set("d", b"0123456789")
+        assert store.get("b") is None
+        assert store.get("c") is None
+        assert store.get("a") is not None
+        assert store.get("d") is not None
+        assert store.size() <= 30
+    finally:
+        shutil.rmtree(os.path.dirname(store.directory))
+
+
+def test_overwrite():
+    """Replacing a value counts only the new value towards the size"""
+    store = _cache(max_size=30)
+    try:
+        store.set("a", b"0123456789")
+        store.set("b", b"0123456789")
+        for _ in range(5):
+            store.set("a", b"0123456789")
+
+        # Nothing was evicted, as the size never exceeded the maximum
+        assert store.get("b") == b"0123456789"
+        assert store._size == store.size() == 20
+    finally:
+        shutil.rmtree(os.path.dirname(store.directory))
@@ -0,0 +1,49 @@
+import random
+
+from pyblish_magenta.lib import components
+from pyblish_magenta.lib.components import IntervalSet
+
+
+def test_count():
+    """Ranges, single indices and multiple indices are counted"""
+    assert components.count([]) == 0
+    assert components.count(["pCube1.vtx[0:7]"]) == 8
+    assert components.count(["pCube1.vtx[3]", "pCube1.vtx[5:6]"]) == 3
+    assert components.count(["|a|pCube1.vtxFace[1:3][0:1]"]) == 6
+    assert components.count(["pCube1.vtxFace[2][0:3]"]) == 4
+    assert components.count(["pCube1"]) == 1
+
+
+def test_indices():
+    """Components parse into merged intervals"""
+    vertices = components.indices(["pCube1.vtx[5:6]",
+                                   "pCube1.vtx[0:3]",
+                                   "pCube1.vtx[4]"])
+    assert vertices == IntervalSet([(0, 7)])
+    assert vertices.ranges() == [(0, 6)]
+
+    try:
+        components.indices(["pCube1.vtxFace[1][0]"])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Parsed component of multiple indices")
+
+
+def test_algebra_matches_sets():
+    """Set operations match those of Python sets"""
+    rng = random.Random(0)
+    for _ in range(200):
+        a = set(rng.sample(range(60), rng.randint(0, 40)))
+        b = set(rng.sample(range(60), rng.randint(0, 40)))
+        x = IntervalSet.from_indices(a)
+        y = IntervalSet.from_indices(b)
+
+        assert set(x | y) == a | b
+        assert set(x & y) == a & b
+        assert set(x - y) == a - b
+        assert set(y - x) == b - a
+        assert set(x.complement(60)) == set(range(60)) - a
+        assert len(x) == len(a)
+        assert all(index in x for index in a)
+        assert not any(index in x for index in set(range(60)) - a)
@@ -0,0 +1,76 @@
+from pyblish_magenta.lib import hierarchy
+
+
+SCENE = [
+    "|ben_GRP",
+    "|ben_GRP|ben_GEO",
+    "|ben_GRP|ben_GEO|ben_GEOShape",
+    "|ben_GRP|ben_GEO|ben_GEOShapeOrig",
+    "|ben_GRP|arm_GRP",
+    "|ben_GRP|arm_GRP|arm_GEO",
+    "|ben_GRP|arm_GRP|arm_GEO|arm_GEOShape",
+    "|ben_GRP|arm_GRPx",
+    "|ben_GRP2",
+    "|ben_GRP2|ben_GEO",
+    "|camera1",
+]
+
+
+def test_get_ancestors():
+    """Ancestors of all paths are returned once"""
+    ancestors = hierarchy.get_ancestors([
+        "|ben_GRP|arm_GRP|arm_GEO",
+        "|ben_GRP|arm_GRP|arm_GEO|arm_GEOShape",
+        "|ben_GRP2|ben_GEO",
+        "|camera1",
+    ])
+    assert ancestors == set(["|ben_GRP",
+                             "|ben_GRP|arm_GRP",
+                             "|ben_GRP|arm_GRP|arm_GEO",
+                             "|ben_GRP2"])
+
+
+def test_get_roots():
+    """Roots exclude paths below other paths, but not similar names"""
+    roots = hierarchy.get_roots([
+        "|ben_GRP|arm_GRP|arm_GEO",
+        "|ben_GRP|arm_GRP",
+        "|ben_GRP|arm_GRPx",
+        "|ben_GRP2|ben_GEO",
+        "|ben_GRP2|ben_GEO",
+    ])
+    assert sorted(roots) == ["|ben_GRP2|ben_GEO",
+                             "|ben_GRP|arm_GRP",
+                             "|ben_GRP|arm_GRPx"]
+
+
+def test_descendants():
+    """Descendants don't include nodes of similar names or excluded nodes"""
+    index = hierarchy.DagIndex(SCENE,
+                               exclude=["|ben_GRP|ben_GEO|ben_GEOShapeOrig"])
+
+    assert index.descendants("|ben_GRP|arm_GRP") == (
+        "|ben_GRP|arm_GRP|arm_GEO",
+        "|ben_GRP|arm_GRP|arm_GEO|arm_GEOShape",
+    )
+    assert "|ben_GRP2|ben_GEO" not in index.descendants("|ben_GRP")
+    assert "|ben_GRP|arm_GRPx" in index.descendants("|ben_GRP")
+    assert ("|ben_GRP|ben_GEO|ben_GEOShapeOrig"
+            not in index.descendants("|ben_GRP"))
+    assert index.descendants("|camera1") == ()
+
+
+def test_expand():
+    """Expanding includes all parents and children of the members"""
+    index = hierarchy.DagIndex(SCENE,
+                               exclude=["|ben_GRP|ben_GEO|ben_GEOShapeOrig"])
+
+    nodes = index.expand(["|ben_GRP|arm_GRP", "myShader"])
+    assert nodes == set(SCENE[:3] + SCENE[4:8] + ["myShader"]), nodes
+
+    # Excluded nodes are only included when they are a member
+    nodes = index.expand(["|ben_GRP|ben_GEO|ben_GEOShapeOrig"])
+    assert "|ben_GRP|ben_GEO|ben_GEOShapeOrig" in nodes
+
+    # Shared subtrees are the same for multiple instances
+    assert index.expand(["|ben_GRP|ben_GEO"]) == index.expand(["|ben_GRP"])
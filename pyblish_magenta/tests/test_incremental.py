@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+
+import pyblish.api
+
+from pyblish_magenta import cache, incremental
+
+from .mock_cmds import MockCmds, mocked
+
+
+class ValidateGhosting(pyblish.api.InstancePlugin):
+    version = (0, 1, 0)
+    processed = list()
+
+    @incremental.skip_unchanged(attributes=["ghosting"], data=["subset"])
+    def process(self, instance):
+        self.processed.append(instance)
+        if any(instance.context.data["cmds"].node(node).attrs["ghosting"]
+               for node in instance):
+            raise ValueError("Ghosting enabled")
+
+
+def _publish(cmds):
+    context = pyblish.api.Context()
+    context.data["cmds"] = cmds
+    instance = context.create_instance("ben")
+    instance.data["subset"] = "default"
+    instance[:] = list(cmds.nodes)
+
+    with mocked(cmds):
+        try:
+            ValidateGhosting().process(instance)
+        except ValueError:
+            return False
+    return True
+
+
+def _use_temporary_cache():
+    os.environ[cache.ENV] = tempfile.mkdtemp()
+    ValidateGhosting.processed[:] = []
+
+
+def _remove_temporary_cache():
+    shutil.rmtree(os.environ.pop(cache.ENV))
+
+
+def _scene():
+    cmds = MockCmds()
+    cmds.create("|ben_GRP", "transform")
+    cmds.create("|ben_GRP|ben_GEO", "transform")
+    return cmds
+
+
+def test_skip_unchanged():
+    """Validation is skipped once passed, until the input changes"""
+    _use_temporary_cache()
+    try:
+        cmds = _scene()
+        assert _publish(cmds)
+        assert _publish(cmds)
+        assert len(ValidateGhosting.processed) == 1
+
+        # Changed attributes and new nodes are validated anew
+        cmds.node("|ben_GRP|ben_GEO").attrs["ghosting"] = True
+        assert not _publish(cmds)
+        assert not _publish(cmds)
+        assert len(ValidateGhosting.processed) == 3
+
+        cmds.node("|ben_GRP|ben_GEO").attrs["ghosting"] = False
+        cmds.create("|ben_GRP|arm_GEO", "transform")
+        assert _publish(cmds)
+        assert len(ValidateGhosting.processed) == 4
+    finally:
+        _remove_temporary_cache()
+
+
+def test_version_invalidates():
+    """A new version of the plug-in validates anew"""
+    _use_temporary_cache()
+    try:
+        cmds = _scene()
+        assert _publish(cmds)
+
+        ValidateGhosting.version = (0, 2, 0)
+        try:
+            assert _publish(cmds)
+        finally:
+            ValidateGhosting.version = (0, 1, 0)
+
+        assert len(ValidateGhosting.processed) == 2
+    finally:
+        _remove_temporary_cache()
+
+
+def test_disabled():
+    """All validations run when turned off"""
+    _use_temporary_cache()
+    os.environ[incremental.ENV] = "0"
+    try:
+        cmds = _scene()
+        assert _publish(cmds)
+        assert _publish(cmds)
+        assert len(ValidateGhosting.processed) == 2
+    finally:
+        os.environ.pop(incremental.ENV)
+        _remove_temporary_cache()
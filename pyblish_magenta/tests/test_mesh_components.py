@@ -0,0 +1,107 @@
+import os
+import runpy
+import shutil
+import tempfile
+
+import pyblish.api
+
+from pyblish_magenta import lib, cache, plugin as magenta_plugin
+from pyblish_magenta.action import SelectInvalidAction
+
+from .mock_cmds import MockCmds, mocked
+
+PLUGINS = os.path.join(lib.PLUGINS_PATH, "workflow", "maya")
+
+
+def setup_module():
+    os.environ[cache.ENV] = tempfile.mkdtemp()
+
+
+def teardown_module():
+    shutil.rmtree(os.environ.pop(cache.ENV))
+
+
+def _load(cmds, filename, name):
+    with mocked(cmds):
+        return runpy.run_path(os.path.join(PLUGINS, filename))[name]
+
+
+def _scene():
+    cmds = MockCmds()
+    cmds.create("|ben_GRP", "transform")
+    cmds.create("|ben_GRP|ben_GEO", "transform")
+    mesh = cmds.create_mesh("|ben_GRP|ben_GEO|ben_GEOShape",
+                            vertex=50, uvcoord=30)
+
+    # Vertices 12 to 40 have neither edges nor UVs
+    mesh.vertices["e"] = ["ben_GEO.vtx[0:11]", "ben_GEO.vtx[41:49]"]
+    mesh.vertices["map"] = ["ben_GEO.vtx[0:11]", "ben_GEO.vtx[41:49]"]
+
+    cmds.create("|ben_GRP|valid_GEO", "transform")
+    cmds.create_mesh("|ben_GRP|valid_GEO|valid_GEOShape",
+                     vertex=8, uvcoord=14)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance.data["family"] = "model"
+    instance[:] = list(cmds.nodes)
+
+    return cmds, context, instance
+
+
+def test_vertices_have_edges():
+    """The exact vertices without edges are returned"""
+    cmds, context, instance = _scene()
+    plugin = _load(cmds, "validate_mesh_vertices_have_edges.py",
+                   "ValidateMeshVerticesHaveEdges")
+
+    with mocked(cmds):
+        invalid = plugin.get_invalid(instance)
+
+    assert invalid == ["|ben_GRP|ben_GEO|ben_GEOShape.vtx[12:40]"], invalid
+
+
+def test_has_uv():
+    """The exact vertices without UVs are returned"""
+    cmds, context, instance = _scene()
+    plugin = _load(cmds, "validate_mesh_has_uv.py", "ValidateMeshHasUVs")
+
+    with mocked(cmds):
+        invalid = plugin.get_invalid(instance)
+
+    assert invalid == ["|ben_GRP|ben_GEO|ben_GEOShape.vtx[12:40]"], invalid
+
+
+def test_select_invalid_components():
+    """Invalid components are selected as is"""
+    cmds, context, instance = _scene()
+    plugin = _load(cmds, "validate_mesh_vertices_have_edges.py",
+                   "ValidateMeshVerticesHaveEdges")
+
+    context.data["results"] = [{"plugin": plugin,
+                                "instance": instance,
+                                "error": RuntimeError("Invalid")}]
+
+    with mocked(cmds):
+        SelectInvalidAction().process(context, plugin)
+
+    assert cmds.selection == ["|ben_GRP|ben_GEO|ben_GEOShape.vtx[12:40]"]
+
+
+def test_first_invalid():
+    """Validation stops once enough invalid nodes are found"""
+    cmds, context, instance = _scene()
+    plugin = _load(cmds, "validate_mesh_has_uv.py", "ValidateMeshHasUVs")
+
+    plugin.max_invalid = 1
+    with mocked(cmds):
+        invalid = magenta_plugin.first_invalid(plugin, instance)
+
+    # Only the first mesh was checked
+    assert invalid == ["|ben_GRP|ben_GEO|ben_GEOShape.vtx[12:40]"], invalid
+    assert cmds.calls["polyListComponentConversion"] == 1
+
+    plugin.max_invalid = None
+    with mocked(cmds):
+        invalid = magenta_plugin.first_invalid(plugin, instance)
+        assert invalid == plugin.get_invalid(instance)
@@ -0,0 +1,148 @@
+import os
+import json
+import shutil
+import tempfile
+
+import pyblish.api
+
+from pyblish_magenta import profiler, scheduler
+
+from .mock_cmds import MockCmds, mocked
+
+
+class CollectInstances(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+
+    def process(self, context):
+        for name in ("ben", "jerry"):
+            context.create_instance(name)
+
+
+class ValidateInstance(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+
+    def process(self, instance):
+        instance.data["validated"] = True
+
+
+def test_profile_plugins():
+    """Profiled plug-ins are processed as usual and measured"""
+    plugins = [type(plugin.__name__, (plugin,), {})
+               for plugin in (CollectInstances, ValidateInstance)]
+
+    for plugin in plugins:
+        assert profiler.profile_plugin(plugin)
+
+    context = scheduler.publish(plugins=plugins)
+
+    assert all(result["success"] for result in context.data["results"])
+    assert all(instance.data["validated"] for instance in context)
+
+    records = profiler.get(context).records
+    assert len(records) == 3, records
+    assert sorted(str(record["instance"]) for record in records) == [
+        "None", "ben", "jerry"]
+
+    totals = dict((total["plugin"], total)
+                  for total in profiler.get(context).plugins())
+    assert totals["ValidateInstance"]["count"] == 2
+
+
+def test_write_report():
+    """Reports are written as JSON and text"""
+    context = pyblish.api.Context()
+    profiler.get(context).add(ValidateInstance, "ben", 0.5, 10, None)
+    profiler.get(context).add(CollectInstances, None, 1.5, 20, 1024 ** 2)
+
+    directory = tempfile.mkdtemp()
+    try:
+        json_path, text_path = profiler.write(context, directory)
+
+        with open(json_path) as f:
+            report = json.load(f)
+
+        with open(text_path) as f:
+            summary = f.read()
+    finally:
+        shutil.rmtree(directory)
+
+    assert [total["plugin"] for total in report["plugins"]] == [
+        "CollectInstances", "ValidateInstance"]
+    assert summary.index("CollectInstances") < summary.index(
+        "ValidateInstance")
+
+
+def test_disabled_by_default():
+    """Nothing is profiled unless turned on"""
+    assert profiler.ENV not in os.environ
+    assert not profiler.enabled()
+
+
+def test_register_deregister():
+    """Registering leaves pyblish and maya.cmds as they were once undone"""
+    cmds = MockCmds()
+    ls = cmds.ls
+
+    filters = getattr(pyblish.api, "register_discovery_filter", None)
+    with mocked(cmds):
+        try:
+            # Like pyblish-base 1.4, without discovery filters
+            if filters is not None:
+                del pyblish.api.register_discovery_filter
+            profiler.register()
+            assert cmds.ls is not ls
+        finally:
+            profiler.deregister()
+            if filters is not None:
+                pyblish.api.register_discovery_filter = filters
+
+    assert cmds.ls == ls
+    assert not getattr(cmds, "__profiled__", False)
+
+
+def test_peak_memory():
+    """The memory allocated by each plug-in is recorded"""
+    class ExtractLarge(pyblish.api.ContextPlugin):
+        order = pyblish.api.ExtractorOrder
+
+        def process(self, context):
+            context.data["large"] = len(b"x" * 10 * 1024 ** 2)
+
+    plugin = type("ExtractLarge", (ExtractLarge,), {})
+    assert profiler.profile_plugin(plugin)
+
+    profiler.trace_memory()
+    try:
+        context = scheduler.publish(plugins=[plugin])
+    finally:
+        profiler.untrace_memory()
+
+    record, = profiler.get(context).records
+    if profiler._tracemalloc() is not None:
+        assert record["peakMemory"] >= 10 * 1024 ** 2, record
+    else:
+        assert record["peakMemory"] is None
+
+
+def test_deregister_unregistered():
+    """Deregistering without registering first leaves everything as is"""
+    cmds = MockCmds()
+    ls = cmds.ls
+
+    filters = pyblish.api.__dict__.pop("deregister_discovery_filter", None)
+    callback = pyblish.api.deregister_callback
+
+    def deregister_callback(signal, callback):
+        # Like pyblish-base 1.4, for signals without callbacks
+        raise KeyError(signal)
+
+    pyblish.api.deregister_callback = deregister_callback
+    try:
+        with mocked(cmds):
+            profiler.deregister()
+    finally:
+        pyblish.api.deregister_callback = callback
+        if filters is not None:
+            pyblish.api.deregister_discovery_filter = filters
+
+    assert cmds.ls == ls
@@ -0,0 +1,69 @@
+import os
+import runpy
+
+import pyblish.api
+
+from pyblish_magenta import lib, incremental
+
+from .mock_cmds import MockCmds, mocked
+
+PLUGINS = os.path.join(lib.PLUGINS_PATH, "workflow", "maya")
+
+
+def _scene():
+    cmds = MockCmds()
+    for i in range(3):
+        cmds.create("|mesh%i_GEO" % i, "transform")
+        cmds.create_mesh("|mesh%i_GEO|mesh%i_GEOShape" % (i, i))
+
+    cmds.node("|mesh1_GEO|mesh1_GEOShape").attrs.update(castsShadows=False,
+                                                        opposite=True)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance[:] = list(cmds.nodes)
+
+    with mocked(cmds):
+        plugin = runpy.run_path(
+            os.path.join(PLUGINS, "validate_shape_render_stats.py")
+        )["ValidateShapeRenderStats"]
+
+    return cmds, plugin, instance
+
+
+def test_diff():
+    """Each differing stat is listed once with its default"""
+    cmds, plugin, instance = _scene()
+
+    with mocked(cmds):
+        diff = plugin.get_diff(instance)
+        invalid = plugin.get_invalid(instance)
+
+    assert diff == {"|mesh1_GEO|mesh1_GEOShape": {
+        "castsShadows": (False, 1),
+        "opposite": (True, 0),
+    }}, diff
+    assert invalid == ["|mesh1_GEO|mesh1_GEOShape"], invalid
+
+
+def test_repair():
+    """Repair sets the stats found on validation without querying them"""
+    cmds, plugin, instance = _scene()
+
+    os.environ[incremental.ENV] = "0"
+    try:
+        with mocked(cmds):
+            try:
+                plugin().process(instance)
+            except ValueError:
+                pass
+            else:
+                assert False, "Validation should have failed"
+
+            cmds.reset()
+            plugin.repair(instance)
+
+            assert dict(cmds.calls) == {"setAttr": 2}, cmds.calls
+            assert plugin.get_diff(instance) == {}
+    finally:
+        os.environ.pop(incremental.ENV)
@@ -0,0 +1,80 @@
+import pyblish.api
+
+from pyblish_magenta import results
+from pyblish_magenta.plugin import Integrator
+
+
+class ValidateA(pyblish.api.InstancePlugin):
+    pass
+
+
+class ValidateB(pyblish.api.InstancePlugin):
+    pass
+
+
+def _result(plugin, instance, error=None):
+    return {"plugin": plugin,
+            "instance": instance,
+            "error": error,
+            "records": list(),
+            "success": error is None}
+
+
+def _context():
+    context = pyblish.api.Context()
+    ben = context.create_instance("ben")
+    tom = context.create_instance("tom")
+    context.data["results"] = [
+        _result(ValidateA, None),
+        _result(ValidateA, ben),
+        _result(ValidateA, tom, ValueError("Invalid")),
+        _result(ValidateB, tom, ValueError("Invalid")),
+    ]
+    return context, ben, tom
+
+
+def test_index():
+    """Results are grouped by instance and plug-in"""
+    context, ben, tom = _context()
+    index = results.get(context)
+
+    assert index.errored_instances() == [tom]
+    assert index.has_error(tom)
+    assert not index.has_error(ben)
+    assert len(index.by_instance(tom)) == 2
+    assert len(index.by_plugin(ValidateA)) == 3
+
+
+def test_index_incremental():
+    """Results appended after indexing are included in later lookups"""
+    context, ben, tom = _context()
+    index = results.get(context)
+    assert not index.has_error(ben)
+
+    context.data["results"].append(_result(ValidateB, ben, ValueError()))
+    assert results.get(context) is index
+    assert index.has_error(ben)
+    assert index.errored_instances() == [tom, ben]
+
+
+def test_index_replaced_results():
+    """A new list of results is indexed anew"""
+    context, ben, tom = _context()
+    results.get(context)
+
+    context.data["results"] = list()
+    assert results.get(context).errored_instances() == []
+
+
+def test_integrator():
+    """Integration is skipped only for instances with errors"""
+    context, ben, tom = _context()
+
+    Integrator().process(ben)
+
+    try:
+        Integrator().process(tom)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Integrated instance with errors")
@@ -0,0 +1,89 @@
+import threading
+
+import pyblish.api
+
+from pyblish_magenta import scheduler
+
+
+class CollectInstances(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+
+    def process(self, context):
+        for name in ("ben", "jerry", "tom"):
+            instance = context.create_instance(name)
+            instance.data["family"] = "model"
+            instance.data["threads"] = list()
+
+
+class CollectThreadsafe(pyblish.api.InstancePlugin):
+    order = pyblish.api.CollectorOrder + 0.1
+    threadsafe = True
+
+    def process(self, instance):
+        instance.data["threads"].append(threading.current_thread().name)
+        instance.data["collected"] = True
+
+
+class ValidateHost(pyblish.api.InstancePlugin):
+    order = pyblish.api.CollectorOrder + 0.2
+
+    def process(self, instance):
+        # Runs after the thread-safe collector of the same instance
+        assert instance.data["collected"]
+        instance.data["threads"].append(threading.current_thread().name)
+
+
+class ValidateFailure(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    threadsafe = True
+
+    def process(self, instance):
+        if instance.data["name"] == "jerry":
+            raise ValueError("Invalid")
+
+
+class Extract(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+
+    def process(self, instance):
+        instance.data["extracted"] = True
+
+
+def test_threadsafe_on_worker_threads():
+    """Thread-safe plug-ins run on workers, others on the main thread"""
+    plugins = [CollectInstances, CollectThreadsafe, ValidateHost]
+    context = scheduler.publish(plugins=plugins)
+
+    main = threading.current_thread().name
+    for instance in context:
+        worker, host = instance.data["threads"]
+        assert worker != main, instance.data["threads"]
+        assert host == main, instance.data["threads"]
+
+
+def test_results():
+    """All results end up in the context in the shape of pyblish.util"""
+    plugins = [CollectInstances, CollectThreadsafe,
+               ValidateHost, ValidateFailure]
+    context = scheduler.publish(plugins=plugins)
+
+    results = context.data["results"]
+    assert len(results) == 1 + 3 * 3, results
+
+    for key in ("plugin", "instance", "error", "records", "success"):
+        assert all(key in result for result in results), key
+
+    errored = [result["instance"].data["name"] for result in results
+               if result["error"]]
+    assert errored == ["jerry"], errored
+
+
+def test_stop_on_failed_validation():
+    """Errors of thread-safe validators stop publishing before extraction"""
+    plugins = [CollectInstances, CollectThreadsafe,
+               ValidateHost, ValidateFailure, Extract]
+    context = scheduler.publish(plugins=plugins)
+
+    assert not any(instance.data.get("extracted") for instance in context)
+    assert not any(result["plugin"] is Extract
+                   for result in context.data["results"])
@@ -0,0 +1,109 @@
+import pyblish.api
+
+from pyblish_magenta import snapshot
+
+from .mock_cmds import MockCmds, mocked
+
+
+def _scene():
+    """Return mocked scene with a group of two meshes and a joint"""
+    cmds = MockCmds()
+    cmds.create("|ben_GRP", "transform")
+    cmds.create("|ben_GRP|a_GEO", "transform")
+    cmds.create_mesh("|ben_GRP|a_GEO|a_GEOShape", vertex=8)
+    cmds.create("|ben_GRP|b_GEO", "transform")
+    cmds.create_mesh("|ben_GRP|b_GEO|b_GEOShape", vertex=4)
+    cmds.create("|ben_GRP|root_JNT", "joint")
+    return cmds
+
+
+def _context(cmds):
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance[:] = list(cmds.nodes)
+    return context, instance
+
+
+def test_snapshot_ls():
+    """Snapshot filters by type including inherited types"""
+    cmds = _scene()
+    context, instance = _context(cmds)
+
+    with mocked(cmds):
+        scene = snapshot.get(context)
+
+        assert scene.ls(instance, type="mesh") == [
+            "|ben_GRP|a_GEO|a_GEOShape",
+            "|ben_GRP|b_GEO|b_GEOShape"
+        ]
+        assert "|ben_GRP|root_JNT" in scene.ls(instance, type="transform")
+        assert scene.ls(instance, type="joint") == ["|ben_GRP|root_JNT"]
+
+
+def test_snapshot_queries_once():
+    """Repeated queries of the snapshot don't reach the scene"""
+    cmds = _scene()
+    context, instance = _context(cmds)
+
+    with mocked(cmds):
+        for _ in range(10):
+            scene = snapshot.get(context)
+            for mesh in scene.ls(instance, type="mesh"):
+                scene.mesh_stats(mesh)
+
+    # One call to resolve the members and one for the type
+    assert cmds.calls["ls"] == 2, cmds.calls
+    assert cmds.calls["polyEvaluate"] == 2, cmds.calls
+
+
+def test_snapshot_hierarchy():
+    """Parent, children and shapes are derived from the long names"""
+    cmds = _scene()
+    context, instance = _context(cmds)
+
+    with mocked(cmds):
+        scene = snapshot.get(context)
+        scene.members(instance)
+
+        assert scene.parent("|ben_GRP|a_GEO") == "|ben_GRP"
+        assert scene.parent("|ben_GRP") is None
+        assert sorted(scene.children("|ben_GRP")) == [
+            "|ben_GRP|a_GEO",
+            "|ben_GRP|b_GEO",
+            "|ben_GRP|root_JNT"
+        ]
+        assert scene.shapes("|ben_GRP|a_GEO") == ["|ben_GRP|a_GEO|a_GEOShape"]
+        assert scene.shapes("|ben_GRP") == []
+
+
+def test_snapshot_invalidate():
+    """An invalidated snapshot queries the scene anew"""
+    cmds = _scene()
+    context, instance = _context(cmds)
+
+    with mocked(cmds):
+        scene = snapshot.get(context)
+        assert scene.mesh_stats("|ben_GRP|b_GEO|b_GEOShape")["vertex"] == 4
+
+        cmds.node("|ben_GRP|b_GEO|b_GEOShape").stats["vertex"] = 5
+        assert scene.mesh_stats("|ben_GRP|b_GEO|b_GEOShape")["vertex"] == 4
+
+        snapshot.invalidate(context)
+        scene = snapshot.get(context)
+        assert scene.mesh_stats("|ben_GRP|b_GEO|b_GEOShape")["vertex"] == 5
+
+
+def test_snapshot_no_intermediate():
+    """Intermediate objects can be excluded"""
+    cmds = _scene()
+    cmds.create_mesh("|ben_GRP|a_GEO|a_GEOShapeOrig", intermediateObject=True)
+    context, instance = _context(cmds)
+
+    with mocked(cmds):
+        scene = snapshot.get(context)
+        meshes = scene.ls(instance, type="mesh")
+        assert "|ben_GRP|a_GEO|a_GEOShapeOrig" in meshes
+
+        meshes = scene.ls(instance, type="mesh", noIntermediate=True)
+        assert "|ben_GRP|a_GEO|a_GEOShapeOrig" not in meshes
+        assert len(meshes) == 2
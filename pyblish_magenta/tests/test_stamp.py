@@ -0,0 +1,154 @@
+import os
+import runpy
+import shutil
+import tempfile
+
+import pyblish.api
+
+from pyblish_magenta import lib, snapshot, stamp
+
+from .mock_cmds import MockCmds, mocked
+
+PLUGINS = os.path.join(lib.PLUGINS_PATH, "workflow", "maya")
+
+_tempdir = None
+
+
+class ValidateA(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    version = (0, 1, 0)
+
+
+class ValidateB(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    version = (0, 1, 0)
+
+
+class ExtractA(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+
+
+def setup_module():
+    global _tempdir
+    _tempdir = tempfile.mkdtemp()
+    os.environ[stamp.ENV] = "1"
+
+
+def teardown_module():
+    shutil.rmtree(_tempdir)
+    os.environ.pop(stamp.ENV)
+
+
+def _published(name, contents=b"//Maya ASCII"):
+    path = os.path.join(_tempdir, name)
+    with open(path, "wb") as f:
+        f.write(contents)
+    return path
+
+
+def _scene(path):
+    """Return scene with a referenced and a local mesh"""
+    cmds = MockCmds()
+    cmds.create("|ben_GRP", "transform")
+    cmds.create("|ben_GRP|ben_GEO", "transform")
+    cmds.create_mesh("|ben_GRP|ben_GEO|ben_GEOShape", uvcoord=0)
+    cmds.create("|tom_GEO", "transform")
+    cmds.create_mesh("|tom_GEO|tom_GEOShape", uvcoord=0)
+    cmds.references["benRN"] = (path, ["ben_GRP", "ben_GEO",
+                                       "ben_GEOShape"])
+    cmds.references["sharedReferenceNode"] = None
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben_rig")
+    instance[:] = list(cmds.nodes)
+    return cmds, instance
+
+
+def test_read_write():
+    """Stamps are only valid for the file they were written for"""
+    path = _published("ben_model.ma")
+    stamp.write(path, {"ValidateA": [0, 1, 0]})
+
+    assert os.path.exists(path + stamp.SUFFIX)
+    assert stamp.read(path) == {"ValidateA": [0, 1, 0]}
+
+    with open(path, "ab") as f:
+        f.write(b"\n// Changed")
+    assert stamp.read(path) is None
+
+    assert stamp.read(_published("unstamped.ma")) is None
+
+
+def test_passed_validators():
+    """Only validators without errors are recorded"""
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+
+    def result(plugin, error=None):
+        return {"plugin": plugin, "instance": instance, "error": error}
+
+    context.data["results"] = [result(ValidateA),
+                               result(ValidateB, ValueError("Invalid")),
+                               result(ExtractA)]
+
+    assert stamp.passed_validators(instance) == {"ValidateA": [0, 1, 0]}
+
+
+def test_unstamped():
+    """Nodes of references stamped by the same version are skipped"""
+    path = _published("ben_rig.ma")
+    stamp.write(path, {"ValidateA": [0, 1, 0]})
+
+    cmds, instance = _scene(path)
+    nodes = ["|ben_GRP|ben_GEO|ben_GEOShape", "|tom_GEO|tom_GEOShape"]
+
+    with mocked(cmds):
+        remaining = stamp.unstamped(ValidateA, instance, nodes)
+        assert remaining == ["|tom_GEO|tom_GEOShape"], remaining
+
+        # Not stamped by this validator
+        remaining = stamp.unstamped(ValidateB, instance, nodes)
+        assert remaining == nodes, remaining
+
+        os.environ[stamp.ENV] = "0"
+        try:
+            remaining = stamp.unstamped(ValidateA, instance, nodes)
+        finally:
+            os.environ[stamp.ENV] = "1"
+        assert remaining == nodes, remaining
+
+    # Each reference is queried once per publish
+    assert cmds.calls["referenceQuery"] <= 4, cmds.calls
+
+
+def test_edited():
+    """Nodes with reference edits are validated regardless of stamps"""
+    path = _published("ben_edited.ma")
+    stamp.write(path, {"ValidateA": [0, 1, 0]})
+
+    cmds, instance = _scene(path)
+    cmds.edits["benRN"] = ["ben_GEOShape.uvSet[0].uvSetName"]
+    nodes = ["|ben_GRP|ben_GEO", "|ben_GRP|ben_GEO|ben_GEOShape"]
+
+    with mocked(cmds):
+        remaining = stamp.unstamped(ValidateA, instance, nodes)
+        assert remaining == ["|ben_GRP|ben_GEO|ben_GEOShape"], remaining
+
+
+def test_validator():
+    """Validators skip the nodes of stamped references"""
+    cmds, instance = _scene(_published("ben_layout.ma"))
+
+    with mocked(cmds):
+        plugin = runpy.run_path(os.path.join(
+            PLUGINS, "validate_mesh_has_uv.py"))["ValidateMeshHasUVs"]
+
+        invalid = plugin.get_invalid(instance)
+        assert len(invalid) == 2, invalid
+
+        path = cmds.references["benRN"][0]
+        stamp.write(path, {plugin.__name__: list(plugin.version)})
+        snapshot.invalidate(instance.context)
+
+        invalid = plugin.get_invalid(instance)
+        assert invalid == ["|tom_GEO|tom_GEOShape"], invalid
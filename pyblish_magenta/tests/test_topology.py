@@ -0,0 +1,196 @@
+import os
+import json
+import runpy
+import shutil
+import tempfile
+
+import pyblish.api
+
+from pyblish_magenta import lib, cache, incremental
+from pyblish_magenta.lib import topology
+
+from .mock_cmds import MockCmds, mocked
+
+PLUGINS = os.path.join(lib.PLUGINS_PATH, "workflow", "maya")
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "poly_info.json")
+
+
+def setup_module():
+    os.environ[cache.ENV] = tempfile.mkdtemp()
+
+
+def teardown_module():
+    shutil.rmtree(os.environ.pop(cache.ENV))
+
+
+def _scene():
+    """Return scene and instance of the meshes of the recorded output"""
+    with open(FIXTURE) as f:
+        recorded = json.load(f)
+
+    cmds = MockCmds()
+    for index, mesh in enumerate(recorded.pop("meshes")):
+        parts = mesh.split("|")
+        for i in range(2, len(parts)):
+            path = "|".join(parts[:i])
+            if path not in cmds.nodes:
+                cmds.create(path, "transform")
+
+        # Each of a different topology
+        cmds.create_mesh(mesh, face=6 + index)
+
+    cmds.poly_info.update(recorded)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance.data["family"] = "model"
+    instance[:] = list(cmds.nodes)
+
+    return cmds, instance
+
+
+def test_name_index():
+    """Short, partial, namespaced and long names resolve to the mesh"""
+    index = topology.NameIndex(["|grp|ns:pCube1|ns:pCubeShape1",
+                                "|a|pCube2|pCubeShape2",
+                                "|b|pCube2|pCubeShape2"])
+
+    assert index.resolve("ns:pCube1") == "|grp|ns:pCube1|ns:pCubeShape1"
+    assert index.resolve("ns:pCubeShape1") == "|grp|ns:pCube1|ns:pCubeShape1"
+    assert index.resolve("|grp|ns:pCube1") == "|grp|ns:pCube1|ns:pCubeShape1"
+    assert index.resolve("b|pCube2") == "|b|pCube2|pCubeShape2"
+    assert index.resolve("pCube1") is None
+    assert index.resolve("pCube2") is None
+
+
+def test_poly_info():
+    """A single call finds the components of all meshes"""
+    cmds, instance = _scene()
+    meshes = [node for node in instance if cmds.nodes[node].type == "mesh"]
+
+    with mocked(cmds):
+        lamina = topology.poly_info(meshes, "laminaFaces")
+        edges = topology.poly_info(meshes, "nonManifoldEdges")
+        empty = topology.poly_info([], "laminaFaces")
+
+    assert cmds.calls["polyInfo"] == 2
+    assert empty == {}
+    assert lamina == {
+        "|ben_GRP|ben_GEO|ben_GEOShape": ["ben_GEO.f[3]", "ben_GEO.f[7:9]"],
+        "|ben_GRP|arm_GRP|hand_GEO|hand_GEOShape": ["arm_GRP|hand_GEO.f[0]"],
+        "|char:body_GRP|char:body_GEO|char:body_GEOShape":
+            ["char:body_GEO.f[12]"],
+    }, lamina
+    assert edges == {
+        "|ben_GRP|ben_GEO|ben_GEOShape": ["ben_GEOShape.e[5]"],
+        "|char:body_GRP|char:body_GEO|char:body_GEOShape":
+            ["|char:body_GRP|char:body_GEO.e[8]"],
+    }, edges
+
+
+def test_validators():
+    """Validators query all meshes of the instance at once"""
+    cmds, instance = _scene()
+
+    os.environ[incremental.ENV] = "0"
+    try:
+        _test_validators(cmds, instance)
+    finally:
+        os.environ.pop(incremental.ENV)
+
+
+def _test_validators(cmds, instance):
+    with mocked(cmds):
+        lamina = runpy.run_path(
+            os.path.join(PLUGINS, "validate_mesh_lamina_faces.py")
+        )["ValidateMeshLaminaFaces"]
+        manifold = runpy.run_path(
+            os.path.join(PLUGINS, "validate_mesh_non_manifold.py")
+        )["ValidateMeshNonManifold"]
+
+        assert lamina.get_invalid(instance) == [
+            "|ben_GRP|ben_GEO|ben_GEOShape",
+            "|ben_GRP|arm_GRP|hand_GEO|hand_GEOShape",
+            "|char:body_GRP|char:body_GEO|char:body_GEOShape",
+        ]
+        assert sorted(manifold.get_invalid(instance)) == [
+            "|ben_GRP|ben_GEO|ben_GEOShape",
+            "|ben_GRP|leg_GRP|hand_GEO|hand_GEOShape",
+            "|char:body_GRP|char:body_GEO|char:body_GEOShape",
+        ]
+
+    assert cmds.calls["polyInfo"] == 3
+
+
+def test_cached():
+    """Meshes of the same topology are checked once"""
+    cmds, instance = _scene()
+    meshes = [node for node in instance if cmds.nodes[node].type == "mesh"]
+    topology.get_cache().clear()
+
+    with mocked(cmds):
+        first = topology.cached_poly_info(meshes, "laminaFaces")
+
+        # Only the fingerprints are queried
+        cmds.reset()
+        assert topology.cached_poly_info(meshes, "laminaFaces") == first
+        assert cmds.calls["polyInfo"] == len(meshes), cmds.calls
+
+        # A mesh of the same topology shares the results
+        cmds.create("|copy_GEO", "transform")
+        cmds.create_mesh("|copy_GEO|copy_GEOShape")
+        copy = topology.cached_poly_info(["|copy_GEO|copy_GEOShape"],
+                                         "laminaFaces")
+
+    assert first["|ben_GRP|ben_GEO|ben_GEOShape"] == [
+        "|ben_GRP|ben_GEO|ben_GEOShape.f[3]",
+        "|ben_GRP|ben_GEO|ben_GEOShape.f[7:9]",
+    ], first
+    assert copy == {"|copy_GEO|copy_GEOShape": [
+        "|copy_GEO|copy_GEOShape.f[3]",
+        "|copy_GEO|copy_GEOShape.f[7:9]",
+    ]}, copy
+
+
+def test_intermediate_shapes():
+    """Components named by the transform of a deformed mesh resolve"""
+    cmds, instance = _scene()
+    orig = "|ben_GRP|ben_GEO|ben_GEOShapeOrig"
+    cmds.create_mesh(orig, intermediateObject=True)
+    instance.append(orig)
+
+    os.environ[incremental.ENV] = "0"
+    try:
+        with mocked(cmds):
+            lamina = runpy.run_path(
+                os.path.join(PLUGINS, "validate_mesh_lamina_faces.py")
+            )["ValidateMeshLaminaFaces"]
+            invalid = lamina.get_invalid(instance)
+    finally:
+        os.environ.pop(incremental.ENV)
+
+    assert "|ben_GRP|ben_GEO|ben_GEOShape" in invalid, invalid
+    assert orig not in invalid, invalid
+
+
+def test_unresolved_not_cached():
+    """Meshes are not cached as valid when components are unresolved"""
+    topology.get_cache().clear()
+    meshes = ["|a_GEO|a_GEOShape", "|b_GEO|b_GEOShape"]
+
+    def compute(missing):
+        return {"unknown_GEO": ["unknown_GEO.f[3]"]}
+
+    cmds = MockCmds()
+    for mesh in meshes:
+        cmds.create(mesh.rsplit("|", 1)[0], "transform")
+        cmds.create_mesh(mesh, face=100 + len(cmds.nodes))
+
+    with mocked(cmds):
+        found = topology.cached("unresolved", meshes, compute)
+        assert found == {"unknown_GEO": ["unknown_GEO.f[3]"]}, found
+
+        # Computed again, rather than passing from cache
+        found = topology.cached("unresolved", meshes, lambda missing: {})
+        assert found == {}, found
+        assert topology.cached("unresolved", meshes, None) == {}
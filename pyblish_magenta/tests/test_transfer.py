@@ -0,0 +1,169 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+import pyblish.api
+
+from pyblish_magenta import transfer
+from pyblish_magenta.plugin import Integrator, METADATA
+
+_tempdir = None
+
+
+def setup_module():
+    global _tempdir
+    _tempdir = tempfile.mkdtemp()
+
+
+def teardown_module():
+    shutil.rmtree(_tempdir)
+
+
+def _file(relative, contents):
+    path = os.path.join(_tempdir, relative)
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as f:
+        f.write(contents)
+    return path
+
+
+def test_copy():
+    """Files are copied and checksummed in a single pass"""
+    contents = os.urandom(10000)
+    src = _file("copy/ben.abc", contents)
+
+    for chunk_size in (7, 4096, transfer.CHUNK_SIZE):
+        dst = src + ".%i" % chunk_size
+        digest = transfer.copy(src, dst, chunk_size=chunk_size)
+        assert digest == hashlib.sha256(contents).hexdigest()
+        with open(dst, "rb") as f:
+            assert f.read() == contents
+
+    # Without checksum, copied by the kernel where supported
+    assert transfer.copy(src, src + ".kernel", algorithm=None) is None
+    with open(src + ".kernel", "rb") as f:
+        assert f.read() == contents
+
+
+def test_move_tree():
+    """All files are moved, including those in subdirectories"""
+    _file("extract/ben.abc", b"abc")
+    _file("extract/textures/ben.tx", b"tx")
+
+    dst = os.path.join(_tempdir, "publish")
+    checksums = transfer.move_tree(os.path.join(_tempdir, "extract"), dst,
+                                   algorithm="md5")
+
+    assert checksums == {
+        "ben.abc": hashlib.md5(b"abc").hexdigest(),
+        "textures/ben.tx": hashlib.md5(b"tx").hexdigest(),
+    }, checksums
+    assert os.path.exists(os.path.join(dst, "textures", "ben.tx"))
+    assert not os.path.exists(os.path.join(_tempdir, "extract", "ben.abc"))
+
+
+def test_integrate():
+    """Checksums are added to the extracted metadata"""
+    extract_dir = os.path.dirname(_file("integrate/ben.ma", b"ma"))
+    _file("integrate/" + METADATA, json.dumps({"author": "ben"}).encode())
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance.data["extractDir"] = extract_dir
+
+    directory = os.path.join(_tempdir, "integrated", "v001")
+    checksums = Integrator().integrate(instance, directory)
+
+    assert checksums == {"ben.ma": hashlib.sha256(b"ma").hexdigest()}
+    with open(os.path.join(directory, METADATA)) as f:
+        metadata = json.load(f)
+
+    assert metadata == {"author": "ben",
+                        "checksums": {"algorithm": "sha256",
+                                      "files": checksums}}, metadata
+
+    # Measured before moving the files
+    size = len(b"ma") + len(json.dumps({"author": "ben"}).encode())
+    assert context.data["extractionUsage"] == {"ben": size}
+
+
+def test_rollback():
+    """A failing file moves all files back and leaves no directory"""
+    src = os.path.join(_tempdir, "rollback")
+    for i in range(20):
+        _file("rollback/frames/ben.%04i.png" % i, b"png")
+    _file("rollback/ben.mov", b"mov")
+
+    class Failing(transfer.Transaction):
+        def stage(self, src, relative):
+            digest = super(Failing, self).stage(src, relative)
+            if relative == "frames/ben.0013.png":
+                raise IOError("Disk full")
+            return digest
+
+    dst = os.path.join(_tempdir, "failed", "v001")
+    try:
+        with Failing(dst) as transaction:
+            transaction.stage_tree(src, processes=4)
+    except IOError:
+        pass
+    else:
+        assert False, "Expected the transfer to fail"
+
+    assert not os.path.exists(os.path.dirname(dst))
+    assert len(os.listdir(os.path.join(src, "frames"))) == 20
+    assert os.path.exists(os.path.join(src, "ben.mov"))
+
+    # Succeeds once the cause is resolved
+    checksums = transfer.move_tree(src, dst, processes=4)
+    assert len(checksums) == 21
+    assert sorted(os.listdir(dst)) == ["ben.mov", "frames"]
+
+
+def test_rollback_written():
+    """Files replaced by written values are moved back unchanged"""
+    src = os.path.dirname(_file("written/" + METADATA, b"extracted"))
+    dst = os.path.join(_tempdir, "written_failed", "v001")
+
+    try:
+        with transfer.Transaction(dst) as transaction:
+            transaction.stage_tree(src)
+            transaction.write(METADATA, b"integrated")
+            assert transaction.read(METADATA) == b"integrated"
+            raise IOError("Disk full")
+    except IOError:
+        pass
+
+    assert not os.path.exists(os.path.dirname(dst))
+    with open(os.path.join(src, METADATA), "rb") as f:
+        assert f.read() == b"extracted"
+
+    with transfer.Transaction(dst) as transaction:
+        transaction.stage_tree(src)
+        transaction.write(METADATA, b"integrated")
+
+    assert os.listdir(dst) == [METADATA]
+    with open(os.path.join(dst, METADATA), "rb") as f:
+        assert f.read() == b"integrated"
+
+
+def test_staged_twice():
+    """Files staged twice remain in their source"""
+    first = _file("twice/a/ben.abc", b"a")
+    second = _file("twice/b/ben.abc", b"b")
+    dst = os.path.join(_tempdir, "twice_failed")
+
+    try:
+        with transfer.Transaction(dst) as transaction:
+            transaction.stage(first, "ben.abc")
+            transaction.stage(second, "ben.abc")
+    except ValueError:
+        pass
+    else:
+        assert False, "Expected staging twice to fail"
+
+    assert os.path.exists(first) and os.path.exists(second)
+    assert not os.path.exists(dst)
@@ -0,0 +1,172 @@
+import os
+import sys
+import types
+import runpy
+
+import pyblish.api
+
+from pyblish_magenta import lib
+from pyblish_magenta.lib import bounds
+
+from .mock_cmds import MockCmds, mocked
+
+PLUGINS = os.path.join(lib.PLUGINS_PATH, "workflow", "maya")
+
+
+def _load(cmds, filename, name):
+    with mocked(cmds):
+        return runpy.run_path(os.path.join(PLUGINS, filename))[name]
+
+
+def test_transform_zero():
+    """Bulk and per transform checks find the same transforms"""
+    cmds = MockCmds()
+    cmds.create("|ben_GRP", "transform")
+    cmds.create("|ben_GRP|frozen_GEO", "transform")
+    moved = cmds.create("|ben_GRP|moved_GEO", "transform")
+    moved.attrs["matrix"] = [1.0, 0.0, 0.0, 0.0,
+                             0.0, 1.0, 0.0, 0.0,
+                             0.0, 0.0, 1.0, 0.0,
+                             0.0, 2.5, 0.0, 1.0]
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance[:] = list(cmds.nodes)
+
+    plugin = _load(cmds, "validate_transform_zero.py",
+                   "ValidateTransformZero")
+
+    with mocked(cmds):
+        invalid = plugin.get_invalid(instance)
+        assert cmds.calls["xform"] == 0
+
+        plugin.bulk = False
+        assert plugin.get_invalid(instance) == invalid
+
+    assert invalid == ["|ben_GRP|moved_GEO"], invalid
+
+
+def test_scene_dimensions():
+    """Only the children of groups beyond limits are checked"""
+    cmds = MockCmds()
+    for group in ("|near_GRP", "|far_GRP"):
+        cmds.create(group, "transform")
+        for i in range(3):
+            transform = "%s|mesh%i_GEO" % (group, i)
+            cmds.create(transform, "transform")
+            shape = cmds.create_mesh(transform + "|mesh%i_GEOShape" % i)
+            shape.bounds = (-1.0, -1.0, -1.0, 1.0, 1.0, 1.0)
+
+    far = cmds.node("|far_GRP|mesh1_GEO|mesh1_GEOShape")
+    far.bounds = (-1.0, -1.0, 2e5, 1.0, 1.0, 2e5 + 1)
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance[:] = list(cmds.nodes)
+
+    plugin = _load(cmds, "validate_scene_dimensions.py",
+                   "ValidateSceneDimensions")
+
+    with mocked(cmds):
+        invalid = plugin.get_invalid(instance)
+
+    assert invalid == ["|far_GRP|mesh1_GEO"], invalid
+
+    # Both groups and the children of the far group
+    assert cmds.calls["xform"] == 5, cmds.calls["xform"]
+
+
+class _BoundingBox(object):
+    def __init__(self, bounds):
+        self.min = list(bounds[:3])
+        self.max = list(bounds[3:])
+
+    def transformUsing(self, translation):
+        self.min = [a + b for a, b in zip(self.min, translation)]
+        self.max = [a + b for a, b in zip(self.max, translation)]
+
+
+class _DagPath(object):
+    """Translations only, by long name of the node"""
+
+    translations = dict()
+
+    def __init__(self, node):
+        self.node = node
+
+    def _translation(self, paths):
+        translation = [0.0, 0.0, 0.0]
+        for path in paths:
+            offset = self.translations.get(path, (0.0, 0.0, 0.0))
+            translation = [a + b for a, b in zip(translation, offset)]
+        return translation
+
+    def _ancestors(self):
+        parts = self.node.split("|")
+        return ["|".join(parts[:i]) for i in range(2, len(parts))]
+
+    def inclusiveMatrix(self):
+        return self._translation(self._ancestors() + [self.node])
+
+    def exclusiveMatrix(self):
+        return self._translation(self._ancestors())
+
+
+def _open_maya(boxes):
+    """Return stand-in of `maya.api.OpenMaya` with object space `boxes`"""
+    om = types.ModuleType("maya.api.OpenMaya")
+
+    class MSelectionList(object):
+        def __init__(self):
+            self.nodes = list()
+
+        def clear(self):
+            self.nodes[:] = []
+
+        def add(self, node):
+            self.nodes.append(node)
+
+        def getDagPath(self, index):
+            return _DagPath(self.nodes[index])
+
+    class MFnDagNode(object):
+        def setObject(self, path):
+            self.path = path
+
+        @property
+        def boundingBox(self):
+            # Including the transformation of the node, like Maya
+            box = _BoundingBox(boxes[self.path.node])
+            box.transformUsing(
+                _DagPath.translations.get(self.path.node, (0, 0, 0)))
+            return box
+
+    om.MSelectionList = MSelectionList
+    om.MFnDagNode = MFnDagNode
+    return om
+
+
+def test_world_bounds_api():
+    """Bounds through the API apply the transform of each node once"""
+    _DagPath.translations = {"|ben_GRP": (10.0, 0.0, 0.0),
+                             "|ben_GRP|ben_GEO": (0.0, 5.0, 0.0)}
+    om = _open_maya({"|ben_GRP": (-1.0, 4.0, -1.0, 1.0, 6.0, 1.0),
+                     "|ben_GRP|ben_GEO": (-1.0, -1.0, -1.0, 1.0, 1.0, 1.0)})
+
+    api = types.ModuleType("maya.api")
+    api.OpenMaya = om
+
+    with mocked(MockCmds()):
+        sys.modules["maya"].api = api
+        sys.modules["maya.api"] = api
+        sys.modules["maya.api.OpenMaya"] = om
+        try:
+            found = bounds.get_world_bounds(["|ben_GRP", "|ben_GRP|ben_GEO"])
+        finally:
+            sys.modules.pop("maya.api")
+            sys.modules.pop("maya.api.OpenMaya")
+
+    assert [list(row) for row in found] == [
+        [9.0, 4.0, -1.0, 11.0, 6.0, 1.0],
+        [9.0, 4.0, -1.0, 11.0, 6.0, 1.0],
+    ], found
@@ -0,0 +1,64 @@
+import os
+import time
+import shutil
+import tempfile
+import threading
+
+from pyblish_magenta import versions
+
+
+# Modification time of directories modified long enough ago to be cached
+PAST = time.time() - 60
+
+
+def _directory(names):
+    directory = tempfile.mkdtemp()
+    for name in names:
+        os.mkdir(os.path.join(directory, name))
+    os.utime(directory, (PAST, PAST))
+    return directory
+
+
+def test_next_version():
+    """Directories are only listed again once modified"""
+    versions.clear()
+    directory = _directory(["v001", "v002", "v7_22_6", "latest"])
+    try:
+        assert versions.next_version(directory) == 7
+
+        # Cached, unless the modification time changes
+        os.rmdir(os.path.join(directory, "v7_22_6"))
+        os.utime(directory, (PAST, PAST))
+        assert versions.next_version(directory) == 7
+
+        os.mkdir(os.path.join(directory, "v010"))
+        assert versions.next_version(directory) == 11
+    finally:
+        shutil.rmtree(directory)
+
+    assert versions.next_version(directory) == 1
+
+
+def test_reserve():
+    """Simultaneous publishers each reserve a version of their own"""
+    versions.clear()
+    directory = _directory(["v001"])
+    try:
+        reserved = list()
+
+        def publish():
+            reserved.append(versions.reserve(directory))
+
+        threads = [threading.Thread(target=publish) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(version for version, _ in reserved) == \
+            list(range(2, 12)), reserved
+        for version, path in reserved:
+            assert path == os.path.join(directory, "v%03d" % version)
+            assert os.path.isdir(path)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,76 @@
+import pyblish.api
+
+from pyblish_magenta import snapshot
+from pyblish_magenta.lib import visibility
+
+from .mock_cmds import MockCmds, mocked
+
+
+def _scene():
+    cmds = MockCmds()
+    cmds.create("|rig_GRP", "transform")
+    cmds.create("|rig_GRP|hidden_GRP", "transform", visibility=False)
+    cmds.create("|rig_GRP|layer_GRP", "transform",
+                overrideEnabled=True, overrideVisibility=False)
+    cmds.create("|rig_GRP|shown_GRP", "transform",
+                overrideEnabled=True, overrideVisibility=True)
+
+    joints = list()
+    for group in ("hidden_GRP", "layer_GRP", "shown_GRP"):
+        for i in range(3):
+            joint = "|rig_GRP|%s|joint%i_JNT" % (group, i)
+            cmds.create(joint, "joint")
+            joints.append(joint)
+
+    return cmds, joints
+
+
+def test_visible():
+    """Parents hide their children, display layers only when enabled"""
+    cmds, joints = _scene()
+
+    with mocked(cmds):
+        resolver = visibility.Resolver()
+        visible = resolver.visible(joints)
+        ignore_layers = resolver.visible(joints, displayLayer=False)
+
+    shown = sorted(joint for joint in joints if visible[joint])
+    assert shown == ["|rig_GRP|shown_GRP|joint%i_JNT" % i
+                     for i in range(3)], shown
+
+    shown = sorted(joint for joint in joints if ignore_layers[joint])
+    assert len(shown) == 6 and not any("hidden_GRP" in node
+                                       for node in shown), shown
+
+
+def test_intermediate_object():
+    """Only the node itself is checked for being an intermediate object"""
+    cmds = MockCmds()
+    cmds.create("|ben_GEO", "transform", intermediateObject=True)
+    cmds.create("|ben_GEO|ben_GEOShape", "mesh")
+    cmds.create("|ben_GEO|ben_GEOShapeOrig", "mesh", intermediateObject=True)
+
+    with mocked(cmds):
+        visible = visibility.Resolver().visible(["|ben_GEO|ben_GEOShape",
+                                                 "|ben_GEO|ben_GEOShapeOrig"])
+
+    assert visible == {"|ben_GEO|ben_GEOShape": True,
+                       "|ben_GEO|ben_GEOShapeOrig": False}, visible
+
+
+def test_shared():
+    """Attributes are read once per publish, until the scene changes"""
+    cmds, joints = _scene()
+    context = pyblish.api.Context()
+
+    with mocked(cmds):
+        resolver = visibility.get(context)
+        resolver.visible(joints[:3])
+        calls = cmds.calls["getAttr"]
+
+        assert visibility.get(context) is resolver
+        visibility.get(context).visible(joints[:3], displayLayer=False)
+        assert cmds.calls["getAttr"] == calls
+
+        snapshot.invalidate(context)
+        assert visibility.get(context) is not resolver
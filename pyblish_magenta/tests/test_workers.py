@@ -0,0 +1,81 @@
+import os
+import sys
+import shutil
+import tempfile
+import runpy
+
+import pyblish.api
+
+from pyblish_magenta import workers, lib
+
+from .mock_cmds import MockCmds, mocked
+
+FAKE_MAYAPY = [sys.executable,
+               os.path.join(os.path.dirname(__file__), "fake_mayapy.py")]
+
+PLUGIN = os.path.join(lib.PLUGINS_PATH, "workflow", "maya",
+                      "extract_alembic_workers.py")
+
+
+def test_run():
+    """Each process runs with its own arguments, failures are reported"""
+    errors = workers.run([["-c", "import sys; sys.exit(0)"],
+                          ["-c", "import sys; sys.exit('Failed')"]],
+                         command=[sys.executable])
+
+    assert errors[0] is None, errors
+    assert "Failed" in errors[1], errors
+
+
+def test_run_missing_executable():
+    """A command that can't be started is reported as error"""
+    errors = workers.run([["a"]], command=["/non/existing/mayapy"])
+    assert "Could not start" in errors[0], errors
+
+
+def test_mayapy_environment():
+    """The command of the workers may be overridden"""
+    os.environ[workers.ENV] = "python -u /path/to/fake.py"
+    try:
+        assert workers.mayapy() == ["python", "-u", "/path/to/fake.py"]
+    finally:
+        os.environ.pop(workers.ENV)
+
+
+def test_extract_alembic_workers():
+    """Instances are extracted by workers, failures are left for later"""
+    plugin = runpy.run_path(PLUGIN)["ExtractAlembicWorkers"]
+
+    cmds = MockCmds()
+    cmds.create("|ben_GRP", "transform")
+    cmds.create("|ben_GRP|ben_GEO", "transform")
+    cmds.create("|fail_GRP", "transform")
+
+    context = pyblish.api.Context()
+    for name, members in (("ben", ["|ben_GRP", "|ben_GRP|ben_GEO"]),
+                          ("fail", ["|fail_GRP"])):
+        instance = context.create_instance(name)
+        instance.data["family"] = "pointcache"
+        instance.data["setMembers"] = members
+        instance.data["extractDir"] = tempfile.mkdtemp()
+
+    os.environ[workers.ENV] = " ".join(FAKE_MAYAPY)
+    try:
+        with mocked(cmds):
+            plugin().process(context)
+
+        ben, fail = context
+        with open(ben.data["alembicOutput"]) as f:
+            job = f.read()
+    finally:
+        os.environ.pop(workers.ENV)
+        for instance in context:
+            shutil.rmtree(instance.data["extractDir"])
+
+    assert ben.data["alembicOutput"].endswith("ben.abc")
+    assert "-root |ben_GRP " in job, job
+    assert "-frameRange 1.0 10.0" in job, job
+    assert "-selection" not in job, job
+
+    assert "alembicOutput" not in fail.data
+    assert "Failed to export" in fail.data["alembicError"]
@@ -0,0 +1,104 @@
+import os
+import errno
+import shutil
+import socket
+import tempfile
+
+from pyblish_magenta import workspace
+
+
+def _workspace(**kwargs):
+    return workspace.Workspace(tempfile.mkdtemp(), **kwargs)
+
+
+def test_acquire_release():
+    """Directories are empty, unique and removed in the background"""
+    ws = _workspace(spare=2)
+    try:
+        paths = [ws.acquire() for _ in range(3)]
+        assert len(set(paths)) == 3
+        for path in paths:
+            assert os.path.dirname(path) == ws.directory
+            assert os.listdir(path) == []
+
+        with open(os.path.join(paths[0], "ben.abc"), "wb") as f:
+            f.write(b"0" * 100)
+
+        assert ws.release(paths[0]) == 100
+        ws.wait()
+        assert not os.path.exists(paths[0])
+
+        # Spare directories are kept ready
+        assert len(os.listdir(ws.directory)) == 2 + 2
+    finally:
+        ws.wait()
+        shutil.rmtree(ws.root)
+
+
+def test_removed():
+    """Directories are handed out after the session directory is removed"""
+    ws = _workspace()
+    try:
+        ws.acquire()
+        ws.wait()
+
+        removed = ws.directory
+        shutil.rmtree(removed)
+
+        path = ws.acquire()
+        assert os.path.isdir(path)
+        assert ws.directory != removed
+        assert os.path.dirname(path) == ws.directory
+    finally:
+        ws.wait()
+        shutil.rmtree(ws.root)
+
+
+def test_collect():
+    """Directories of sessions no longer running are removed"""
+    ws = _workspace()
+    try:
+        host = socket.gethostname()
+
+        # A process id that isn't running, yet is valid
+        dead = os.path.join(ws.root, "%s%s-%i-abc" % (workspace.PREFIX,
+                                                      host, 2 ** 22 + 1))
+        alive = os.path.join(ws.root, "%s%s-%i-abc" % (workspace.PREFIX,
+                                                       host, os.getpid()))
+        remote = os.path.join(ws.root, "%sother-host-1-abc"
+                              % workspace.PREFIX)
+        other = os.path.join(ws.root, "unrelated")
+        for path in (dead, alive, remote, other):
+            os.makedirs(os.path.join(path, "tmp1"))
+
+        ws.acquire()
+        ws.wait()
+
+        assert not os.path.exists(dead)
+        assert all(os.path.exists(path) for path in (alive, remote, other))
+    finally:
+        ws.wait()
+        shutil.rmtree(ws.root)
+
+
+def test_retry():
+    """Directories failing to be removed are retried"""
+    cleaner = workspace.Cleaner(retries=3, delay=0)
+    path = tempfile.mkdtemp()
+    failures = [OSError(errno.EACCES, "In use")]
+
+    original = shutil.rmtree
+
+    def rmtree(path):
+        if failures:
+            raise failures.pop()
+        original(path)
+
+    workspace.shutil.rmtree = rmtree
+    try:
+        assert cleaner._remove(path)
+    finally:
+        workspace.shutil.rmtree = original
+
+    assert not failures
+    assert not os.path.exists(path)
@@ -0,0 +1,433 @@
+"""Transfer of extracted files, checksummed in the same pass
+
+Copying a file and then reading it back to checksum it reads it twice.
+Instead the file is copied in chunks, each chunk being hashed in between
+reading and writing it. Files moved within a volume are renamed instead
+and read once to checksum them.
+
+Without checksum, files are copied by the kernel where supported, through
+`os.copy_file_range()` or `os.sendfile()`. These never pass the contents
+through Python and as such can't be combined with hashing.
+
+Many files are moved at once by a pool of threads, as part of a
+`Transaction`. Each file is written under a temporary name next to its
+destination first and all of them are renamed into place once all have
+been written, such that a failure never leaves part of them behind.
+
+Example:
+    >> transfer.copy("/tmp/ben.abc", "/publish/ben.abc")
+    '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+    >> transfer.move_tree("/tmp/extract", "/publish/v001")
+    {'ben.abc': '9f86d0...', 'metadata.meta': '2c26b4...'}
+
+Algorithms are those of `hashlib`, e.g. "sha256", and those of `xxhash`,
+e.g. "xxh64", when it's installed.
+
+"""
+
+import io
+import os
+import sys
+import uuid
+import errno
+import shutil
+import hashlib
+import logging
+import itertools
+import threading
+import collections
+import multiprocessing.pool
+
+from . import cache
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Default algorithm to checksum files with
+ALGORITHM = "sha256"
+
+# Amount of bytes read and written at once
+CHUNK_SIZE = 1024 ** 2
+
+# Default amount of files transferred at once
+PROCESSES = 4
+
+log = logging.getLogger(__name__)
+
+
+def hasher(algorithm=ALGORITHM):
+    """Return a new hash object of `algorithm`
+
+    Raises:
+        ValueError: On unknown or unavailable algorithms
+
+    """
+
+    if algorithm.startswith("xxh"):
+        if xxhash is None or not hasattr(xxhash, algorithm):
+            raise ValueError("Unavailable algorithm: %s" % algorithm)
+        return getattr(xxhash, algorithm)()
+
+    return hashlib.new(algorithm)
+
+
+def checksum(path, algorithm=ALGORITHM, chunk_size=CHUNK_SIZE):
+    """Return the hex digest of the contents of the file at `path`"""
+    digest = hasher(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    with io.open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+
+    return digest.hexdigest()
+
+
+def copy(src, dst, algorithm=ALGORITHM, chunk_size=CHUNK_SIZE):
+    """Copy file `src` to `dst`, checksumming it on the way
+
+    The permission bits and times of `src` are copied along,
+    like `shutil.copy2()` does.
+
+    Arguments:
+        src (str): Path to the file to copy
+        dst (str): Path of the copy, replaced when it exists
+        algorithm (str, optional): Algorithm to checksum with,
+            None to copy by the kernel where supported instead
+        chunk_size (int, optional): Bytes to read and write at once
+
+    Returns:
+        str or None: Hex digest of the contents, None without `algorithm`
+
+    """
+
+    digest = hasher(algorithm) if algorithm else None
+
+    with io.open(src, "rb", buffering=0) as fsrc:
+        with io.open(dst, "wb", buffering=0) as fdst:
+            offset = 0
+            if digest is None:
+                offset = _copy_kernel(fsrc, fdst, chunk_size)
+                fsrc.seek(offset)
+                fdst.seek(offset)
+
+            _copy_buffered(fsrc, fdst, digest, chunk_size)
+
+    shutil.copystat(src, dst)
+
+    return digest.hexdigest() if digest is not None else None
+
+
+def move_tree(src, dst, algorithm=ALGORITHM, chunk_size=CHUNK_SIZE,
+              processes=PROCESSES):
+    """Move all files in directory `src` to directory `dst`, all or none
+
+    Directories are created in `dst` as needed, `src` itself remains.
+    When any file fails to move, all files are moved back to `src`.
+
+    Arguments:
+        processes (int, optional): Amount of files moved at once
+
+    Returns:
+        dict: Hex digest by path relative to `dst`, using forward slashes
+
+    """
+
+    with Transaction(dst, algorithm, chunk_size) as transaction:
+        return transaction.stage_tree(src, processes)
+
+
+class Transaction(object):
+    """Files moved into `directory` all at once, or not at all
+
+    Files are staged under a temporary name next to their destination,
+    e.g. ".tmp1a2b3c4d-ben.abc", and renamed into place on `commit()`.
+    On `rollback()` staged and committed files are moved back to their
+    source, or removed when copied, along with the directories created.
+    Staged files replaced through `write()` are moved back unchanged.
+
+    Used as context manager, it commits when the block succeeds and
+    rolls back otherwise.
+
+    Example:
+        >> with Transaction("/publish/v001") as transaction:
+        ..     checksums = transaction.stage_tree("/tmp/extract")
+
+    Arguments:
+        directory (str): Destination of the files, created when needed
+        algorithm (str, optional): Algorithm to checksum with,
+            see `hasher()`, None to not checksum
+        chunk_size (int, optional): Bytes to read and write at once
+
+    """
+
+    def __init__(self, directory, algorithm=ALGORITHM,
+                 chunk_size=CHUNK_SIZE):
+        self.directory = directory
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+
+        # (source, temporary path, renamed) by relative path
+        self._staged = collections.OrderedDict()
+
+        # Staged files replaced by `write()`, like `_staged`
+        self._replaced = dict()
+        self._committed = set()
+        self._created = list()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.rollback()
+            return
+
+        try:
+            self.commit()
+        except Exception:
+            self.rollback()
+            raise
+
+    def stage_tree(self, src, processes=PROCESSES):
+        """Stage all files in directory `src`, `processes` at a time
+
+        Returns:
+            dict: Hex digest by relative path, using forward slashes
+
+        """
+
+        files = list()
+        for base, _, names in os.walk(src):
+            for name in names:
+                path = os.path.join(base, name)
+                relative = os.path.relpath(path, src).replace(os.sep, "/")
+                files.append((path, relative))
+
+        if not files:
+            return dict()
+
+        # All files are staged, or failed to, before the first error
+        # is raised, such that none are staged after a rollback.
+        pool = multiprocessing.pool.ThreadPool(
+            min(processes or PROCESSES, len(files)))
+        try:
+            digests = pool.map(lambda args: self.stage(*args), files)
+        finally:
+            pool.close()
+            pool.join()
+
+        return dict((relative, digest) for (_, relative), digest
+                    in zip(files, digests))
+
+    def stage(self, src, relative):
+        """Stage file `src` to be moved to `relative` in the directory
+
+        Files are renamed when on the same volume and copied otherwise,
+        the sources of copies are removed once committed.
+
+        Returns:
+            str or None: Hex digest of the contents, None without algorithm
+
+        """
+
+        temp = self._temp(relative)
+
+        with self._lock:
+            if relative in self._staged:
+                raise ValueError("Staged twice: %s" % relative)
+
+            # Staged before moving, such that partial copies are removed
+            self._staged[relative] = (src, temp, False)
+
+        try:
+            os.rename(src, temp)
+        except OSError as error:
+            # Different volume
+            if error.errno != errno.EXDEV:
+                raise
+            return copy(src, temp, self.algorithm, self.chunk_size)
+
+        with self._lock:
+            self._staged[relative] = (src, temp, True)
+
+        if not self.algorithm:
+            return None
+        return checksum(temp, self.algorithm, self.chunk_size)
+
+    def write(self, relative, value):
+        """Stage `value` as contents of `relative`, replacing staged files
+
+        The value is staged as a new file, such that a staged file it
+        replaces is moved back to its source unchanged on `rollback()`.
+
+        """
+
+        temp = self._temp(relative)
+
+        with self._lock:
+            staged = self._staged.get(relative)
+            self._staged[relative] = (None, temp, False)
+
+            if staged is not None and staged[0] is not None:
+                self._replaced[relative] = staged
+
+        if staged is not None and staged[0] is None:
+            # Written before, no longer needed
+            _remove(staged[1])
+
+        cache.write_atomic(temp, value)
+
+    def read(self, relative):
+        """Return contents of staged `relative`, None when not staged"""
+        with self._lock:
+            staged = self._staged.get(relative)
+
+        if staged is None:
+            return None
+
+        with open(staged[1], "rb") as f:
+            return f.read()
+
+    def commit(self):
+        """Rename all staged files into place"""
+        for relative, (_, temp, _) in self._staged.items():
+            cache.replace(temp, self._path(relative))
+            self._committed.add(relative)
+
+        for _, temp, _ in self._replaced.values():
+            _remove(temp)
+
+        for src, _, renamed in itertools.chain(self._staged.values(),
+                                               self._replaced.values()):
+            if src is not None and not renamed:
+                # Or removed along with the extraction directory
+                _remove(src)
+
+        self._reset()
+
+    def rollback(self):
+        """Undo all staged and committed files and created directories"""
+        for relative, (src, temp, renamed) in reversed(
+                list(self._staged.items())):
+            path = self._path(relative) if relative in self._committed \
+                else temp
+
+            try:
+                if renamed:
+                    os.rename(path, src)
+                elif os.path.exists(path):
+                    os.remove(path)
+            except OSError as error:
+                log.warning("Failed to roll back %s: %s" % (path, error))
+
+        for src, temp, renamed in self._replaced.values():
+            try:
+                if renamed:
+                    os.rename(temp, src)
+                elif os.path.exists(temp):
+                    os.remove(temp)
+            except OSError as error:
+                log.warning("Failed to roll back %s: %s" % (temp, error))
+
+        for directory in reversed(self._created):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                # Not empty, e.g. written to by others
+                pass
+
+        self._reset()
+
+    def _reset(self):
+        self._staged.clear()
+        self._replaced.clear()
+        self._committed.clear()
+        self._created[:] = []
+
+    def _path(self, relative):
+        return os.path.join(self.directory, *relative.split("/"))
+
+    def _temp(self, relative):
+        """Return temporary path of `relative`, creating its directory"""
+        path = self._path(relative)
+        directory, name = os.path.split(path)
+
+        with self._lock:
+            missing = list()
+            while not os.path.isdir(directory):
+                missing.append(directory)
+                directory = os.path.dirname(directory)
+
+            for directory in reversed(missing):
+                os.mkdir(directory)
+                self._created.append(directory)
+
+        return os.path.join(os.path.dirname(path),
+                            ".tmp%s-%s" % (uuid.uuid4().hex[:8], name))
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _copy_buffered(fsrc, fdst, digest, chunk_size):
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    while True:
+        size = fsrc.readinto(buffer)
+        if not size:
+            break
+
+        chunk = view[:size]
+        if digest is not None:
+            digest.update(chunk)
+
+        # Unbuffered writes may write part of the chunk
+        while chunk:
+            chunk = chunk[fdst.write(chunk):]
+
+
+def _copy_kernel(fsrc, fdst, chunk_size):
+    """Copy as much of `fsrc` to `fdst` by the kernel as supported
+
+    Returns:
+        int: The amount of bytes copied
+
+    """
+
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    count = max(chunk_size, 8 * CHUNK_SIZE)
+
+    if hasattr(os, "copy_file_range"):
+        def function(offset):
+            return os.copy_file_range(infd, outfd, count, offset, offset)
+    elif hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        # Other platforms only support sending to sockets
+        def function(offset):
+            return os.sendfile(outfd, infd, offset, count)
+    else:
+        return 0
+
+    offset = 0
+    while True:
+        try:
+            sent = function(offset)
+        except OSError:
+            # E.g. unsupported by the file system, continue buffered
+            return offset
+
+        if not sent:
+            return offset
+        offset += sent
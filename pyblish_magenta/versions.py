@@ -0,0 +1,161 @@
+"""Next version of a publish directory, resolved once per change
+
+Finding the next version used to list the publish directory and search
+each name for numbers, for every instance. On network shares holding
+thousands of versions that takes seconds each time.
+
+The highest version of each directory is kept in memory along with the
+modification time of the directory, which changes whenever a version is
+added or removed. The directory is only listed again once it changed.
+
+Versions are reserved by creating their directory, which fails when it
+exists, such that simultaneous publishers never get the same version.
+
+Example:
+    >> versions.next_version("/publish/ben/model")
+    4
+    >> versions.reserve("/publish/ben/model")
+    (4, '/publish/ben/model/v004')
+
+"""
+
+import os
+import re
+import time
+import errno
+import threading
+
+# The last number of a name, e.g. "6" of "v7_22_6"
+LAST_NUMBER = re.compile(r"(\d+)\D*$")
+
+# Directories modified less than this many seconds before being listed
+# may have changed within the same modification time, e.g. on network
+# shares storing whole seconds, and aren't cached.
+RACY = 2.0
+
+# Maximum attempts to reserve a version taken by others in the meantime
+RETRIES = 100
+
+_index = dict()
+_lock = threading.Lock()
+
+
+def parse(name):
+    """Return the version of `name`, being its last number, or None
+
+    Example:
+        >>> parse("v7_22_6")
+        6
+        >>> parse("latest") is None
+        True
+
+    """
+
+    match = LAST_NUMBER.search(name)
+    return int(match.group(1)) if match else None
+
+
+def highest(names):
+    """Return the highest version of `names`, 0 when there are none"""
+    search = LAST_NUMBER.search
+
+    highest_version = 0
+    for name in names:
+        match = search(name)
+        if match is not None:
+            version = int(match.group(1))
+            if version > highest_version:
+                highest_version = version
+
+    return highest_version
+
+
+def scan(directory):
+    """Return the highest version in `directory`, 0 when there are none"""
+
+    # Only names are needed, which `os.listdir()` returns faster than
+    # `os.scandir()` as it creates no object per entry.
+    try:
+        return highest(os.listdir(directory))
+    except OSError as error:
+        if error.errno == errno.ENOENT:
+            return 0
+        raise
+
+
+def next_version(directory):
+    """Return the version following the highest one in `directory`
+
+    The directory is only listed when it changed since the last call.
+
+    """
+
+    try:
+        mtime = os.stat(directory).st_mtime
+    except OSError as error:
+        if error.errno == errno.ENOENT:
+            return 1
+        raise
+
+    with _lock:
+        cached = _index.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1] + 1
+
+    listed = time.time()
+    version = scan(directory)
+    if listed - mtime >= RACY:
+        with _lock:
+            _index[directory] = (mtime, version)
+
+    return version + 1
+
+
+def reserve(directory, template="v%03d"):
+    """Create the directory of the next version in `directory`
+
+    The version directory is created exclusively, such that publishers
+    running simultaneously never reserve the same version. On finding
+    it taken the following version is tried.
+
+    Arguments:
+        directory (str): The publish directory, created when needed
+        template (str, optional): Name of the version directory
+            given the version, see `lib.format_version()`
+
+    Returns:
+        tuple: The version and the path to its directory
+
+    Raises:
+        RuntimeError: When no version could be reserved
+
+    """
+
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError as error:
+            # Created in the meantime, by another publisher
+            if error.errno != errno.EEXIST:
+                raise
+
+    version = next_version(directory)
+    for _ in range(RETRIES):
+        path = os.path.join(directory, template % version)
+        try:
+            os.mkdir(path)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+            version += 1
+            continue
+
+        return version, path
+
+    raise RuntimeError("Failed to reserve a version in %s" % directory)
+
+
+def clear():
+    """Forget the versions of all directories"""
+    with _lock:
+        _index.clear()
@@ -0,0 +1,89 @@
+"""Pool of headless worker processes
+
+Runs a script once per set of arguments in separate processes of the
+headless Maya interpreter (mayapy), a limited amount at a time, such that
+heavy work can be done outside of the artist's session and in parallel.
+
+The interpreter is taken from the PYBLISH_MAGENTA_MAYAPY environment
+variable when set, which may hold a full command line. This also allows
+substituting mayapy by any other executable, e.g. during tests.
+
+Example:
+    >> errors = run(["/path/to/script.py"], [["a"], ["b"]])
+    >> errors
+    [None, None]
+
+"""
+
+import os
+import sys
+import shlex
+import subprocess
+import multiprocessing
+import multiprocessing.pool
+
+# Environment variable overriding the command of the worker processes
+ENV = "PYBLISH_MAGENTA_MAYAPY"
+
+
+def mayapy():
+    """Return the command to start the headless Maya interpreter
+
+    Defaults to the mayapy accompanying the running Maya.
+
+    """
+
+    command = os.environ.get(ENV)
+    if command:
+        return shlex.split(command, posix=os.name != "nt")
+
+    executable = "mayapy.exe" if os.name == "nt" else "mayapy"
+    return [os.path.join(os.path.dirname(sys.executable), executable)]
+
+
+def run(arguments, command=None, processes=None):
+    """Run `command` once per entry in `arguments`
+
+    Arguments:
+        arguments (list): Arguments for each process, e.g. [["a"], ["b"]]
+        command (list, optional): Command to run, defaults to `mayapy()`
+        processes (int, optional): Maximum amount of simultaneous
+            processes, defaults to the amount of CPUs
+
+    Returns:
+        list: Per entry in `arguments` None on success, or the output
+            of the process when it failed.
+
+    """
+
+    arguments = list(arguments)
+    if not arguments:
+        return list()
+
+    command = list(command or mayapy())
+    processes = min(processes or multiprocessing.cpu_count(), len(arguments))
+
+    # The threads merely wait on the processes
+    pool = multiprocessing.pool.ThreadPool(processes)
+    try:
+        return pool.map(lambda args: _run(command + list(args)), arguments)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _run(command):
+    try:
+        popen = subprocess.Popen(command,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.STDOUT)
+    except OSError as error:
+        return "Could not start {0}: {1}".format(command[0], error)
+
+    output, _ = popen.communicate()
+
+    if popen.returncode != 0:
+        output = output.decode("utf-8", "replace").strip()
+        return output or "Exited with code {0}".format(popen.returncode)
+
+    return None
@@ -0,0 +1,302 @@
+"""Extraction directories, pooled and cleaned up in the background
+
+Extractors write to a temporary directory per instance, which used to be
+removed at the end of publishing. Removing gigabytes of caches and
+playblasts blocked the session until done. Instead the directories are
+handed out from a pool of directories created up front and removed by a
+background thread, retrying when files are still in use.
+
+All directories of a session are kept in a session directory on the
+scratch volume, named after the host and process of the session. Session
+directories of processes no longer running, e.g. of a crashed session,
+are removed when the next session starts.
+
+Example:
+    >> path = workspace.get().acquire()
+    >> # Extract to path
+    >> size = workspace.get().release(path)
+
+The scratch volume defaults to the temporary directory of the system
+and is set through the PYBLISH_MAGENTA_SCRATCH environment variable.
+
+"""
+
+import os
+import time
+import errno
+import socket
+import shutil
+import logging
+import tempfile
+import threading
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+log = logging.getLogger(__name__)
+
+# Environment variable overriding the root directory of all workspaces
+ENV = "PYBLISH_MAGENTA_SCRATCH"
+
+# Amount of empty directories kept ready to be handed out
+SPARE = 4
+
+# Session directories of other hosts untouched for this many seconds
+# are considered stale, as whether their process runs is unknown.
+MAX_AGE = 7 * 24 * 60 * 60
+
+# Attempts to remove a directory, waiting twice as long after each
+RETRIES = 5
+RETRY_DELAY = 0.5
+
+# Prefix of session directories
+PREFIX = "session-"
+
+_workspaces = dict()
+_lock = threading.Lock()
+
+
+def root():
+    """Return the directory holding the workspaces of all sessions"""
+    return os.environ.get(ENV) or os.path.join(tempfile.gettempdir(),
+                                               "pyblish_magenta")
+
+
+def get():
+    """Return the workspace of this session under `root()`"""
+    directory = root()
+    with _lock:
+        if directory not in _workspaces:
+            _workspaces[directory] = Workspace(directory)
+        return _workspaces[directory]
+
+
+def disk_usage(path):
+    """Return the size in bytes of all files under `path`"""
+    size = 0
+    for base, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.lstat(os.path.join(base, name)).st_size
+            except OSError:
+                # Removed in the meantime
+                pass
+    return size
+
+
+class Workspace(object):
+    """Pool of extraction directories of this session
+
+    The session directory is created on first use, at which point the
+    directories of stale sessions are removed in the background. It's
+    created anew when removed in the meantime, e.g. by a session on
+    another host taking this session for stale.
+
+    Arguments:
+        root (str): Directory holding the workspaces of all sessions
+        spare (int, optional): Amount of empty directories kept ready
+
+    """
+
+    def __init__(self, root, spare=SPARE):
+        self.root = root
+        self.spare = spare
+        self.directory = None
+
+        self._free = list()
+        self._lock = threading.Lock()
+        self._cleaner = Cleaner()
+
+    def acquire(self):
+        """Return an empty directory to extract to"""
+        with self._lock:
+            if self.directory is None or not os.path.isdir(self.directory):
+                self._start()
+
+            path = self._free.pop(0) if self._free else self._create()
+
+        self._cleaner.submit(self.fill)
+        return path
+
+    def release(self, path):
+        """Remove `path` in the background
+
+        Returns:
+            int: Size in bytes of the files in `path`
+
+        """
+
+        size = disk_usage(path)
+        self._cleaner.remove(path)
+        return size
+
+    def fill(self):
+        """Create empty directories up to the amount of spare directories"""
+        with self._lock:
+            while self.directory is not None and len(self._free) < self.spare:
+                self._free.append(self._create())
+
+    def collect(self):
+        """Remove the session directories of stale sessions
+
+        Returns:
+            list: The session directories being removed
+
+        """
+
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return list()
+
+        stale = list()
+        for name in names:
+            path = os.path.join(self.root, name)
+            if name.startswith(PREFIX) and path != self.directory and \
+                    _is_stale(path):
+                stale.append(path)
+                self._cleaner.remove(path)
+
+        return stale
+
+    def wait(self):
+        """Wait for all work of the background thread to finish"""
+        self._cleaner.join()
+
+    def _start(self):
+        if not os.path.isdir(self.root):
+            try:
+                os.makedirs(self.root)
+            except OSError as error:
+                # Created in the meantime, by another session
+                if error.errno != errno.EEXIST:
+                    raise
+
+        prefix = "%s%s-%i-" % (PREFIX, socket.gethostname(), os.getpid())
+        self.directory = tempfile.mkdtemp(prefix=prefix, dir=self.root)
+
+        # Any spare directories went along with a removed session directory
+        self._free[:] = []
+        self._cleaner.submit(self.collect)
+
+    def _create(self):
+        return tempfile.mkdtemp(dir=self.directory)
+
+
+class Cleaner(object):
+    """Remove directories on a background thread
+
+    Directories that can't be removed, e.g. as files in it are still in
+    use on Windows, are retried `retries` times, waiting twice as long
+    after each attempt. Directories that remain are removed as part of a
+    stale session by a later session.
+
+    Arguments:
+        retries (int, optional): Attempts to remove a directory
+        delay (float, optional): Seconds to wait after the first attempt
+
+    """
+
+    def __init__(self, retries=RETRIES, delay=RETRY_DELAY):
+        self.retries = retries
+        self.delay = delay
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, function, *args):
+        """Call `function` with `args` on the background thread"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run,
+                                                name="pyblish-magenta-cleanup")
+
+                # Left over directories are removed by the next session
+                self._thread.daemon = True
+                self._thread.start()
+
+        self._queue.put((function, args))
+
+    def remove(self, path):
+        """Remove `path` on the background thread"""
+        self.submit(self._remove, path)
+
+    def join(self):
+        """Wait for all submitted work to finish"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            function, args = self._queue.get()
+            try:
+                function(*args)
+            except Exception:
+                log.exception("Failed to clean up")
+            finally:
+                self._queue.task_done()
+
+    def _remove(self, path):
+        for attempt in range(self.retries):
+            try:
+                shutil.rmtree(path)
+                return True
+            except OSError as error:
+                if error.errno == errno.ENOENT and not os.path.exists(path):
+                    return True
+
+                if attempt < self.retries - 1:
+                    time.sleep(self.delay * 2 ** attempt)
+                else:
+                    log.warning("Failed to remove %s: %s" % (path, error))
+
+        return False
+
+
+def _is_stale(path):
+    """Return whether the session directory `path` is no longer in use"""
+    name = os.path.basename(path)[len(PREFIX):]
+    try:
+        host, pid, _ = name.rsplit("-", 2)
+        pid = int(pid)
+    except ValueError:
+        # Not a session directory
+        return False
+
+    if host == socket.gethostname():
+        return not _is_running(pid)
+
+    try:
+        return time.time() - os.path.getmtime(path) > MAX_AGE
+    except OSError:
+        return False
+
+
+def _is_running(pid):
+    """Return whether process `pid` of this host is running"""
+    if os.name == "nt":
+        # os.kill() would terminate the process on Windows
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+
+        code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        kernel32.CloseHandle(handle)
+
+        # STILL_ACTIVE
+        return code.value == 259
+
+    try:
+        os.kill(pid, 0)
+    except OSError as error:
+        # Running, but owned by another user
+        return error.errno == errno.EPERM
+
+    return True